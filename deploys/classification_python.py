@@ -1,19 +1,231 @@
+import argparse
+import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
 
-import joblib as jb
 import pandas as pd
 
 sys.path.append('..')
+import functions.fn_features as fn_features
+import functions.fn_models as fn_models
+import functions.fn_monitoring as fn_monitoring
 import params.consts as consts
 
 
 
-model_classification = jb.load(consts.MODEL_CLASSIFICATION_JOBLIB) 
+model_classification = None 
 
-df = pd.read_csv(consts.DATASET_DEPLOY_CLASSIFICATION, sep = ';') 
 
-predictions = model_classification.predict(df) 
 
-df['Response'] = predictions 
+def load_model() -> None: 
+    """
+    Função que carrega o modelo de classificação no processo atual (também usada como
+    inicializador dos processos do pool no modo stream).
+    """
 
-df.to_csv(consts.DATASET_DEPLOYED_CLASSIFICATION, index = False) 
\ No newline at end of file
+    global model_classification 
+
+    model_classification = fn_models.load_model('classification') 
+
+
+
+def score_chunk(df: pd.DataFrame) -> pd.DataFrame: 
+    """
+    Função que deriva as features e pontua um bloco do dataset de deploy.
+
+    Args:
+        df (pd.DataFrame): Bloco do dataset de deploy.
+
+    Returns:
+        pd.DataFrame: Bloco com a coluna `Response`.
+    """
+
+    df = fn_features.derive_pandas(df) 
+
+    df['Response'] = model_classification.predict(df) 
+
+    return df 
+
+
+
+def scored_chunks(chunks: Iterator[pd.DataFrame], workers: int = 1) -> Iterator[pd.DataFrame]: 
+    """
+    Função que pontua os blocos em ordem, opcionalmente em um pool de processos.
+
+    No pool, no máximo `2 * workers` blocos ficam em processamento ao mesmo tempo, de forma
+    que a memória continua limitada pelo tamanho do bloco.
+
+    Args:
+        chunks (Iterator[pd.DataFrame]): Blocos do dataset de deploy.
+        workers (int, opcional): Quantidade de processos. Se 1, pontua no processo atual. Padrão = 1.
+
+    Returns:
+        Iterator[pd.DataFrame]: Blocos pontuados, na mesma ordem da entrada.
+    """
+
+    if workers <= 1: 
+
+        load_model() 
+
+        yield from map(score_chunk, chunks) 
+
+        return 
+
+    with ProcessPoolExecutor(max_workers = workers, initializer = load_model) as executor: 
+
+        pending = deque() 
+
+        for chunk in chunks: 
+
+            pending.append(executor.submit(score_chunk, chunk)) 
+
+            if len(pending) >= 2 * workers: 
+
+                yield pending.popleft().result() 
+
+        while pending: 
+
+            yield pending.popleft().result() 
+
+
+
+def score_pandas(on_drift: str = 'flag') -> None:
+    """
+    Função que pontua o dataset de deploy inteiro em memória com o Pandas e grava um único CSV.
+    O lote é verificado contra o baseline antes da pontuação, como no modo spark.
+
+    Args:
+        on_drift (str, opcional): Política de drift antes da gravação ('flag', 'block' ou 'off'). Padrão = 'flag'.
+    """
+
+    load_model() 
+
+    df = pd.read_csv(consts.DATASET_DEPLOY_CLASSIFICATION, sep = ';') 
+
+    df = fn_features.derive_pandas(df) 
+
+    if on_drift != 'off': 
+
+        fn_monitoring.monitor(df, on_drift = on_drift) 
+
+    df['Response'] = model_classification.predict(df) 
+
+    df.to_csv(consts.DATASET_DEPLOYED_CLASSIFICATION, index = False) 
+
+
+
+def score_stream(chunksize: int = 100000, workers: int = 1, on_drift: str = 'flag') -> None: 
+    """
+    Função que pontua o dataset de deploy em blocos de tamanho fixo, acrescentando cada bloco
+    ao CSV de saída, de forma que a memória usada é limitada pelo tamanho do bloco e não do arquivo.
+
+    Cada bloco é verificado contra o baseline antes de ser gravado. Os blocos são gravados em um
+    arquivo temporário, que só substitui o CSV de saída ao final, de forma que um bloco bloqueado
+    por drift não publica as previsões dos blocos anteriores (o arquivo temporário é removido).
+    O relatório de drift, com os blocos verificados até o bloqueio, é gravado em qualquer caso.
+
+    Um último bloco com menos de `psi_min_rows` linhas é verificado junto com o bloco anterior,
+    para que a sobra do arquivo não seja classificada com poucas linhas.
+
+    Args:
+        chunksize (int, opcional): Quantidade de linhas por bloco. Padrão = 100000.
+        workers (int, opcional): Quantidade de processos usados para pontuar os blocos. Padrão = 1.
+        on_drift (str, opcional): Política de drift antes da gravação ('flag', 'block' ou 'off'). Padrão = 'flag'.
+    """
+
+    chunks = pd.read_csv(consts.DATASET_DEPLOY_CLASSIFICATION, sep = ';', chunksize = chunksize) 
+
+    baseline = fn_monitoring.load_baseline() if on_drift != 'off' else None 
+
+    temp, reports, previous = f'{consts.DATASET_DEPLOYED_CLASSIFICATION}.tmp', [], None 
+
+    try: 
+
+        for i, df in enumerate(scored_chunks(chunks, workers)): 
+
+            if baseline is not None: 
+
+                checked = pd.concat([previous, df]) if previous is not None and len(df) < consts.MONITORING_THRESHOLDS['psi_min_rows'] else df 
+
+                reports.append(fn_monitoring.drift_report(baseline, fn_monitoring.profile(checked, baseline)).assign(chunk = i)) 
+
+                fn_monitoring.check(reports[-1], on_drift) 
+
+            df.to_csv(temp, mode = 'w' if i == 0 else 'a', header = i == 0, index = False) 
+
+            previous = df 
+
+        os.replace(temp, consts.DATASET_DEPLOYED_CLASSIFICATION) 
+
+    finally: 
+
+        if reports: 
+
+            fn_monitoring.write_report(pd.concat(reports, ignore_index = True)) 
+
+        if os.path.exists(temp): 
+
+            os.remove(temp) 
+
+
+
+def score_spark(proba: bool = False, batch_size: int = 10000, on_drift: str = 'flag') -> None:
+    """
+    Função que pontua o dataset de deploy de forma distribuída com o PySpark (`mapInPandas`)
+    e grava as previsões em Parquet particionado.
+
+    Args:
+        proba (bool, opcional): Se True, grava também a probabilidade da classe positiva. Padrão = False.
+        batch_size (int, opcional): Quantidade máxima de linhas por lote do Arrow. Padrão = 10000.
+        on_drift (str, opcional): Política de drift antes da gravação ('flag', 'block' ou 'off'). Padrão = 'flag'.
+    """
+
+    import functions.fn_monitoring_pyspark as fn_monitoring_pyspark 
+    import functions.fn_scoring_pyspark as fn_scoring_pyspark 
+    import functions.fn_session_pyspark as fn_session_pyspark 
+    import functions.fn_storage_pyspark as fn_storage_pyspark 
+
+    spark = fn_session_pyspark.get_spark('single-node-batch', inputs = [consts.DATASET_DEPLOY_CLASSIFICATION]) 
+
+    model = fn_models.load_model('classification') 
+
+    df = fn_storage_pyspark.read_csv(consts.DATASET_DEPLOY_CLASSIFICATION, sep = ';', spark = spark) 
+
+    df = fn_features.derive_spark(df) 
+
+    if on_drift != 'off': 
+
+        fn_monitoring_pyspark.monitor(df, on_drift = on_drift) 
+
+    df_deployed = fn_scoring_pyspark.predict(df, model, proba = proba, batch_size = batch_size) 
+
+    fn_scoring_pyspark.write_predictions(df_deployed) 
+
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Previsão da resposta da 6ª campanha em lote.') 
+
+    parser.add_argument('--mode', choices = ['pandas', 'stream', 'spark'], default = 'pandas', help = 'Engine usada para pontuar o dataset.') 
+    parser.add_argument('--chunksize', type = int, default = 100000, help = 'Linhas por bloco (modo stream).') 
+    parser.add_argument('--workers', type = int, default = 1, help = 'Processos usados para pontuar os blocos (modo stream).') 
+    parser.add_argument('--proba', action = 'store_true', help = 'Grava também a probabilidade da classe positiva (modo spark).') 
+    parser.add_argument('--batch-size', type = int, default = 10000, help = 'Linhas por lote do Arrow (modo spark).') 
+    parser.add_argument('--on-drift', choices = ['flag', 'block', 'off'], default = 'flag', help = 'Política quando o lote difere do baseline de treino.') 
+
+    args = parser.parse_args() 
+
+    if args.mode == 'spark': 
+
+        score_spark(args.proba, args.batch_size, args.on_drift) 
+
+    elif args.mode == 'stream': 
+
+        score_stream(args.chunksize, args.workers, args.on_drift) 
+
+    else: 
+
+        score_pandas(args.on_drift) 
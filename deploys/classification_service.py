@@ -0,0 +1,383 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.append('..')
+import functions.fn_features as fn_features
+import functions.fn_models as fn_models
+
+
+
+class MicroBatcher:
+    """
+    Classe que agrupa as requisições concorrentes em lotes e os pontua com uma única
+    chamada vetorizada ao `predict_proba` do pipeline.
+
+    Um lote é fechado quando atinge `max_batch_size` linhas ou quando `max_wait_ms`
+    milissegundos se passam desde a chegada da primeira requisição do lote.
+
+    Args:
+        model (Any): Pipeline de classificação com o método `predict_proba`.
+        max_batch_size (int, opcional): Quantidade máxima de linhas por lote. Padrão = 256.
+        max_wait_ms (float, opcional): Tempo máximo de espera para completar um lote. Padrão = 2.
+        window (int, opcional): Quantidade de latências mantidas para as métricas. Padrão = 10000.
+    """
+
+    def __init__(self, model: Any, max_batch_size: int = 256, max_wait_ms: float = 2, window: int = 10000): 
+
+        self.model = model 
+
+        self.max_batch_size = max_batch_size 
+
+        self.max_wait = max_wait_ms / 1000 
+
+        self.queue = asyncio.Queue() 
+
+        self.latencies = deque(maxlen = window) 
+
+        self.batch_sizes = deque(maxlen = window) 
+
+        self.requests = 0 
+
+    async def predict(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]: 
+        """
+        Função que enfileira os registros de uma requisição e aguarda as suas previsões.
+
+        Args:
+            records (List[Dict[str, Any]]): Registros com as features de entrada.
+
+        Returns:
+            List[Dict[str, Any]]: Lista com a `Response` e a `Probability` de cada registro.
+        """
+
+        start = time.perf_counter() 
+
+        future = asyncio.get_running_loop().create_future() 
+
+        await self.queue.put((records, future)) 
+
+        result = await future 
+
+        self.latencies.append(time.perf_counter() - start) 
+
+        self.requests += 1 
+
+        return result 
+
+    async def run(self) -> None: 
+        """
+        Função que consome a fila continuamente, montando e pontuando os lotes.
+        """
+
+        loop = asyncio.get_running_loop() 
+
+        while True: 
+
+            batch = [await self.queue.get()] 
+
+            size = len(batch[0][0]) 
+
+            deadline = loop.time() + self.max_wait 
+
+            while size < self.max_batch_size: 
+
+                timeout = deadline - loop.time() 
+
+                if timeout <= 0: 
+
+                    break 
+
+                try: 
+
+                    item = await asyncio.wait_for(self.queue.get(), timeout) 
+
+                except asyncio.TimeoutError: 
+
+                    break 
+
+                batch.append(item) 
+
+                size += len(item[0]) 
+
+            self.batch_sizes.append(size) 
+
+            results = await loop.run_in_executor(None, self._score_batch, [records for records, _ in batch]) 
+
+            for (_, future), result in zip(batch, results): 
+
+                if future.done(): 
+
+                    continue 
+
+                if isinstance(result, Exception): 
+
+                    future.set_exception(result) 
+
+                else: 
+
+                    future.set_result(result) 
+
+    def _score(self, requests: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]: 
+        """
+        Função que pontua todos os registros de um lote em um único DataFrame e
+        separa novamente as previsões por requisição.
+
+        Args:
+            requests (List[List[Dict[str, Any]]]): Registros de cada requisição do lote.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Previsões de cada requisição, na mesma ordem.
+        """
+
+        df = fn_features.derive_pandas(pd.DataFrame([r for records in requests for r in records])) 
+
+        probabilities = self.model.predict_proba(df) 
+
+        responses = self.model.classes_[probabilities.argmax(axis = 1)] 
+
+        predictions = [{'Response': int(r), 'Probability': float(p)} for r, p in zip(responses, probabilities[:, 1])] 
+
+        results, i = [], 0 
+
+        for records in requests: 
+
+            results.append(predictions[i:i + len(records)]) 
+
+            i += len(records) 
+
+        return results 
+
+    def _score_batch(self, requests: List[List[Dict[str, Any]]]) -> List[Any]: 
+        """
+        Função que pontua o lote inteiro e, caso ele falhe (ex.: um registro inválido),
+        pontua cada requisição separadamente, para que o erro atinja apenas a requisição de origem.
+
+        Args:
+            requests (List[List[Dict[str, Any]]]): Registros de cada requisição do lote.
+
+        Returns:
+            List[Any]: Previsões (ou a exceção) de cada requisição, na mesma ordem.
+        """
+
+        try: 
+
+            return self._score(requests) 
+
+        except Exception: 
+
+            results = [] 
+
+            for records in requests: 
+
+                try: 
+
+                    results.append(self._score([records])[0]) 
+
+                except Exception as error: 
+
+                    results.append(error) 
+
+            return results 
+
+    def metrics(self) -> Dict[str, Any]: 
+        """
+        Função que retorna as métricas de latência (p50/p99, em milissegundos) e de tamanho
+        dos lotes, calculadas sobre a janela mais recente.
+
+        Returns:
+            Dict[str, Any]: Dicionário com as métricas do serviço.
+        """
+
+        latencies = np.array(self.latencies) * 1000 
+
+        return { 
+            'requests': self.requests, 
+            'latency_p50_ms': float(np.percentile(latencies, 50)) if latencies.size else None, 
+            'latency_p99_ms': float(np.percentile(latencies, 99)) if latencies.size else None, 
+            'batch_size_mean': float(np.mean(self.batch_sizes)) if self.batch_sizes else None, 
+            'max_batch_size': self.max_batch_size, 
+            'max_wait_ms': self.max_wait * 1000, 
+        }
+
+
+
+async def read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str], bytes]:
+    """
+    Função que lê uma requisição HTTP/1.1 (linha inicial, cabeçalhos e corpo).
+
+    Args:
+        reader (asyncio.StreamReader): Stream da conexão.
+
+    Returns:
+        tuple: Uma tupla contendo o método, o caminho, os cabeçalhos e o corpo da requisição.
+    """
+
+    method, path, _ = (await reader.readuntil(b'\r\n')).decode('latin-1').split(' ', 2) 
+
+    headers = {} 
+
+    while True: 
+
+        line = (await reader.readuntil(b'\r\n')).decode('latin-1').strip() 
+
+        if not line: 
+
+            break 
+
+        key, value = line.split(':', 1) 
+
+        headers[key.strip().lower()] = value.strip() 
+
+    body = await reader.readexactly(int(headers.get('content-length', 0))) 
+
+    return method, path, headers, body 
+
+
+
+def build_response(status: int, payload: Any, keep_alive: bool) -> bytes:
+    """
+    Função que monta uma resposta HTTP/1.1 com corpo JSON.
+
+    Args:
+        status (int): Código de status HTTP.
+        payload (Any): Conteúdo serializável em JSON.
+        keep_alive (bool): Se True, mantém a conexão aberta.
+
+    Returns:
+        bytes: Resposta HTTP.
+    """
+
+    reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'} 
+
+    body = json.dumps(payload).encode() 
+
+    head = ( 
+        f'HTTP/1.1 {status} {reasons[status]}\r\n' 
+        f'Content-Type: application/json\r\n' 
+        f'Content-Length: {len(body)}\r\n' 
+        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n' 
+    )
+
+    return head.encode() + body 
+
+
+
+async def handle(batcher: MicroBatcher, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Função que atende uma conexão HTTP, com suporte a keep-alive.
+
+    Rotas:
+        POST /predict: recebe um registro (objeto JSON) ou uma lista de registros e retorna as previsões.
+        GET /metrics: retorna as métricas de latência e de lotes.
+        GET /health: retorna o status do serviço.
+
+    Args:
+        batcher (MicroBatcher): Agrupador de requisições.
+        reader (asyncio.StreamReader): Stream de leitura da conexão.
+        writer (asyncio.StreamWriter): Stream de escrita da conexão.
+    """
+
+    try: 
+
+        while True: 
+
+            try: 
+
+                method, path, headers, body = await read_request(reader) 
+
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError): 
+
+                break 
+
+            keep_alive = headers.get('connection', 'keep-alive').lower() != 'close' 
+
+            if method == 'POST' and path == '/predict': 
+
+                try: 
+
+                    payload = json.loads(body) 
+
+                    records = payload if isinstance(payload, list) else [payload] 
+
+                    predictions = await batcher.predict(records) 
+
+                    status, result = 200, predictions if isinstance(payload, list) else predictions[0] 
+
+                except (ValueError, KeyError) as error: 
+
+                    status, result = 400, {'error': str(error)} 
+
+                except Exception as error: 
+
+                    status, result = 500, {'error': str(error)} 
+
+            elif method == 'GET' and path == '/metrics': 
+
+                status, result = 200, batcher.metrics() 
+
+            elif method == 'GET' and path == '/health': 
+
+                status, result = 200, {'status': 'ok'} 
+
+            else: 
+
+                status, result = 404, {'error': f'Rota não encontrada: {method} {path}'} 
+
+            writer.write(build_response(status, result, keep_alive)) 
+
+            await writer.drain() 
+
+            if not keep_alive: 
+
+                break 
+
+    finally: 
+
+        writer.close() 
+
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8000, max_batch_size: int = 256, max_wait_ms: float = 2) -> None:
+    """
+    Função que inicia o serviço HTTP de previsão com micro-batching.
+
+    Args:
+        host (str, opcional): Endereço do servidor. Padrão = '127.0.0.1'.
+        port (int, opcional): Porta do servidor. Padrão = 8000.
+        max_batch_size (int, opcional): Quantidade máxima de linhas por lote. Padrão = 256.
+        max_wait_ms (float, opcional): Tempo máximo de espera para completar um lote. Padrão = 2.
+    """
+
+    batcher = MicroBatcher(fn_models.load_model('classification'), max_batch_size, max_wait_ms) 
+
+    worker = asyncio.create_task(batcher.run()) 
+
+    server = await asyncio.start_server(lambda r, w: handle(batcher, r, w), host, port) 
+
+    async with server: 
+
+        await server.serve_forever() 
+
+    worker.cancel() 
+
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Serviço HTTP de previsão da resposta da 6ª campanha.') 
+
+    parser.add_argument('--host', default = '127.0.0.1', help = 'Endereço do servidor.') 
+    parser.add_argument('--port', type = int, default = 8000, help = 'Porta do servidor.') 
+    parser.add_argument('--max-batch-size', type = int, default = 256, help = 'Quantidade máxima de linhas por lote.') 
+    parser.add_argument('--max-wait-ms', type = float, default = 2, help = 'Tempo máximo de espera para completar um lote (ms).') 
+
+    args = parser.parse_args() 
+
+    asyncio.run(serve(args.host, args.port, args.max_batch_size, args.max_wait_ms)) 
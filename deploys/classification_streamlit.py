@@ -1,15 +1,38 @@
 import sys
+from typing import Any, Tuple
 
 import joblib as jb
-import pandas as pd
 import streamlit as st
 
 sys.path.append('..')
-import params.consts as consts
+import functions.fn_compiled_model as fn_compiled_model
+import functions.fn_features as fn_features
+import functions.fn_models as fn_models
 
 
 
-model_classification = jb.load(consts.MODEL_CLASSIFICATION_JOBLIB) 
+@st.cache_resource(max_entries = 1)
+def load_model(path: str, version: Tuple[int, int]) -> Any:
+    """
+    Função que carrega e compila o modelo uma única vez e o compartilha entre as sessões do Streamlit.
+    Como a versão do arquivo faz parte da chave do cache e só uma entrada é mantida, o modelo
+    antigo é descartado quando o artefato muda.
+
+    Args:
+        path (str): Caminho do artefato.
+        version (Tuple[int, int]): Versão do artefato (mtime_ns, tamanho).
+
+    Returns:
+        Any: Modelo compilado com `fn_compiled_model.compile_pipeline`.
+    """
+
+    return fn_compiled_model.compile_pipeline(jb.load(path)) 
+
+
+
+model_path = fn_models.artifact_path('classification') 
+
+model_classification = load_model(model_path, fn_models.artifact_version(model_path)) 
 
 st.title('Modelo de Previsão') 
 
@@ -31,12 +54,7 @@ MntGoldProds = st.number_input('Gasto com produtos gold:')
 AcceptedCmpTotal = st.select_slider('Quantidade de campanhas aceitas:', options = list(range(0, 6)))
 Cluster = st.radio('Cluster:', [0, 1, 2], index = None)
 
-HasChildren = 1 if Children > 0 else 0
-AgeGroup = AgeGroup = '18-30' if 18 <= Age <= 30 else '31-45' if 31 <= Age <= 45 else '46-60' if 46 <= Age <= 60 else '61+'
 Complain = 1 if Complain == 'Sim' else 0
-Years_Since_Enrolled = int(Days_Since_Enrolled // 365)
-MntTotal = MntRegularProds + MntGoldProds
-HasAcceptedCmp = 1 if AcceptedCmpTotal > 0 else 0
 
 button = st.button('FAZER PREVISÃO', type = 'primary', use_container_width = True) 
 
@@ -44,30 +62,27 @@ if button:
 
     try: 
         
-        data = pd.DataFrame({ 
-            'Education': [Education], 
-            'Marital_Status': [Marital_Status], 
-            'Children': [Children], 
-            'HasChildren': [HasChildren], 
-            'Age': [Age], 
-            'AgeGroup': [AgeGroup], 
-            'Income': [Income], 
-            'Recency': [Recency], 
-            'Complain': [Complain], 
-            'Days_Since_Enrolled': [Days_Since_Enrolled], 
-            'Years_Since_Enrolled': [Years_Since_Enrolled],
-            'NumDealsPurchases': [NumDealsPurchases], 
-            'NumWebVisitsMonth': [NumWebVisitsMonth], 
-            'NumTotalPurchases': [NumTotalPurchases], 
-            'MntRegularProds': [MntRegularProds], 
-            'MntGoldProds': [MntGoldProds], 
-            'MntTotal': [MntTotal], 
-            'AcceptedCmpTotal': [AcceptedCmpTotal], 
-            'HasAcceptedCmp': [HasAcceptedCmp], 
-            'Cluster': [Cluster]
-        })
-
-        prediction = model_classification.predict(data) 
+        data = { 
+            'Education': Education, 
+            'Marital_Status': Marital_Status, 
+            'Children': Children, 
+            'Age': Age, 
+            'Income': Income, 
+            'Recency': Recency, 
+            'Complain': Complain, 
+            'Days_Since_Enrolled': Days_Since_Enrolled, 
+            'NumDealsPurchases': NumDealsPurchases, 
+            'NumWebVisitsMonth': NumWebVisitsMonth, 
+            'NumTotalPurchases': NumTotalPurchases, 
+            'MntRegularProds': MntRegularProds, 
+            'MntGoldProds': MntGoldProds, 
+            'AcceptedCmpTotal': AcceptedCmpTotal, 
+            'Cluster': Cluster
+        }
+
+        data = fn_features.derive_record(data) 
+
+        prediction = fn_compiled_model.predict(model_classification, data) 
         
         if prediction == 1: 
 
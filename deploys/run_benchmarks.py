@@ -0,0 +1,49 @@
+import argparse
+import sys
+
+sys.path.append('..')
+import functions.fn_benchmark as fn_benchmark
+import params.consts as consts
+from functions.fn_state import load_state, save_state
+
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Executa o benchmark (estatísticas, features, treino e pontuação) e compara com o baseline.') 
+
+    parser.add_argument('--scale', choices = list(consts.BENCHMARK_SCALES), default = '10k', help = 'Quantidade de linhas dos dados sintéticos.') 
+    parser.add_argument('--cases', nargs = '*', choices = list(fn_benchmark.CASES), help = 'Casos executados. Se vazio, todos.') 
+    parser.add_argument('--spark', nargs = '?', const = 'local-dev', choices = list(consts.SPARK_PROFILES), help = 'Executa também os casos do Spark, com o perfil informado.') 
+    parser.add_argument('--tolerance', type = float, default = consts.BENCHMARK_TOLERANCE, help = 'Aumento relativo tolerado de tempo e memória em relação ao baseline.') 
+    parser.add_argument('--save-baseline', action = 'store_true', help = 'Grava o resultado como baseline da escala.') 
+
+    args = parser.parse_args() 
+
+    spark = None 
+
+    if args.spark: 
+
+        import functions.fn_session_pyspark as fn_session_pyspark 
+
+        spark = fn_session_pyspark.get_spark(args.spark) 
+
+    report = fn_benchmark.run(args.scale, args.cases or None, spark) 
+
+    fn_benchmark.save_report(report) 
+
+    baseline = load_state(consts.BENCHMARK_BASELINE) 
+
+    comparison = fn_benchmark.compare(report, baseline, args.tolerance) 
+
+    print(comparison.to_string(index = False)) 
+
+    if args.save_baseline: 
+
+        baseline[args.scale] = report 
+
+        save_state(baseline, consts.BENCHMARK_BASELINE) 
+
+    elif (comparison['status'] == 'regression').any(): 
+
+        sys.exit(1) 
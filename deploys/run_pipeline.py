@@ -0,0 +1,20 @@
+import argparse
+import sys
+
+sys.path.append('..')
+import functions.fn_pipeline as fn_pipeline
+
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Executa as etapas do pipeline (sourcing → deployment), pulando as etapas atualizadas.') 
+
+    parser.add_argument('stages', nargs = '*', help = 'Etapas alvo (as dependências são incluídas). Se vazio, todas.') 
+    parser.add_argument('--force', action = 'store_true', help = 'Executa as etapas mesmo se atualizadas.') 
+    parser.add_argument('--workers', type = int, default = 2, help = 'Quantidade de etapas independentes executadas ao mesmo tempo.') 
+    parser.add_argument('--dry-run', action = 'store_true', help = 'Apenas lista as etapas que seriam executadas.') 
+
+    args = parser.parse_args() 
+
+    fn_pipeline.run(args.stages or None, args.force, args.workers, args.dry_run) 
@@ -0,0 +1,668 @@
+import importlib.util
+import json
+import os
+import resource
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+import functions.fn_features as fn_features
+import functions.fn_model_selection as fn_model_selection
+import functions.fn_stats_pandas as fn_stats_pandas
+import params.consts as consts
+from functions.fn_state import load_state, save_state
+
+
+
+NUMERIC_COLUMNS = ['Income', 'Recency', 'MntWines', 'MntFruits', 'MntMeatProducts', 'MntFishProducts', 'MntSweetProducts', 'MntGoldProds', 'NumDealsPurchases', 'NumWebPurchases', 'NumCatalogPurchases', 'NumStorePurchases', 'NumWebVisitsMonth']
+
+CATEGORICAL_COLUMNS = ['Education', 'Marital_Status', 'Kidhome', 'Teenhome', 'Complain']
+
+
+
+def generate_customers(rows: int, chunk_rows: int = 1000000, seed: int = consts.RANDOM_STATE, source: str = consts.DIM_CUSTOMERS_RAW) -> Iterator[pd.DataFrame]:
+    """
+    Função que gera clientes sintéticos em blocos, reamostrando as linhas de `dim_customers_raw.csv`
+    (o que preserva as distribuições conjuntas, como a relação entre renda e gastos) com ruído:
+    renda e gastos são multiplicados por um fator log-normal, a recência é sorteada na faixa original
+    e os IDs são únicos. As datas de cadastro são as do arquivo original, de forma que o merge com o
+    calendário continua válido.
+
+    Args:
+        rows (int): Quantidade total de linhas.
+        chunk_rows (int, opcional): Quantidade de linhas por bloco. Padrão = 1000000.
+        seed (int, opcional): Semente do gerador. Padrão = consts.RANDOM_STATE.
+        source (str, opcional): CSV de clientes usado como referência. Padrão = consts.DIM_CUSTOMERS_RAW.
+
+    Returns:
+        Iterator[pd.DataFrame]: Blocos de clientes, com as mesmas colunas do CSV de referência.
+    """
+
+    reference = pd.read_csv(source) 
+
+    rng = np.random.default_rng(seed) 
+
+    amounts = [c for c in reference.columns if c.startswith('Mnt')] 
+
+    for start in range(0, rows, chunk_rows): 
+
+        size = min(chunk_rows, rows - start) 
+
+        chunk = reference.iloc[rng.integers(0, len(reference), size)].reset_index(drop = True) 
+
+        chunk['ID'] = np.arange(start, start + size) + 1 
+
+        chunk['Income'] = (chunk['Income'] * rng.lognormal(0, 0.1, size)).round() 
+
+        chunk[amounts] = (chunk[amounts] * rng.lognormal(0, 0.1, (size, len(amounts)))).round().astype('int64') 
+
+        chunk['Recency'] = rng.integers(reference['Recency'].min(), reference['Recency'].max() + 1, size) 
+
+        yield chunk 
+
+
+
+def write_customers(rows: int, directory: str = consts.BENCHMARK_DATA, chunk_rows: int = 1000000, seed: int = consts.RANDOM_STATE) -> str:
+    """
+    Função que grava os clientes sintéticos em CSV, bloco a bloco (a memória é limitada pelo tamanho
+    do bloco). Um arquivo já gerado com a mesma quantidade de linhas e semente é reaproveitado.
+
+    Args:
+        rows (int): Quantidade total de linhas.
+        directory (str, opcional): Diretório dos dados sintéticos. Padrão = consts.BENCHMARK_DATA.
+        chunk_rows (int, opcional): Quantidade de linhas por bloco. Padrão = 1000000.
+        seed (int, opcional): Semente do gerador. Padrão = consts.RANDOM_STATE.
+
+    Returns:
+        str: Caminho do CSV.
+    """
+
+    path = os.path.join(directory, f'dim_customers_{rows}_{seed}.csv') 
+
+    if os.path.exists(path): 
+
+        return path 
+
+    os.makedirs(directory, exist_ok = True) 
+
+    temp = f'{path}.tmp' 
+
+    for i, chunk in enumerate(generate_customers(rows, chunk_rows, seed)): 
+
+        chunk.to_csv(temp, mode = 'w' if i == 0 else 'a', header = i == 0, index = False) 
+
+    os.replace(temp, path) 
+
+    return path 
+
+
+
+def _rss_bytes() -> int:
+    """
+    Função que retorna a memória residente do processo atual somada à dos processos filhos diretos
+    (ex.: a JVM do Spark), lida do `/proc`. Sem o `/proc/<pid>/task/<tid>/children` (kernels sem
+    `CONFIG_PROC_CHILDREN`), considera apenas o processo atual. Fora do Linux, retorna o pico do processo atual.
+
+    Returns:
+        int: Memória residente, em bytes.
+    """
+
+    if not os.path.exists('/proc/self/statm'): 
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 
+
+    pids = [str(os.getpid())] 
+
+    try: 
+
+        for task in os.listdir('/proc/self/task'): 
+
+            with open(f'/proc/self/task/{task}/children') as file: 
+
+                pids += file.read().split() 
+
+    except OSError: 
+
+        pass 
+
+    total = 0 
+
+    for pid in pids: 
+
+        try: 
+
+            with open(f'/proc/{pid}/statm') as file: 
+
+                total += int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') 
+
+        except (FileNotFoundError, ProcessLookupError): 
+
+            pass 
+
+    return total 
+
+
+
+def stage_metrics(spark: Any, group: str) -> Dict[str, int]:
+    """
+    Função que soma as métricas das etapas (stages) dos jobs do Spark de um grupo, lidas da API REST
+    da interface do Spark. Sem a interface, retorna apenas a quantidade de jobs e etapas.
+
+    Args:
+        spark (SparkSession): Sessão do Spark.
+        group (str): Grupo dos jobs (`spark.jobGroup.id`).
+
+    Returns:
+        Dict[str, int]: Quantidade de jobs, etapas e tarefas, tempo de execução nos executores,
+            bytes lidos, bytes do shuffle, bytes despejados em memória e disco e pico de memória de execução.
+    """
+
+    sc = spark.sparkContext 
+
+    tracker = sc.statusTracker() 
+
+    jobs = [tracker.getJobInfo(j) for j in tracker.getJobIdsForGroup(group)] 
+
+    stages = sorted({s for job in jobs if job is not None for s in job.stageIds}) 
+
+    metrics = {'jobs': len(jobs), 'stages': len(stages), 'tasks': 0, 'executor_run_time_ms': 0, 'input_bytes': 0, 'shuffle_read_bytes': 0, 'shuffle_write_bytes': 0, 'memory_spilled_bytes': 0, 'disk_spilled_bytes': 0, 'peak_execution_memory_bytes': 0} 
+
+    if not sc.uiWebUrl: 
+
+        return metrics 
+
+    fields = {'tasks': 'numCompleteTasks', 'executor_run_time_ms': 'executorRunTime', 'input_bytes': 'inputBytes', 'shuffle_read_bytes': 'shuffleReadBytes', 'shuffle_write_bytes': 'shuffleWriteBytes', 'memory_spilled_bytes': 'memoryBytesSpilled', 'disk_spilled_bytes': 'diskBytesSpilled'} 
+
+    for stage in stages: 
+
+        try: 
+
+            with urllib.request.urlopen(f'{sc.uiWebUrl}/api/v1/applications/{sc.applicationId}/stages/{stage}') as response: 
+
+                attempts = json.load(response) 
+
+        except OSError: 
+
+            continue 
+
+        for attempt in attempts: 
+
+            for name, field in fields.items(): 
+
+                metrics[name] += attempt.get(field, 0) 
+
+            metrics['peak_execution_memory_bytes'] = max(metrics['peak_execution_memory_bytes'], attempt.get('peakExecutionMemory', 0)) 
+
+    return metrics 
+
+
+
+def measure(name: str, function: Callable[[], int], spark: Any = None, interval: float = 0.05) -> Dict[str, Any]:
+    """
+    Função que executa um caso do benchmark e mede o tempo, o throughput, o pico de memória
+    residente (amostrado em uma thread a cada `interval` segundos) e, com o Spark, as métricas das etapas.
+
+    Args:
+        name (str): Nome do caso (também usado como grupo dos jobs do Spark).
+        function (Callable[[], int]): Função do caso, que retorna a quantidade de linhas processadas.
+        spark (SparkSession, opcional): Sessão do Spark dos casos distribuídos. Padrão = None.
+        interval (float, opcional): Intervalo de amostragem da memória, em segundos. Padrão = 0.05.
+
+    Returns:
+        Dict[str, Any]: Linhas, segundos, linhas por segundo, pico de memória em MB e métricas do Spark.
+    """
+
+    peak, baseline, done = [0], _rss_bytes(), threading.Event() 
+
+    def sample() -> None: 
+
+        while not done.is_set(): 
+
+            peak[0] = max(peak[0], _rss_bytes()) 
+
+            done.wait(interval) 
+
+    sampler = threading.Thread(target = sample, daemon = True) 
+
+    sampler.start() 
+
+    if spark is not None: 
+
+        spark.sparkContext.setLocalProperty('spark.jobGroup.id', name) 
+
+    start = time.perf_counter() 
+
+    try: 
+
+        rows = function() 
+
+    finally: 
+
+        seconds = time.perf_counter() - start 
+
+        done.set() 
+
+        sampler.join() 
+
+        if spark is not None: 
+
+            spark.sparkContext.setLocalProperty('spark.jobGroup.id', None) 
+
+    result = {'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds else np.nan, 'peak_rss_mb': max(peak[0], baseline) / 1024 ** 2, 'delta_rss_mb': max(peak[0] - baseline, 0) / 1024 ** 2} 
+
+    if spark is not None: 
+
+        result['spark'] = stage_metrics(spark, name) 
+
+    return result 
+
+
+
+def _deploy_module() -> Any:
+    """
+    Função que carrega o script de deploy em lote (`deploys/classification_python.py`) como módulo,
+    para que o benchmark use o mesmo `score_chunk` do deploy.
+
+    Returns:
+        Any: Módulo do script de deploy.
+    """
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'deploys', 'classification_python.py') 
+
+    spec = importlib.util.spec_from_file_location('classification_python', path) 
+
+    module = importlib.util.module_from_spec(spec) 
+
+    spec.loader.exec_module(module) 
+
+    return module 
+
+
+
+def _pipeline() -> Pipeline:
+    """
+    Função que monta o pipeline de classificação usado nos casos de treino e pontuação.
+
+    Os casos de pontuação usam este pipeline, treinado na amostra sintética, no lugar do modelo
+    registrado (`fn_models.load_model('classification')`): o modelo registrado espera as colunas
+    do dataset de deploy (`Age`, `Days_Since_Enrolled`, `Cluster`), que vêm do merge com o
+    calendário e do modelo de clusterização e não existem nos clientes sintéticos. Os tempos medem
+    o caminho de pontuação (derivação das features, blocos, `mapInPandas`), não o custo do modelo final.
+
+    Returns:
+        Pipeline: Pipeline com pré-processamento (imputação pela mediana, padronização e one-hot) e regressão logística.
+    """
+
+    pre_processing = ColumnTransformer([ 
+
+        ('standard', Pipeline([('imputer', SimpleImputer(strategy = 'median')), ('scaler', StandardScaler())]), NUMERIC_COLUMNS), 
+
+        ('one_hot', OneHotEncoder(handle_unknown = 'ignore'), CATEGORICAL_COLUMNS), 
+
+    ])
+
+    return Pipeline([('pre_processing', pre_processing), ('models', LogisticRegression(max_iter = 1000))]) 
+
+
+
+def prepare(rows: int, spark: Any = None, max_pandas_rows: int = consts.BENCHMARK_MAX_PANDAS_ROWS, max_training_rows: int = consts.BENCHMARK_MAX_TRAINING_ROWS) -> Dict[str, Any]:
+    """
+    Função que prepara o contexto de uma escala do benchmark (fora da medição): gera os dados,
+    carrega o DataFrame do Pandas (até `max_pandas_rows` linhas), converte o CSV em Parquet para os
+    casos do Spark, separa a amostra de treino e treina o modelo usado nos casos de pontuação.
+
+    Args:
+        rows (int): Quantidade de linhas da escala.
+        spark (SparkSession, opcional): Sessão do Spark. Se None, os casos do Spark são pulados. Padrão = None.
+        max_pandas_rows (int, opcional): Maior escala dos casos em memória com o Pandas. Padrão = consts.BENCHMARK_MAX_PANDAS_ROWS.
+        max_training_rows (int, opcional): Tamanho máximo da amostra de treino. Padrão = consts.BENCHMARK_MAX_TRAINING_ROWS.
+
+    Returns:
+        Dict[str, Any]: Contexto com os caminhos, os DataFrames, a amostra de treino e o modelo.
+    """
+
+    context = {'rows': rows, 'csv': write_customers(rows), 'spark': spark, 'df_pd': None, 'df': None} 
+
+    if rows <= max_pandas_rows: 
+
+        context['df_pd'] = pd.read_csv(context['csv']) 
+
+    if spark is not None: 
+
+        import functions.fn_storage_pyspark as fn_storage_pyspark 
+
+        parquet = context['csv'].replace('.csv', '.parquet') 
+
+        if not os.path.exists(parquet): 
+
+            fn_storage_pyspark.read_csv(context['csv'], sep = ',', spark = spark, schema_of = consts.DIM_CUSTOMERS_RAW).write.parquet(parquet) 
+
+        context['df'] = spark.read.parquet(parquet) 
+
+    if context['df_pd'] is not None: 
+
+        sample = context['df_pd'].sample(min(rows, max_training_rows), random_state = consts.RANDOM_STATE) 
+
+    else: 
+
+        sample = next(generate_customers(min(rows, max_training_rows), seed = consts.RANDOM_STATE + 1)) 
+
+    context['sample'] = sample.dropna(subset = ['Income']) 
+
+    context['model'] = _pipeline().fit(context['sample'], context['sample']['Response']) 
+
+    return context 
+
+
+
+def _spark_kmeans(context: Dict[str, Any]) -> int:
+    """
+    Função do caso de K-Means distribuído, com o pipeline do `fn_ml_pyspark` do notebook 06.
+
+    Args:
+        context (Dict[str, Any]): Contexto do benchmark.
+
+    Returns:
+        int: Quantidade de linhas processadas.
+    """
+
+    import functions.fn_ml_pyspark as fn_ml_pyspark 
+
+    df = context['df'].dropna(subset = ['Income']) 
+
+    pipeline = fn_ml_pyspark.clustering_pipeline(['Education', 'Marital_Status'], ['Income', 'Recency'], [c for c in NUMERIC_COLUMNS if c.startswith('Mnt')], ['Kidhome', 'Teenhome']) 
+
+    pipeline.fit(df) 
+
+    return context['rows'] 
+
+
+
+def _spark_scoring(context: Dict[str, Any]) -> int:
+    """
+    Função do caso de pontuação distribuída, com o `mapInPandas` do deploy em Spark.
+
+    Args:
+        context (Dict[str, Any]): Contexto do benchmark.
+
+    Returns:
+        int: Quantidade de linhas processadas.
+    """
+
+    import functions.fn_scoring_pyspark as fn_scoring_pyspark 
+
+    df = fn_features.derive_spark(context['df']) 
+
+    fn_scoring_pyspark.predict(df, context['model']).write.format('noop').mode('overwrite').save() 
+
+    return context['rows'] 
+
+
+
+def _pandas_scoring(context: Dict[str, Any], chunksize: int = 100000) -> int:
+    """
+    Função do caso de pontuação em blocos, com o `score_chunk` do deploy em lote, lendo o CSV
+    bloco a bloco como o modo stream (não depende de `max_pandas_rows`).
+
+    Args:
+        context (Dict[str, Any]): Contexto do benchmark.
+        chunksize (int, opcional): Quantidade de linhas por bloco. Padrão = 100000.
+
+    Returns:
+        int: Quantidade de linhas processadas.
+    """
+
+    deploy = _deploy_module() 
+
+    deploy.model_classification = context['model'] 
+
+    return sum(len(deploy.score_chunk(chunk)) for chunk in pd.read_csv(context['csv'], chunksize = chunksize)) 
+
+
+
+def _pandas_stats(function: str) -> Callable[[Dict[str, Any]], int]:
+    """
+    Função que monta os casos dos helpers do `fn_stats_pandas`.
+
+    Args:
+        function (str): Nome do helper ('describe', 'inspect_outliers_many' ou 'groupby_count_many').
+
+    Returns:
+        Callable[[Dict[str, Any]], int]: Função do caso.
+    """
+
+    def case(context: Dict[str, Any]) -> int: 
+
+        df = context['df_pd'] 
+
+        if function == 'describe': 
+
+            fn_stats_pandas.describe(df) 
+
+        elif function == 'inspect_outliers_many': 
+
+            fn_stats_pandas.inspect_outliers_many(df, NUMERIC_COLUMNS, flag = False) 
+
+        else: 
+
+            fn_stats_pandas.groupby_count_many(df, CATEGORICAL_COLUMNS) 
+
+        return context['rows'] 
+
+    return case 
+
+
+
+def _pyspark_stats(function: str) -> Callable[[Dict[str, Any]], int]:
+    """
+    Função que monta os casos dos helpers do `fn_stats_pyspark`, forçando a execução com `collect`.
+
+    Args:
+        function (str): Nome do helper ('summary', 'inspect_outliers_many' ou 'groupby_count_many').
+
+    Returns:
+        Callable[[Dict[str, Any]], int]: Função do caso.
+    """
+
+    def case(context: Dict[str, Any]) -> int: 
+
+        import functions.fn_stats_pyspark as fn_stats_pyspark 
+
+        df = context['df'] 
+
+        if function == 'summary': 
+
+            fn_stats_pyspark.summary(df).collect() 
+
+        elif function == 'inspect_outliers_many': 
+
+            fn_stats_pyspark.inspect_outliers_many(df, NUMERIC_COLUMNS, flag = False)[0].count() 
+
+        else: 
+
+            [t.collect() for t in fn_stats_pyspark.groupby_count_many(df, CATEGORICAL_COLUMNS).values()] 
+
+        return context['rows'] 
+
+    return case 
+
+
+
+def _grid_search(context: Dict[str, Any]) -> int:
+    """
+    Função do caso de busca de hiperparâmetros, com o `fn_model_selection.search` do notebook 08.
+
+    Args:
+        context (Dict[str, Any]): Contexto do benchmark.
+
+    Returns:
+        int: Quantidade de linhas da amostra de treino.
+    """
+
+    sample = context['sample'] 
+
+    param_grid = {'models__C': [0.01, 0.1, 1, 10], 'models__class_weight': [None, 'balanced']} 
+
+    fn_model_selection.search(_pipeline(), param_grid, sample, sample['Response'], mode = 'grid', cache_dir = None, report_path = None) 
+
+    return len(sample) 
+
+
+
+# Casos: nome → (engine, função). Os casos 'pandas' rodam até `max_pandas_rows`, os casos 'sample'
+# usam a amostra de treino, os casos 'spark' exigem a sessão e o caso 'stream' lê o CSV em blocos.
+CASES = {
+    'stats_pandas.describe': ('pandas', _pandas_stats('describe')), 
+    'stats_pandas.inspect_outliers_many': ('pandas', _pandas_stats('inspect_outliers_many')), 
+    'stats_pandas.groupby_count_many': ('pandas', _pandas_stats('groupby_count_many')), 
+    'stats_pyspark.summary': ('spark', _pyspark_stats('summary')), 
+    'stats_pyspark.inspect_outliers_many': ('spark', _pyspark_stats('inspect_outliers_many')), 
+    'stats_pyspark.groupby_count_many': ('spark', _pyspark_stats('groupby_count_many')), 
+    'features.derive_pandas': ('pandas', lambda c: len(fn_features.derive_pandas(c['df_pd']))), 
+    'features.derive_spark': ('spark', lambda c: fn_features.derive_spark(c['df']).write.format('noop').mode('overwrite').save() or c['rows']), 
+    'clustering.kmeans_sklearn': ('sample', lambda c: len(KMeans(n_clusters = 3, n_init = 10, random_state = consts.RANDOM_STATE).fit(StandardScaler().fit_transform(c['sample'][NUMERIC_COLUMNS])).labels_)), 
+    'clustering.kmeans_spark': ('spark', _spark_kmeans), 
+    'training.grid_search': ('sample', _grid_search), 
+    'scoring.pandas_stream': ('stream', _pandas_scoring), 
+    'scoring.spark': ('spark', _spark_scoring), 
+}
+
+
+
+def run(scale: str, cases: Optional[List[str]] = None, spark: Any = None) -> Dict[str, Any]:
+    """
+    Função que executa os casos do benchmark em uma escala de `consts.BENCHMARK_SCALES`.
+
+    Args:
+        scale (str): Nome da escala (ex.: '10k', '1m' ou '50m').
+        cases (List[str], opcional): Casos a serem executados. Se None, todos. Padrão = None.
+        spark (SparkSession, opcional): Sessão do Spark. Se None, os casos do Spark são pulados. Padrão = None.
+
+    Returns:
+        Dict[str, Any]: Relatório com a escala, as linhas e os resultados de cada caso
+            (casos pulados têm `skipped` com o motivo).
+    """
+
+    if scale not in consts.BENCHMARK_SCALES: 
+
+        raise KeyError(f'Escala desconhecida: "{scale}". Escalas disponíveis: {list(consts.BENCHMARK_SCALES)}.') 
+
+    unknown = [c for c in cases or [] if c not in CASES] 
+
+    if unknown: 
+
+        raise KeyError(f'Casos desconhecidos: {unknown}. Casos disponíveis: {list(CASES)}.') 
+
+    context = prepare(consts.BENCHMARK_SCALES[scale], spark) 
+
+    report = {'scale': scale, 'rows': context['rows'], 'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'cases': {}} 
+
+    for name in cases or list(CASES): 
+
+        engine, function = CASES[name] 
+
+        if engine == 'spark' and spark is None: 
+
+            report['cases'][name] = {'skipped': 'sem sessão do Spark'} 
+
+        elif engine == 'pandas' and context['df_pd'] is None: 
+
+            report['cases'][name] = {'skipped': f'acima de {consts.BENCHMARK_MAX_PANDAS_ROWS} linhas'} 
+
+        else: 
+
+            report['cases'][name] = measure(f'{scale}:{name}', lambda: function(context), spark if engine == 'spark' else None) 
+
+        result = report['cases'][name] 
+
+        print(f'- {name}: ' + (f'pulado ({result["skipped"]})' if 'skipped' in result else f'{result["seconds"]:.2f}s, {result["peak_rss_mb"]:.0f} MB')) 
+
+    return report 
+
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = consts.BENCHMARK_TOLERANCE, min_seconds: float = consts.BENCHMARK_MIN_SECONDS, min_rss_mb: float = consts.BENCHMARK_MIN_RSS_MB) -> pd.DataFrame:
+    """
+    Função que compara um relatório com o baseline da mesma escala. Um caso é marcado como
+    'regression' quando o tempo ou a memória alocada pelo caso passam do baseline em mais que
+    `tolerance` e o aumento absoluto também passa de `min_seconds` ou `min_rss_mb`, para ignorar o
+    ruído dos casos rápidos e pequenos.
+
+    A memória é comparada pelo aumento do RSS durante o caso (`delta_rss_mb`), e não pelo pico
+    (`peak_rss_mb`): o pico inclui o que o processo já ocupava antes (dados da escala, casos
+    anteriores, bibliotecas importadas) e muda com a ordem e a seleção dos casos.
+
+    Args:
+        report (Dict[str, Any]): Relatório do benchmark (`run`).
+        baseline (Dict[str, Any]): Baselines por escala (`load_state(consts.BENCHMARK_BASELINE)`).
+        tolerance (float, opcional): Aumento relativo tolerado. Padrão = consts.BENCHMARK_TOLERANCE.
+        min_seconds (float, opcional): Aumento absoluto de tempo tolerado, em segundos. Padrão = consts.BENCHMARK_MIN_SECONDS.
+        min_rss_mb (float, opcional): Aumento absoluto de memória tolerado, em MB. Padrão = consts.BENCHMARK_MIN_RSS_MB.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha por caso, com os tempos, as memórias, as razões
+            em relação ao baseline e a situação ('ok', 'regression', 'new' ou 'skipped').
+    """
+
+    reference = baseline.get(report['scale'], {}).get('cases', {}) 
+
+    rows = [] 
+
+    for name, result in report['cases'].items(): 
+
+        row = {'case': name, 'seconds': result.get('seconds', np.nan), 'peak_rss_mb': result.get('peak_rss_mb', np.nan), 'delta_rss_mb': result.get('delta_rss_mb', np.nan), 'rows_per_second': result.get('rows_per_second', np.nan)} 
+
+        before = reference.get(name, {}) 
+
+        row['seconds_ratio'] = row['seconds'] / before['seconds'] if 'seconds' in before else np.nan 
+
+        row['rss_ratio'] = row['delta_rss_mb'] / max(before['delta_rss_mb'], 1) if 'delta_rss_mb' in before else np.nan 
+
+        if 'skipped' in result: 
+
+            row['status'] = 'skipped' 
+
+        elif 'seconds' not in before: 
+
+            row['status'] = 'new' 
+
+        else: 
+
+            slower = row['seconds_ratio'] > 1 + tolerance and row['seconds'] - before['seconds'] > min_seconds 
+
+            larger = row['rss_ratio'] > 1 + tolerance and row['delta_rss_mb'] - before.get('delta_rss_mb', np.nan) > min_rss_mb 
+
+            row['status'] = 'regression' if slower or larger else 'ok' 
+
+        rows.append(row) 
+
+    return pd.DataFrame(rows) 
+
+
+
+def save_report(report: Dict[str, Any], path: str = consts.BENCHMARK_REPORT) -> None:
+    """
+    Função que grava o relatório do benchmark em JSON, junto aos relatórios das outras escalas.
+
+    Args:
+        report (Dict[str, Any]): Relatório do benchmark (`run`).
+        path (str, opcional): Caminho dos relatórios. Padrão = consts.BENCHMARK_REPORT.
+    """
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok = True) 
+
+    reports = load_state(path) 
+
+    reports[report['scale']] = report 
+
+    save_state(reports, path) 
@@ -0,0 +1,140 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Union
+
+import joblib as jb
+import matplotlib
+import matplotlib.pyplot as plt
+from joblib.externals.loky import get_reusable_executor
+
+import functions.fn_charts_pandas as fn_charts_pandas
+import params.consts as consts
+from functions.fn_state import code_fingerprint, load_state, save_state
+
+
+
+_BACKGROUND = ThreadPoolExecutor(max_workers = 1)
+
+
+
+def _init_worker() -> None:
+    """
+    Função que configura os processos de renderização com o backend Agg (sem interface gráfica).
+    """
+
+    matplotlib.use('Agg') 
+
+
+
+def chart_fingerprint(spec: Dict[str, Any], dpi: int) -> str:
+    """
+    Função que calcula a assinatura de um gráfico: função, argumentos (incluindo os dados),
+    resolução e código de `fn_charts_pandas`.
+
+    Args:
+        spec (Dict[str, Any]): Especificação do gráfico.
+        dpi (int): Resolução da imagem.
+
+    Returns:
+        str: Hash dos dados e dos parâmetros do gráfico.
+    """
+
+    return jb.hash((spec['function'], spec.get('args', ()), spec.get('kwargs', {}), dpi, code_fingerprint(fn_charts_pandas.__file__))) 
+
+
+
+def render_chart(spec: Dict[str, Any], dpi: int = 75) -> str:
+    """
+    Função que gera e grava um gráfico de `fn_charts_pandas` a partir da sua especificação.
+
+    Args:
+        spec (Dict[str, Any]): Especificação do gráfico, com as chaves `function` (nome da função de
+            `fn_charts_pandas`), `args` e `kwargs` (argumentos da função) e `path` (caminho da imagem).
+        dpi (int, opcional): Resolução da imagem. Padrão = 75.
+
+    Returns:
+        str: Caminho da imagem gravada.
+    """
+
+    function = getattr(fn_charts_pandas, spec['function']) 
+
+    fig, _ = function(*spec.get('args', ()), **spec.get('kwargs', {})) 
+
+    os.makedirs(os.path.dirname(spec['path']) or '.', exist_ok = True) 
+
+    fig.savefig(spec['path'], format = 'png', dpi = dpi, bbox_inches = 'tight', transparent = True) 
+
+    plt.close(fig) 
+
+    return spec['path'] 
+
+
+
+def render(specs: List[Dict[str, Any]], n_jobs: int = -1, dpi: int = 75, force: bool = False, block: bool = True, state_path: str = consts.CHARTS_STATE) -> Union[Dict[str, str], Future]:
+    """
+    Função que gera e grava um lote de gráficos em um pool de processos com o backend Agg.
+
+    Os gráficos cuja assinatura (`chart_fingerprint`) é a mesma da última renderização e cuja
+    imagem existe são pulados, de forma que, após uma atualização dos dados, apenas os gráficos
+    alterados são gerados novamente. Os processos do pool são reaproveitados entre os lotes.
+
+    Args:
+        specs (List[Dict[str, Any]]): Especificações dos gráficos (ver `render_chart`).
+        n_jobs (int, opcional): Quantidade de processos. Valores negativos seguem a convenção do joblib
+            (-1 usa todos os núcleos, -2 todos menos um etc.). Padrão = -1.
+        dpi (int, opcional): Resolução das imagens. Padrão = 75.
+        force (bool, opcional): Se True, gera os gráficos mesmo se atualizados. Padrão = False.
+        block (bool, opcional): Se False, o lote é executado em segundo plano e a função retorna
+            imediatamente um `Future` com o resultado. Padrão = True.
+        state_path (str, opcional): Caminho do estado das renderizações. Padrão = consts.CHARTS_STATE.
+
+    Returns:
+        Dict[str, str]: Dicionário caminho → situação ('skipped' ou 'rendered'), ou um `Future`
+            com esse dicionário se `block` for False.
+    """
+
+    if not block: 
+
+        return _BACKGROUND.submit(render, specs, n_jobs, dpi, force, True, state_path) 
+
+    state = load_state(state_path) 
+
+    status: Dict[str, str] = {} 
+
+    pending: Dict[str, tuple] = {} 
+
+    for spec in specs: 
+
+        fingerprint = chart_fingerprint(spec, dpi) 
+
+        if not force and state.get(spec['path']) == fingerprint and os.path.exists(spec['path']): 
+
+            status[spec['path']] = 'skipped' 
+
+        else: 
+
+            pending[spec['path']] = (spec, fingerprint) 
+
+    if pending: 
+
+        workers = max(1, min(len(pending), n_jobs if n_jobs > 0 else (os.cpu_count() or 1) + 1 + n_jobs)) 
+
+        executor = get_reusable_executor(max_workers = workers, initializer = _init_worker) 
+
+        futures = {executor.submit(render_chart, spec, dpi): (path, fingerprint) for path, (spec, fingerprint) in pending.items()} 
+
+        os.makedirs(os.path.dirname(state_path) or '.', exist_ok = True) 
+
+        for future in as_completed(futures): 
+
+            path, fingerprint = futures[future] 
+
+            future.result() 
+
+            state[path] = fingerprint 
+
+            status[path] = 'rendered' 
+
+            save_state(state, state_path) 
+
+    return {spec['path']: status[spec['path']] for spec in specs} 
@@ -0,0 +1,402 @@
+import math
+from typing import Dict, List, Optional
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+from pyspark.ml.feature import VectorAssembler
+from pyspark.ml.stat import Correlation
+from pyspark.sql import DataFrame, Window
+from pyspark.sql import functions as F
+
+import functions.fn_charts_pandas as fn_charts_pandas
+import params.consts as consts
+from functions.fn_stats_pyspark import NUMERIC_TYPES
+
+
+
+def _numeric_columns(df: DataFrame) -> List[str]:
+    """
+    Função que retorna as colunas numéricas de um DataFrame do PySpark.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+
+    Returns:
+        List[str]: Lista com os nomes das colunas numéricas.
+    """
+
+    return [c for c, t in df.dtypes if t in NUMERIC_TYPES or t.startswith('decimal')] 
+
+
+
+def histogram_bins(df: DataFrame, x_columns: List[str], hue_column: Optional[str] = None, bins: int = 30) -> pd.DataFrame:
+    """
+    Função que calcula os histogramas no Spark e retorna apenas as contagens por faixa.
+
+    As colunas numéricas são divididas em `bins` faixas de mesma largura entre o mínimo e o máximo,
+    e as demais colunas são contadas por categoria. Todas as colunas são agregadas em um único
+    `groupBy`, e só o resultado agregado é enviado ao driver.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        x_columns (List[str]): Colunas dos histogramas.
+        hue_column (str, opcional): Coluna "categórica" usada como hue. Padrão = None.
+        bins (int, opcional): Quantidade de faixas das colunas numéricas. Padrão = 30.
+
+    Returns:
+        pd.DataFrame: DataFrame com as colunas `column`, `category`, `bin_start`, `bin_end`,
+            `bin_center` e `count` (e a coluna de hue).
+    """
+
+    numeric = [c for c in x_columns if c in _numeric_columns(df)] 
+
+    bounds = df.agg(*[F.min(c).alias(f'{c}__min') for c in numeric], *[F.max(c).alias(f'{c}__max') for c in numeric]).first() if numeric else {} 
+
+    widths = {c: ((bounds[f'{c}__max'] - bounds[f'{c}__min']) / bins) or 1.0 for c in numeric if bounds[f'{c}__min'] is not None} 
+
+    entries = [] 
+
+    for c in x_columns: 
+
+        if c in widths: 
+
+            index = F.least(F.floor((F.col(c) - F.lit(bounds[f'{c}__min'])) / F.lit(widths[c])), F.lit(bins - 1)).cast('int') 
+
+            entries.append(F.struct(F.lit(c).alias('column'), index.alias('bin'), F.lit(None).cast('string').alias('category'))) 
+
+        elif c not in numeric: 
+
+            entries.append(F.struct(F.lit(c).alias('column'), F.lit(None).cast('int').alias('bin'), F.col(c).cast('string').alias('category'))) 
+
+    keys = [hue_column] if hue_column else [] 
+
+    df_bins = ( 
+
+        df.select(*keys, F.explode(F.array(*entries)).alias('entry')) 
+
+          .select(*keys, 'entry.*') 
+
+          .filter(F.col('bin').isNotNull() | F.col('category').isNotNull()) 
+
+          .groupBy('column', 'bin', 'category', *keys) 
+
+          .count() 
+
+          .toPandas() 
+
+    )
+
+    start = df_bins['column'].map({c: bounds[f'{c}__min'] for c in widths}) 
+
+    width = df_bins['column'].map(widths) 
+
+    df_bins['bin_start'] = start + df_bins['bin'] * width 
+
+    df_bins['bin_end'] = df_bins['bin_start'] + width 
+
+    df_bins['bin_center'] = df_bins['bin_start'] + width / 2 
+
+    return df_bins 
+
+
+
+def histplot(df: DataFrame, x_columns: List[str], hue_column: Optional[str] = None, bins: int = 30, num_cols: int = 3, height_figsize: int = 5, alpha: float = 0.5) -> tuple[plt.Figure, list]:
+    """
+    Função que gera uma lista de histogramas a partir de um DataFrame do PySpark, com as contagens
+    calculadas no Spark (`histogram_bins`).
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        x_columns (List[str]): Lista de colunas para o eixo X para criação dos histogramas.
+        hue_column (str, opcional): Coluna "categórica" usada como hue. Padrão = None.
+        bins (int, opcional): Quantidade de faixas das colunas numéricas. Padrão = 30.
+        num_cols (int, opcional): Número de histogramas por linha. Padrão = 3.
+        height_figsize (int, opcional): Altura da figura. Padrão = 5.
+        alpha (float, opcional): Transparência dos histogramas. Padrão = 0.5.
+
+    Returns:
+        tuple: Uma tupla contendo a figura (`fig`) e a lista de eixos (`axs`) gerados.
+    """
+
+    df_bins = histogram_bins(df, x_columns, hue_column, bins) 
+
+    total_columns = len(x_columns) 
+
+    num_rows = math.ceil(total_columns / num_cols) 
+
+    fig, axs = plt.subplots(figsize = (20, height_figsize * num_rows), nrows = num_rows, ncols = num_cols, tight_layout = True) 
+
+    axs = axs.flatten() 
+
+    for i, x_column in enumerate(x_columns): 
+
+        df_column = df_bins[df_bins['column'] == x_column] 
+
+        if df_column['bin'].notna().any(): 
+
+            edges = sorted(set(df_column['bin_start']) | set(df_column['bin_end'])) 
+
+            sns.histplot(data = df_column, x = 'bin_center', weights = 'count', bins = edges, hue = hue_column, ax = axs[i], alpha = alpha, palette = 'tab10' if hue_column else None) 
+
+        else: 
+
+            sns.histplot(data = df_column.sort_values('category'), x = 'category', weights = 'count', hue = hue_column, ax = axs[i], alpha = alpha, palette = 'tab10' if hue_column else None) 
+
+        axs[i].set(title = f'Histplot - {x_column}', xlabel = '', ylabel = '') 
+
+    for ax in axs[total_columns:]: 
+
+        ax.axis('off') 
+
+    return fig, axs 
+
+
+
+def box_statistics(df: DataFrame, y_columns: List[str], keys: Optional[List[str]] = None, whisker_width: float = 1.5, max_fliers: int = 1000, accuracy: int = 10000) -> pd.DataFrame:
+    """
+    Função que calcula no Spark as estatísticas dos diagramas de caixa: quartis (`percentile_approx`),
+    média, bigodes (menor e maior valor dentro de `whisker_width` × IQR) e até `max_fliers` outliers
+    por caixa (os mais distantes da mediana). Todas as colunas são calculadas nas mesmas agregações.
+
+    Os outliers são limitados com `row_number` antes do `collect_list`, de forma que cada caixa
+    acumula no máximo `max_fliers` valores, e não a lista completa de outliers.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        y_columns (List[str]): Colunas dos diagramas de caixa.
+        keys (List[str], opcional): Colunas de agrupamento (uma caixa por combinação de valores). Padrão = None.
+        whisker_width (float, opcional): Largura dos bigodes, em IQRs. Padrão = 1.5.
+        max_fliers (int, opcional): Quantidade máxima de outliers enviados ao driver por caixa. Padrão = 1000.
+        accuracy (int, opcional): Precisão do `percentile_approx`. Padrão = 10000.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha por coluna e grupo, com `q1`, `med`, `q3`, `mean`,
+            `whislo`, `whishi` e `fliers`.
+    """
+
+    keys = list(keys or []) 
+
+    entries = [F.struct(F.lit(c).alias('column'), F.col(c).cast('double').alias('value')) for c in y_columns] 
+
+    df_long = df.select(*keys, F.explode(F.array(*entries)).alias('entry')).select(*keys, 'entry.*').filter(F.col('value').isNotNull()) 
+
+    quartiles = F.percentile_approx('value', [0.25, 0.5, 0.75], accuracy) 
+
+    df_quartiles = ( 
+
+        df_long.groupBy(*keys, 'column') 
+
+               .agg(quartiles[0].alias('q1'), quartiles[1].alias('med'), quartiles[2].alias('q3'), F.mean('value').alias('mean')) 
+
+               .withColumn('low', F.col('q1') - whisker_width * (F.col('q3') - F.col('q1'))) 
+
+               .withColumn('high', F.col('q3') + whisker_width * (F.col('q3') - F.col('q1'))) 
+
+    )
+
+    outlier = (F.col('value') < F.col('low')) | (F.col('value') > F.col('high')) 
+
+    df_flagged = df_long.join(F.broadcast(df_quartiles.select(*keys, 'column', 'med', 'low', 'high')), on = keys + ['column']).withColumn('outlier', outlier) 
+
+    df_whiskers = ( 
+
+        df_flagged.filter(~F.col('outlier')) 
+
+                  .groupBy(*keys, 'column') 
+
+                  .agg(F.min('value').alias('whislo'), F.max('value').alias('whishi')) 
+
+    )
+
+    ranking = Window.partitionBy(*keys, 'column').orderBy(F.abs(F.col('value') - F.col('med')).desc()) 
+
+    df_fliers = ( 
+
+        df_flagged.filter(F.col('outlier')) 
+
+                  .withColumn('rank', F.row_number().over(ranking)) 
+
+                  .filter(F.col('rank') <= max_fliers) 
+
+                  .groupBy(*keys, 'column') 
+
+                  .agg(F.collect_list('value').alias('fliers')) 
+
+    )
+
+    df_stats = ( 
+
+        df_quartiles.drop('low', 'high') 
+
+                    .join(df_whiskers, on = keys + ['column'], how = 'left') 
+
+                    .join(df_fliers, on = keys + ['column'], how = 'left') 
+
+                    .withColumn('fliers', F.coalesce('fliers', F.array().cast('array<double>'))) 
+
+                    .toPandas() 
+
+    )
+
+    return df_stats 
+
+
+
+def boxplot(df: DataFrame, y_columns: Optional[List[str]] = None, x_column: Optional[str] = None, hue_column: Optional[str] = None, num_cols: int = 3, height_figsize: int = 5) -> tuple[plt.Figure, list]:
+    """
+    Função que gera uma lista de diagramas de caixa a partir de um DataFrame do PySpark, com as
+    estatísticas calculadas no Spark (`box_statistics`).
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        y_columns (List[str], opcional): Lista de colunas para o eixo Y. Se None, usa as colunas numéricas. Padrão = None.
+        x_column (str, opcional): Coluna para o eixo X. Padrão = None.
+        hue_column (str, opcional): Coluna "categórica" usada como hue. Padrão = None.
+        num_cols (int, opcional): Número de diagramas de caixa por linha. Padrão = 3.
+        height_figsize (int, opcional): Altura da figura. Padrão = 5.
+
+    Returns:
+        tuple: Uma tupla contendo a figura (`fig`) e a lista de eixos (`axs`) gerados.
+    """
+
+    y_columns = _numeric_columns(df) if y_columns is None else list(y_columns) 
+
+    keys = list(dict.fromkeys(c for c in [x_column, hue_column] if c)) 
+
+    df_stats = box_statistics(df, y_columns, keys).sort_values(keys) if keys else box_statistics(df, y_columns) 
+
+    hues = sorted(df_stats[hue_column].unique()) if hue_column else [] 
+
+    palette = dict(zip(hues, sns.color_palette('tab10', len(hues)))) if hue_column else {} 
+
+    total_columns = len(y_columns) 
+
+    num_rows = math.ceil(total_columns / num_cols) 
+
+    fig, axs = plt.subplots(figsize = (20, height_figsize * num_rows), nrows = num_rows, ncols = num_cols, tight_layout = True) 
+
+    axs = axs.flatten() 
+
+    for i, y_column in enumerate(y_columns): 
+
+        df_column = df_stats[df_stats['column'] == y_column] 
+
+        stats = [{**row[['q1', 'med', 'q3', 'mean', 'whislo', 'whishi']].to_dict(), 'fliers': list(row['fliers']), 'label': row[x_column] if x_column else ''} for _, row in df_column.iterrows()] 
+
+        boxes = axs[i].bxp(stats, showmeans = True, patch_artist = True) 
+
+        for box, (_, row) in zip(boxes['boxes'], df_column.iterrows()): 
+
+            box.set_facecolor(palette[row[hue_column]] if hue_column else sns.color_palette()[0]) 
+
+        axs[i].set(title = f'Boxplot - {y_column}', xlabel = '', ylabel = '') 
+
+    for ax in axs[total_columns:]: 
+
+        ax.axis('off') 
+
+    return fig, axs 
+
+
+
+def correlation_matrix(df: DataFrame, columns: Optional[List[str]] = None, method: str = 'pearson') -> pd.DataFrame:
+    """
+    Função que calcula a matriz de correlação no Spark (`Correlation.corr`), ignorando as linhas com nulos.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        columns (List[str], opcional): Colunas numéricas. Se None, usa todas as colunas numéricas. Padrão = None.
+        method (str, opcional): Método da correlação ('pearson' ou 'spearman'). Padrão = 'pearson'.
+
+    Returns:
+        pd.DataFrame: Matriz de correlação.
+    """
+
+    columns = _numeric_columns(df) if columns is None else list(columns) 
+
+    assembler = VectorAssembler(inputCols = columns, outputCol = '_features', handleInvalid = 'skip') 
+
+    df_features = assembler.transform(df.select([F.col(c).cast('double') for c in columns])) 
+
+    matrix = Correlation.corr(df_features, '_features', method).first()[0].toArray() 
+
+    return pd.DataFrame(matrix, index = columns, columns = columns) 
+
+
+
+def heatmap(df: DataFrame, columns: Optional[List[str]] = None, method: str = 'pearson') -> tuple[plt.Figure, list]:
+    """
+    Função que gera o mapa de calor da matriz de correlação calculada no Spark.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        columns (List[str], opcional): Colunas numéricas. Se None, usa todas as colunas numéricas. Padrão = None.
+        method (str, opcional): Método da correlação ('pearson' ou 'spearman'). Padrão = 'pearson'.
+
+    Returns:
+        tuple: Uma tupla contendo a figura (`fig`) e a lista de eixos (`axs`) gerados.
+    """
+
+    return fn_charts_pandas.heatmap(correlation_matrix(df, columns, method)) 
+
+
+
+def sample_pandas(df: DataFrame, max_rows: int = 10000, strata: Optional[str] = None, min_per_stratum: int = 100, seed: int = consts.RANDOM_STATE) -> pd.DataFrame:
+    """
+    Função que retorna uma amostra de até `max_rows` linhas como DataFrame do Pandas.
+
+    Com `strata`, a amostra é estratificada (`sampleBy`): cada estrato é amostrado na mesma proporção,
+    mas com pelo menos `min_per_stratum` linhas (quando existirem), para que estratos pequenos
+    continuem visíveis nos gráficos.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        max_rows (int, opcional): Quantidade aproximada de linhas da amostra. Padrão = 10000.
+        strata (str, opcional): Coluna de estratificação. Padrão = None.
+        min_per_stratum (int, opcional): Quantidade mínima de linhas por estrato. Padrão = 100.
+        seed (int, opcional): Semente da amostragem. Padrão = consts.RANDOM_STATE.
+
+    Returns:
+        pd.DataFrame: Amostra do DataFrame.
+    """
+
+    if strata is None: 
+
+        total = df.count() 
+
+        return (df if total <= max_rows else df.sample(fraction = max_rows / total, seed = seed)).toPandas() 
+
+    counts: Dict = {r[strata]: r['count'] for r in df.groupBy(strata).count().collect()} 
+
+    total = sum(counts.values()) 
+
+    fractions = {k: min(1.0, max(max_rows / total, min_per_stratum / n)) for k, n in counts.items()} 
+
+    return df.sampleBy(strata, fractions, seed).toPandas() 
+
+
+
+def scatterplot(df: DataFrame, x_columns: List[str], y_column: str, hue_column: Optional[str] = None, max_rows: int = 10000, num_cols: int = 3, height_figsize: int = 5) -> tuple[plt.Figure, list]:
+    """
+    Função que gera uma lista de gráficos de dispersão a partir de uma amostra (estratificada pelo hue)
+    de um DataFrame do PySpark.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        x_columns (List[str]): Lista de colunas para o eixo X.
+        y_column (str): Coluna para o eixo Y.
+        hue_column (str, opcional): Coluna "categórica" usada como hue e como estrato da amostra. Padrão = None.
+        max_rows (int, opcional): Quantidade aproximada de pontos por gráfico. Padrão = 10000.
+        num_cols (int, opcional): Número de gráficos por linha. Padrão = 3.
+        height_figsize (int, opcional): Altura da figura. Padrão = 5.
+
+    Returns:
+        tuple: Uma tupla contendo a figura (`fig`) e a lista de eixos (`axs`) gerados.
+    """
+
+    columns = list(dict.fromkeys(list(x_columns) + [y_column] + ([hue_column] if hue_column else []))) 
+
+    df_sample = sample_pandas(df.select(columns), max_rows, hue_column) 
+
+    return fn_charts_pandas.scatterplot(df_sample, x_columns, y_column, hue_column, num_cols, height_figsize) 
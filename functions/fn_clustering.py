@@ -0,0 +1,223 @@
+import math
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_samples
+
+import params.consts as consts
+
+
+
+def stratified_sample(labels: np.ndarray, sample_size: Optional[int], random_state: int = consts.RANDOM_STATE) -> np.ndarray:
+    """
+    Função que sorteia os índices de uma amostra estratificada pelos rótulos dos clusters,
+    mantendo a proporção de cada cluster (com ao menos 2 pontos por cluster).
+
+    Args:
+        labels (np.ndarray): Rótulos dos clusters.
+        sample_size (int, opcional): Tamanho da amostra. Se None ou maior que a base, usa todos os pontos.
+        random_state (int, opcional): Semente do sorteio. Padrão = consts.RANDOM_STATE.
+
+    Returns:
+        np.ndarray: Índices dos pontos sorteados.
+    """
+
+    n = len(labels) 
+
+    if sample_size is None or sample_size >= n: 
+
+        return np.arange(n) 
+
+    rng = np.random.default_rng(random_state) 
+
+    classes, counts = np.unique(labels, return_counts = True) 
+
+    indices = [] 
+
+    for label, count in zip(classes, counts): 
+
+        size = min(count, max(2, round(sample_size * count / n))) 
+
+        indices.append(rng.choice(np.flatnonzero(labels == label), size, replace = False)) 
+
+    return np.sort(np.concatenate(indices)) 
+
+
+
+def silhouette_interval(X: np.ndarray, labels: np.ndarray, sample_size: Optional[int] = 10000, confidence: float = 0.95, random_state: int = consts.RANDOM_STATE) -> Tuple[float, float, float]:
+    """
+    Função que estima o coeficiente da silhueta em uma amostra estratificada, com um intervalo
+    de confiança pela aproximação normal da média das silhuetas individuais.
+
+    O `silhouette_score` completo é O(n²) em tempo e memória; na amostra o custo é O(m²),
+    independente do tamanho da base.
+
+    Args:
+        X (np.ndarray): Dados transformados.
+        labels (np.ndarray): Rótulos dos clusters.
+        sample_size (int, opcional): Tamanho da amostra. Se None, usa todos os pontos. Padrão = 10000.
+        confidence (float, opcional): Nível de confiança do intervalo. Padrão = 0.95.
+        random_state (int, opcional): Semente do sorteio. Padrão = consts.RANDOM_STATE.
+
+    Returns:
+        tuple: Uma tupla contendo a silhueta estimada e os limites inferior e superior do intervalo.
+    """
+
+    indices = stratified_sample(labels, sample_size, random_state) 
+
+    scores = silhouette_samples(X[indices], labels[indices]) 
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2) 
+
+    margin = z * float(scores.std(ddof = 1)) / math.sqrt(len(scores)) 
+
+    mean = float(scores.mean()) 
+
+    return mean, mean - margin, mean + margin 
+
+
+
+def _fit_k(X: np.ndarray, k: int, n_init: int, sample_size: Optional[int], random_state: int) -> Tuple[float, float, float, float]:
+    """
+    Função que treina o K-Means para um valor de k e avalia a inércia e a silhueta.
+
+    Args:
+        X (np.ndarray): Dados transformados.
+        k (int): Quantidade de clusters.
+        n_init (int): Quantidade de inicializações do K-Means.
+        sample_size (int, opcional): Tamanho da amostra da silhueta.
+        random_state (int): Semente do K-Means e da amostra.
+
+    Returns:
+        tuple: Uma tupla contendo a inércia, a silhueta e os limites do intervalo da silhueta.
+    """
+
+    kmeans = KMeans(n_clusters = k, random_state = random_state, n_init = n_init).fit(X) 
+
+    return (kmeans.inertia_, *silhouette_interval(X, kmeans.labels_, sample_size, random_state = random_state)) 
+
+
+
+def select_k(X: Any, k_values: Sequence[int] = range(2, 11), n_init: int = 10, sample_size: Optional[int] = 10000, n_jobs: int = -1, random_state: int = consts.RANDOM_STATE, return_interval: bool = False) -> Tuple:
+    """
+    Função que executa a varredura de k do método do cotovelo e do método da silhueta,
+    treinando os K-Means de cada k em paralelo em um pool de processos (joblib).
+
+    Args:
+        X (Any): Dados transformados (DataFrame ou array).
+        k_values (Sequence[int], opcional): Valores de k testados. Padrão = range(2, 11).
+        n_init (int, opcional): Quantidade de inicializações do K-Means. Padrão = 10.
+        sample_size (int, opcional): Tamanho da amostra estratificada da silhueta. Se None, usa
+            todos os pontos. Padrão = 10000.
+        n_jobs (int, opcional): Quantidade de processos. Padrão = -1 (todos os núcleos).
+        random_state (int, opcional): Semente do K-Means e da amostra. Padrão = consts.RANDOM_STATE.
+        return_interval (bool, opcional): Se True, retorna também os intervalos de confiança da
+            silhueta. Padrão = False.
+
+    Returns:
+        tuple: Uma tupla contendo o dicionário de inércias (`elbow`), a lista de silhuetas (`silhouette`)
+            e os valores de k (`k_values`), no formato de `fn_charts_pandas.lineplot_elbow_silhouette`,
+            e, se `return_interval`, a lista de intervalos (limite inferior, limite superior).
+    """
+
+    X = np.asarray(X, dtype = float) 
+
+    results = Parallel(n_jobs = n_jobs)(delayed(_fit_k)(X, k, n_init, sample_size, random_state) for k in k_values) 
+
+    elbow: Dict[int, float] = {k: float(r[0]) for k, r in zip(k_values, results)} 
+
+    silhouette: List[float] = [r[1] for r in results] 
+
+    if return_interval: 
+
+        return elbow, silhouette, k_values, [(r[2], r[3]) for r in results] 
+
+    return elbow, silhouette, k_values 
+
+
+
+def nearest_centroid(Z: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """
+    Função que atribui cada ponto ao centróide mais próximo, de forma vetorizada,
+    pela expansão ||z - c||² = ||z||² - 2 z·c + ||c||² (o termo ||z||² não altera o argmin).
+
+    Args:
+        Z (np.ndarray): Pontos no espaço do K-Means (n x d).
+        centers (np.ndarray): Centróides (k x d).
+
+    Returns:
+        np.ndarray: Índice do centróide mais próximo de cada ponto.
+    """
+
+    distances = (centers ** 2).sum(axis = 1) - 2 * Z @ centers.T 
+
+    return distances.argmin(axis = 1).astype('int32') 
+
+
+
+def assign_clusters(pipeline: Any, df: Any) -> np.ndarray:
+    """
+    Função que atribui os clusters a novos registros com o pipeline de clusterização já treinado
+    (pré processamento → PCA → K-Means), sem treinar novamente.
+
+    Args:
+        pipeline (Any): Pipeline de clusterização treinado, com o K-Means como último passo.
+        df (Any): Registros com as colunas de entrada do pipeline.
+
+    Returns:
+        np.ndarray: Cluster de cada registro.
+    """
+
+    Z = np.asarray(pipeline[:-1].transform(df), dtype = float) 
+
+    return nearest_centroid(Z, pipeline[-1].cluster_centers_) 
+
+
+
+def partial_fit_centroids(pipeline: Any, df: Any) -> np.ndarray:
+    """
+    Função que atualiza os centróides do K-Means com um lote de novos registros, como no
+    `partial_fit` do `MiniBatchKMeans`: cada centróide se move para a média acumulada dos
+    pontos atribuídos a ele, com taxa de aprendizado 1 / (quantidade de pontos do centróide).
+
+    As quantidades por centróide ficam no atributo `counts_` do K-Means (inicializadas pelos
+    `labels_` do treino) e são salvas junto com o pipeline. O pré processamento não é reajustado,
+    e os clusters já gravados não são reatribuídos; um novo treino completo continua sendo
+    necessário quando a distribuição dos dados mudar.
+
+    Args:
+        pipeline (Any): Pipeline de clusterização treinado, com o K-Means como último passo.
+        df (Any): Lote de novos registros.
+
+    Returns:
+        np.ndarray: Cluster de cada registro, em relação aos centróides atualizados.
+    """
+
+    kmeans = pipeline[-1] 
+
+    centers = kmeans.cluster_centers_ 
+
+    if not hasattr(kmeans, 'counts_'): 
+
+        kmeans.counts_ = np.bincount(kmeans.labels_, minlength = len(centers)).astype(float) 
+
+    Z = np.asarray(pipeline[:-1].transform(df), dtype = float) 
+
+    labels = nearest_centroid(Z, centers) 
+
+    batch_counts = np.bincount(labels, minlength = len(centers)) 
+
+    batch_sums = np.zeros_like(centers) 
+
+    np.add.at(batch_sums, labels, Z) 
+
+    kmeans.counts_ += batch_counts 
+
+    updated = batch_counts > 0 
+
+    centers[updated] += (batch_sums[updated] - batch_counts[updated, None] * centers[updated]) / kmeans.counts_[updated, None] 
+
+    return nearest_centroid(Z, centers) 
@@ -0,0 +1,226 @@
+import math
+from typing import Any, Dict
+
+import joblib as jb
+import numpy as np
+
+
+
+def compile_pipeline(pipeline: Any) -> Dict[str, Any]:
+    """
+    Função que compila o pipeline de classificação treinado (`pre_processing` → `feature_selection`
+    → `resampling` → `models`) em uma representação plana de coeficientes e tabelas de consulta.
+
+    Cada saída do `ColumnTransformer` mantida pelo `SelectKBest` é associada à sua coluna de origem,
+    aos parâmetros do transformador e ao coeficiente da regressão logística. As saídas descartadas
+    pela seleção não são calculadas, e as categorias do `OneHotEncoder` viram um dicionário
+    categoria → coeficiente por coluna.
+
+    Args:
+        pipeline (Any): Pipeline treinado com os passos `pre_processing` (ColumnTransformer com
+            OneHotEncoder, StandardScaler, PowerTransformer e MinMaxScaler), `feature_selection`
+            e `models` (LogisticRegression binária).
+
+    Returns:
+        Dict[str, Any]: Modelo compilado, serializável com joblib.
+    """
+
+    pre_processing = pipeline.named_steps['pre_processing'] 
+
+    support = pipeline.named_steps['feature_selection'].get_support() 
+
+    model = pipeline.named_steps['models'] 
+
+    coef = model.coef_.ravel() 
+
+    selected = np.cumsum(support) - 1 
+
+    terms, lookups, ignore_unknown, offset = [], {}, [], 0 
+
+    for _, transformer, columns in pre_processing.transformers_: 
+
+        if transformer == 'drop': 
+
+            continue 
+
+        kind = type(transformer).__name__ 
+
+        if kind == 'OneHotEncoder': 
+
+            if transformer.handle_unknown != 'error': 
+
+                ignore_unknown += list(columns) 
+
+            for column, categories in zip(columns, transformer.categories_): 
+
+                lookups[column] = {category.item() if hasattr(category, 'item') else category: float(coef[selected[offset + j]]) if support[offset + j] else 0.0 for j, category in enumerate(categories)} 
+
+                offset += len(categories) 
+
+            continue 
+
+        for j, column in enumerate(columns): 
+
+            if not support[offset + j]: 
+
+                continue 
+
+            if kind == 'StandardScaler': 
+
+                params = ('standard', float(transformer.mean_[j]), float(transformer.scale_[j])) 
+
+            elif kind == 'PowerTransformer': 
+
+                params = ('power', float(transformer.lambdas_[j]), float(transformer._scaler.mean_[j]), float(transformer._scaler.scale_[j])) 
+
+            elif kind == 'MinMaxScaler': 
+
+                params = ('min_max', float(transformer.scale_[j]), float(transformer.min_[j])) 
+
+            else: 
+
+                raise TypeError(f'Transformador não suportado pelo modelo compilado: {kind}.') 
+
+            terms.append((column, params, float(coef[selected[offset + j]]))) 
+
+        offset += len(columns) 
+
+    lookups = {c: table for c, table in lookups.items() if any(w != 0.0 for w in table.values())} 
+
+    compiled = { 
+        'intercept': float(model.intercept_[0]), 
+        'classes': [c.item() if hasattr(c, 'item') else c for c in model.classes_], 
+        'lookups': lookups, 
+        'terms': terms, 
+        'ignore_unknown': [c for c in ignore_unknown if c in lookups], 
+    }
+
+    return compiled 
+
+
+
+def _yeo_johnson(x: float, lmbda: float) -> float:
+    """
+    Função que aplica a transformação de Yeo-Johnson a um valor, com as mesmas fórmulas do
+    `PowerTransformer` do Scikit-Learn.
+
+    Args:
+        x (float): Valor de entrada.
+        lmbda (float): Lambda ajustado.
+
+    Returns:
+        float: Valor transformado.
+    """
+
+    eps = np.spacing(1.0) 
+
+    if x >= 0: 
+
+        return math.log1p(x) if abs(lmbda) < eps else ((x + 1) ** lmbda - 1) / lmbda 
+
+    return -math.log1p(-x) if abs(lmbda - 2) <= eps else -((-x + 1) ** (2 - lmbda) - 1) / (2 - lmbda) 
+
+
+
+def decision_function(compiled: Dict[str, Any], record: Dict[str, Any]) -> float:
+    """
+    Função que calcula o score (logit) da regressão logística para um único registro,
+    usando apenas as features selecionadas.
+
+    Args:
+        compiled (Dict[str, Any]): Modelo compilado com `compile_pipeline`.
+        record (Dict[str, Any]): Registro com as features de entrada.
+
+    Returns:
+        float: Score da regressão logística.
+    """
+
+    score = 0.0 
+
+    for column, table in compiled['lookups'].items(): 
+
+        value = record[column] 
+
+        if value not in table: 
+
+            if column in compiled['ignore_unknown']: 
+
+                continue 
+
+            raise ValueError(f'Categoria desconhecida na coluna {column}: {value!r}.') 
+
+        score += table[value] 
+
+    for column, params, weight in compiled['terms']: 
+
+        x = float(record[column]) 
+
+        if params[0] == 'standard': 
+
+            z = (x - params[1]) / params[2] 
+
+        elif params[0] == 'power': 
+
+            z = (_yeo_johnson(x, params[1]) - params[2]) / params[3] 
+
+        else: 
+
+            z = x * params[1] + params[2] 
+
+        score += z * weight 
+
+    return score + compiled['intercept'] 
+
+
+
+def predict_proba(compiled: Dict[str, Any], record: Dict[str, Any]) -> float:
+    """
+    Função que retorna a probabilidade da classe positiva para um único registro.
+
+    Args:
+        compiled (Dict[str, Any]): Modelo compilado com `compile_pipeline`.
+        record (Dict[str, Any]): Registro com as features de entrada.
+
+    Returns:
+        float: Probabilidade da classe positiva.
+    """
+
+    score = decision_function(compiled, record) 
+
+    return 1 / (1 + math.exp(min(-score, 709.0))) 
+
+
+
+def predict(compiled: Dict[str, Any], record: Dict[str, Any]) -> Any:
+    """
+    Função que retorna a classe prevista para um único registro.
+
+    Args:
+        compiled (Dict[str, Any]): Modelo compilado com `compile_pipeline`.
+        record (Dict[str, Any]): Registro com as features de entrada.
+
+    Returns:
+        Any: Classe prevista.
+    """
+
+    return compiled['classes'][int(decision_function(compiled, record) > 0)] 
+
+
+
+def export(pipeline: Any, path: str) -> Dict[str, Any]:
+    """
+    Função que compila o pipeline e grava o modelo compilado com joblib.
+
+    Args:
+        pipeline (Any): Pipeline treinado.
+        path (str): Caminho de saída.
+
+    Returns:
+        Dict[str, Any]: Modelo compilado.
+    """
+
+    compiled = compile_pipeline(pipeline) 
+
+    jb.dump(compiled, path) 
+
+    return compiled 
@@ -0,0 +1,273 @@
+import numpy as np
+import pandas as pd
+from functools import reduce
+from operator import add
+from typing import Any, Callable, Dict, List, Tuple
+
+try: 
+
+    from pyspark.sql import Column, DataFrame
+    from pyspark.sql.functions import col, floor, lit, when
+
+except ImportError: 
+
+    Column = DataFrame = None 
+
+
+
+AGE_GROUPS = ((18, 30, 45, 60, None), ('18-30', '31-45', '46-60', '61+'))
+
+FEATURES = {
+    'Children': [('sum', ['Kidhome', 'Teenhome'], None)], 
+    'MntTotal': [ 
+        ('sum', ['MntWines', 'MntFruits', 'MntMeatProducts', 'MntFishProducts', 'MntSweetProducts', 'MntGoldProds'], None), 
+        ('sum', ['MntRegularProds', 'MntGoldProds'], None), 
+    ], 
+    'AcceptedCmpTotal': [('sum', ['AcceptedCmp1', 'AcceptedCmp2', 'AcceptedCmp3', 'AcceptedCmp4', 'AcceptedCmp5'], None)], 
+    'NumTotalPurchases': [('sum', ['NumWebPurchases', 'NumCatalogPurchases', 'NumStorePurchases'], None)], 
+    'HasChildren': [('flag', ['Children'], None)], 
+    'AgeGroup': [('bins', ['Age'], AGE_GROUPS)], 
+    'Years_Since_Enrolled': [('floordiv', ['Days_Since_Enrolled'], 365)], 
+    'MntRegularProds': [('diff', ['MntTotal', 'MntGoldProds'], None)], 
+    'HasAcceptedCmp': [('flag', ['AcceptedCmpTotal'], None)], 
+}
+
+
+
+def _bins(x: Any, bins: Tuple[Tuple, Tuple]) -> List[Tuple[Any, str]]:
+    """
+    Função que monta as condições de cada faixa `(limite inferior, limite superior]`,
+    com a primeira faixa fechada à esquerda e o limite None significando sem limite superior.
+
+    Args:
+        x (Any): Coluna do PySpark ou Series do Pandas.
+        bins (Tuple[Tuple, Tuple]): Tupla com os limites e os rótulos das faixas.
+
+    Returns:
+        List[Tuple[Any, str]]: Lista de pares (condição, rótulo).
+    """
+
+    edges, labels = bins 
+
+    conditions = [] 
+
+    for i, label in enumerate(labels): 
+
+        lower, upper = edges[i], edges[i + 1] 
+
+        condition = (x >= lower) if i == 0 else (x > lower) 
+
+        if upper is not None: 
+
+            condition = condition & (x <= upper) 
+
+        conditions.append((condition, label)) 
+
+    return conditions 
+
+
+
+def _spark_bins(x: Column, bins: Tuple[Tuple, Tuple]) -> Column:
+    """
+    Função que converte uma coluna do PySpark em faixas com uma expressão `when` encadeada.
+
+    Args:
+        x (Column): Coluna de entrada.
+        bins (Tuple[Tuple, Tuple]): Tupla com os limites e os rótulos das faixas.
+
+    Returns:
+        Column: Coluna com o rótulo da faixa (nulo fora das faixas).
+    """
+
+    conditions = _bins(x, bins) 
+
+    return reduce(lambda expr, c: expr.when(*c), conditions[1:], when(*conditions[0])) 
+
+
+
+def _pandas_bins(x: pd.Series, bins: Tuple[Tuple, Tuple]) -> pd.Series:
+    """
+    Função que converte uma Series do Pandas em faixas com `np.select`.
+
+    Args:
+        x (pd.Series): Series de entrada.
+        bins (Tuple[Tuple, Tuple]): Tupla com os limites e os rótulos das faixas.
+
+    Returns:
+        pd.Series: Series com o rótulo da faixa (nulo fora das faixas).
+    """
+
+    conditions, labels = zip(*_bins(x, bins)) 
+
+    return pd.Series(np.select(conditions, labels, default = None), index = x.index) 
+
+
+
+def _pandas_floordiv(x: pd.Series, divisor: int) -> pd.Series:
+    """
+    Função que calcula a divisão inteira de uma Series do Pandas, mantendo o tipo inteiro
+    mesmo com entradas float (`Int64`, que aceita nulos, quando houver valores ausentes).
+
+    Args:
+        x (pd.Series): Series de entrada.
+        divisor (int): Divisor.
+
+    Returns:
+        pd.Series: Series com a divisão inteira.
+    """
+
+    result = x // divisor 
+
+    return result.astype('Int64' if result.isna().any() else 'int64') 
+
+
+
+SPARK_OPS = {
+    'sum': lambda xs, p: reduce(add, xs), 
+    'diff': lambda xs, p: xs[0] - xs[1], 
+    'flag': lambda xs, p: when(xs[0] > 0, 1).otherwise(0), 
+    'floordiv': lambda xs, p: floor(xs[0] / lit(p)), 
+    'bins': lambda xs, p: _spark_bins(xs[0], p), 
+}
+
+PYTHON_OPS = {
+    'sum': lambda xs, p: reduce(add, xs), 
+    'diff': lambda xs, p: xs[0] - xs[1], 
+    'flag': lambda xs, p: 1 if xs[0] > 0 else 0, 
+    'floordiv': lambda xs, p: None if xs[0] is None else int(xs[0] // p), 
+    'bins': lambda xs, p: next((label for condition, label in _bins(xs[0], p) if condition), None), 
+}
+
+PANDAS_OPS = {
+    'sum': lambda xs, p: reduce(add, xs), 
+    'diff': lambda xs, p: xs[0] - xs[1], 
+    'flag': lambda xs, p: pd.Series(np.where(xs[0] > 0, 1, 0), index = xs[0].index), 
+    'floordiv': lambda xs, p: _pandas_floordiv(xs[0], p), 
+    'bins': lambda xs, p: _pandas_bins(xs[0], p), 
+}
+
+
+
+def resolve(columns: List[str], features: Dict[str, List[Tuple]] = FEATURES) -> Dict[str, Tuple]:
+    """
+    Função que escolhe, para cada feature da especificação, a primeira definição cujas
+    colunas de entrada estão disponíveis, seja no dataset, seja derivadas antes na especificação.
+
+    Features já presentes no dataset não são derivadas novamente (a coluna informada é mantida e
+    pode ser usada como entrada de outras features), assim como as features sem definição possível.
+
+    Args:
+        columns (List[str]): Colunas disponíveis no dataset.
+        features (Dict[str, List[Tuple]], opcional): Especificação das features. Padrão = FEATURES.
+
+    Returns:
+        Dict[str, Tuple]: Dicionário ordenado com a definição (operação, entradas, parâmetro) de cada feature derivada.
+    """
+
+    available = set(columns) 
+
+    resolved = {} 
+
+    for name, definitions in features.items(): 
+
+        if name in available: 
+
+            continue 
+
+        for definition in definitions: 
+
+            if all(c in available for c in definition[1]): 
+
+                resolved[name] = definition 
+
+                available.add(name) 
+
+                break 
+
+    return resolved 
+
+
+
+def _compile(columns: List[str], source: Callable, ops: Dict[str, Callable], features: Dict[str, List[Tuple]]) -> Dict[str, Any]:
+    """
+    Função que compila a especificação em expressões, substituindo as entradas derivadas
+    pelas suas próprias expressões, para que todas dependam apenas das colunas de origem.
+
+    Args:
+        columns (List[str]): Colunas disponíveis no dataset.
+        source (Callable): Função que retorna a coluna de origem a partir do nome.
+        ops (Dict[str, Callable]): Implementação das operações na engine desejada.
+        features (Dict[str, List[Tuple]]): Especificação das features.
+
+    Returns:
+        Dict[str, Any]: Dicionário com a expressão de cada feature derivada.
+    """
+
+    expressions = {} 
+
+    for name, (op, inputs, param) in resolve(columns, features).items(): 
+
+        expressions[name] = ops[op]([expressions[c] if c in expressions else source(c) for c in inputs], param) 
+
+    return expressions 
+
+
+
+def derive_spark(df: DataFrame, features: Dict[str, List[Tuple]] = FEATURES) -> DataFrame:
+    """
+    Função que deriva as features da especificação em um DataFrame do PySpark
+    com uma única projeção (`select`), sem encadear `withColumn`.
+
+    As colunas já existentes com o nome de uma feature derivada são mantidas, e apenas as ausentes são derivadas.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        features (Dict[str, List[Tuple]], opcional): Especificação das features. Padrão = FEATURES.
+
+    Returns:
+        DataFrame: DataFrame com as features derivadas.
+    """
+
+    expressions = _compile(df.columns, col, SPARK_OPS, features) 
+
+    return df.select('*', *[e.alias(c) for c, e in expressions.items()]) 
+
+
+
+def derive_pandas(df: pd.DataFrame, features: Dict[str, List[Tuple]] = FEATURES) -> pd.DataFrame:
+    """
+    Função que deriva as features da especificação em um DataFrame do Pandas
+    com operações vetorizadas do Pandas/NumPy, sem iterar sobre as linhas.
+
+    As colunas já existentes com o nome de uma feature derivada são mantidas, e apenas as ausentes são derivadas.
+
+    Args:
+        df (pd.DataFrame): DataFrame de entrada.
+        features (Dict[str, List[Tuple]], opcional): Especificação das features. Padrão = FEATURES.
+
+    Returns:
+        DataFrame: DataFrame com as features derivadas.
+    """
+
+    expressions = _compile(list(df.columns), lambda c: df[c], PANDAS_OPS, features) 
+
+    return df.assign(**expressions) 
+
+
+
+def derive_record(record: Dict[str, Any], features: Dict[str, List[Tuple]] = FEATURES) -> Dict[str, Any]:
+    """
+    Função que deriva as features da especificação em um único registro (dicionário),
+    com operações escalares do Python, sem o custo de montar um DataFrame para uma linha.
+
+    Args:
+        record (Dict[str, Any]): Registro de entrada.
+        features (Dict[str, List[Tuple]], opcional): Especificação das features. Padrão = FEATURES.
+
+    Returns:
+        Dict[str, Any]: Registro com as features derivadas.
+    """
+
+    expressions = _compile(list(record), lambda c: record[c], PYTHON_OPS, features) 
+
+    return {**record, **expressions} 
\ No newline at end of file
@@ -0,0 +1,157 @@
+import time
+
+from pyspark.errors import AnalysisException
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.functions import *
+from typing import Optional, Tuple
+
+import functions.fn_stats_store_pyspark as fn_stats_store_pyspark
+import functions.fn_storage_pyspark as fn_storage_pyspark
+import params.consts as consts
+
+
+
+CALENDER_COLUMNS = {'Mês': 'Dt_Customer_Month', 'Trimestre': 'Dt_Customer_Quarter'} 
+
+
+
+def prune_calender(dim_calender: DataFrame, dim_customers: DataFrame) -> Optional[DataFrame]:
+    """
+    Função que reduz a dimensão calendário ao intervalo de datas presente nos clientes
+    e apenas às colunas usadas no merge, já renomeadas.
+
+    Args:
+        dim_calender (DataFrame): Dimensão calendário (`consts.DIM_CALENDER_RAW`).
+        dim_customers (DataFrame): Dimensão de clientes (`consts.DIM_CUSTOMERS_RAW`).
+
+    Returns:
+        DataFrame: Calendário podado com as colunas `Data`, `Dt_Customer_Month` e `Dt_Customer_Quarter`,
+            ou None caso não haja datas de cadastro nos clientes.
+    """
+
+    first_date, last_date = dim_customers.agg(min('Dt_Customer'), max('Dt_Customer')).first() 
+
+    if first_date is None: 
+
+        return None 
+
+    calender = ( 
+
+        dim_calender.filter(col('Data').between(first_date, last_date)) 
+
+                    .select('Data', *[col(c).alias(alias) for c, alias in CALENDER_COLUMNS.items()]) 
+
+    )
+
+    return calender 
+
+
+
+def merge_customers_calender(dim_customers: DataFrame, dim_calender: DataFrame) -> DataFrame:
+    """
+    Função que une os clientes ao calendário podado (`Dt_Customer == Data`) com um broadcast join,
+    de forma que a tabela de clientes nunca é embaralhada (shuffle), independente do seu tamanho.
+
+    Args:
+        dim_customers (DataFrame): Dimensão de clientes (`consts.DIM_CUSTOMERS_RAW`).
+        dim_calender (DataFrame): Dimensão calendário (`consts.DIM_CALENDER_RAW`).
+
+    Returns:
+        DataFrame: Dataset raw com as colunas `Dt_Customer_Month` e `Dt_Customer_Quarter`.
+    """
+
+    calender = prune_calender(dim_calender, dim_customers) 
+
+    if calender is None: 
+
+        return dim_customers.select('*', *[lit(None).cast('int').alias(alias) for alias in CALENDER_COLUMNS.values()]) 
+
+    dataset_raw = ( 
+
+        dim_customers.join(broadcast(calender), dim_customers['Dt_Customer'] == calender['Data'], how = 'left') 
+
+                     .drop('Data') 
+
+    )
+
+    return dataset_raw 
+
+
+
+def ingest_dataset_raw(dim_customers: Optional[DataFrame] = None, incremental: bool = False, layers: Tuple[str, ...] = ('raw', 'bronze'), update_stats: bool = False, spark: Optional[SparkSession] = None) -> None:
+    """
+    Função que executa a etapa de sourcing: lê as dimensões de clientes e calendário,
+    faz o merge com o calendário podado via broadcast e grava o resultado nas camadas informadas.
+
+    No modo incremental, apenas os clientes cujo `ID` ainda não existe na camada raw são unidos
+    ao calendário e acrescentados (append) às camadas. Os IDs existentes são lidos com pushdown
+    de coluna e enviados por broadcast no anti join, também sem shuffle dos clientes. Por isso a
+    camada raw é sempre a última a ser gravada.
+
+    Com `update_stats`, os sketches dos dados gravados são acrescentados ao repositório de
+    estatísticas (`fn_stats_store_pyspark`) como um novo lote, de forma que as estatísticas das
+    camadas são atualizadas a partir apenas dos clientes novos. No modo de sobrescrita, os
+    sketches anteriores das camadas são descartados. Nesse caso, o dataset é mantido em cache
+    (memória e disco) durante as gravações e o cálculo dos sketches, para que a leitura do CSV, o
+    merge e o anti join não sejam recalculados a cada uso, e os sketches são calculados uma única
+    vez por particionamento das camadas.
+
+    Args:
+        dim_customers (DataFrame, opcional): Clientes a serem ingeridos. Se None, lê
+            `consts.DIM_CUSTOMERS_RAW`. Padrão = None.
+        incremental (bool, opcional): Se True, acrescenta apenas os clientes novos. Se False,
+            sobrescreve as camadas. Padrão = False.
+        layers (Tuple[str, ...], opcional): Camadas de `consts.LAYERS` a serem gravadas. Padrão = ('raw', 'bronze').
+        update_stats (bool, opcional): Se True, atualiza o repositório de estatísticas das camadas. Padrão = False.
+        spark (SparkSession, opcional): Sessão do Spark. Se None, usa a sessão ativa. Padrão = None.
+    """
+
+    spark = spark or SparkSession.getActiveSession() or SparkSession.builder.getOrCreate() 
+
+    if dim_customers is None: 
+
+        dim_customers = fn_storage_pyspark.read_csv(consts.DIM_CUSTOMERS_RAW, sep = ',', spark = spark) 
+
+    dim_calender = fn_storage_pyspark.read_csv(consts.DIM_CALENDER_RAW, sep = ';', spark = spark) 
+
+    mode = 'overwrite' 
+
+    if incremental: 
+
+        try: 
+
+            existing_ids = fn_storage_pyspark.read_layer('raw', columns = ['ID'], spark = spark) 
+
+            dim_customers = dim_customers.join(broadcast(existing_ids), on = 'ID', how = 'left_anti') 
+
+            mode = 'append' 
+
+        except AnalysisException: 
+
+            pass 
+
+    dataset_raw = merge_customers_calender(dim_customers, dim_calender) 
+
+    if update_stats: 
+
+        dataset_raw = dataset_raw.cache() 
+
+    try: 
+
+        for layer in sorted(layers, key = lambda l: l == 'raw'): 
+
+            fn_storage_pyspark.write_layer(dataset_raw, layer, mode = mode) 
+
+        if update_stats and mode == 'overwrite': 
+
+            fn_stats_store_pyspark.rebuild(dataset_raw, layers) 
+
+        elif update_stats: 
+
+            fn_stats_store_pyspark.update(dataset_raw, layers, time.strftime('%Y-%m-%dT%H:%M:%S')) 
+
+    finally: 
+
+        if update_stats: 
+
+            dataset_raw.unpersist() 
@@ -0,0 +1,243 @@
+from multiprocessing.pool import ThreadPool
+
+from pyspark.ml import Pipeline, PipelineModel
+from pyspark.ml.classification import LogisticRegression
+from pyspark.ml.clustering import KMeans
+from pyspark.ml.evaluation import BinaryClassificationEvaluator, ClusteringEvaluator
+from pyspark.ml.feature import OneHotEncoder, MinMaxScaler, PCA, SQLTransformer, StandardScaler, StringIndexer, UnivariateFeatureSelector, VectorAssembler
+from pyspark.ml.tuning import CrossValidator, CrossValidatorModel, ParamGridBuilder
+from pyspark.sql import DataFrame
+from pyspark.sql.functions import *
+from typing import Dict, List, Sequence, Tuple, Union
+
+import params.consts as consts
+
+
+
+def pre_processing_stages(one_hot_encoder_columns: List[str], standard_scaler_columns: List[str], power_transformer_columns: List[str], min_max_scaler_columns: List[str], output_col: str = 'features') -> List:
+    """
+    Função que monta os estágios do `pyspark.ml` equivalentes ao `ColumnTransformer` dos notebooks 06 e 08.
+
+    - One Hot Encoder: `StringIndexer` + `OneHotEncoder` (sem descartar a última categoria, como no Scikit-Learn).
+    - Standard Scaler: `StandardScaler` com média e desvio padrão.
+    - Power Transformer: `log1p` (via `SQLTransformer`) seguido de `StandardScaler`, substituto do
+      Yeo-Johnson para as colunas de contagem e gasto, que são não negativas.
+    - Min Max Scaler: `MinMaxScaler`.
+
+    Args:
+        one_hot_encoder_columns (List[str]): Colunas categóricas.
+        standard_scaler_columns (List[str]): Colunas padronizadas.
+        power_transformer_columns (List[str]): Colunas com transformação de potência.
+        min_max_scaler_columns (List[str]): Colunas normalizadas entre 0 e 1.
+        output_col (str, opcional): Nome da coluna vetorial de saída. Padrão = 'features'.
+
+    Returns:
+        List: Lista de estágios do `pyspark.ml`.
+    """
+
+    indexed = [f'{c}_index' for c in one_hot_encoder_columns] 
+
+    encoded = [f'{c}_one_hot' for c in one_hot_encoder_columns] 
+
+    logs = ', '.join(f'LN(1 + GREATEST(`{c}`, 0)) AS `{c}_log`' for c in power_transformer_columns) 
+
+    stages = [ 
+
+        StringIndexer(inputCols = one_hot_encoder_columns, outputCols = indexed, handleInvalid = 'keep', stringOrderType = 'alphabetAsc'), 
+
+        OneHotEncoder(inputCols = indexed, outputCols = encoded, dropLast = False, handleInvalid = 'keep'), 
+
+        VectorAssembler(inputCols = standard_scaler_columns, outputCol = '_standard_raw'), 
+
+        StandardScaler(inputCol = '_standard_raw', outputCol = '_standard', withMean = True, withStd = True), 
+
+        SQLTransformer(statement = f'SELECT *, {logs} FROM __THIS__'), 
+
+        VectorAssembler(inputCols = [f'{c}_log' for c in power_transformer_columns], outputCol = '_power_raw'), 
+
+        StandardScaler(inputCol = '_power_raw', outputCol = '_power', withMean = True, withStd = True), 
+
+        VectorAssembler(inputCols = min_max_scaler_columns, outputCol = '_min_max_raw'), 
+
+        MinMaxScaler(inputCol = '_min_max_raw', outputCol = '_min_max'), 
+
+        VectorAssembler(inputCols = encoded + ['_standard', '_power', '_min_max'], outputCol = output_col), 
+
+    ]
+
+    return stages 
+
+
+
+def clustering_pipeline(one_hot_encoder_columns: List[str], standard_scaler_columns: List[str], power_transformer_columns: List[str], min_max_scaler_columns: List[str], k: int = 3, pca_components: int = 2) -> Pipeline:
+    """
+    Função que monta o pipeline de clusterização do notebook 06 no `pyspark.ml`
+    (pré processamento → PCA → K-Means).
+
+    Args:
+        one_hot_encoder_columns (List[str]): Colunas categóricas.
+        standard_scaler_columns (List[str]): Colunas padronizadas.
+        power_transformer_columns (List[str]): Colunas com transformação de potência.
+        min_max_scaler_columns (List[str]): Colunas normalizadas entre 0 e 1.
+        k (int, opcional): Quantidade de clusters. Padrão = 3.
+        pca_components (int, opcional): Quantidade de componentes do PCA. Padrão = 2.
+
+    Returns:
+        Pipeline: Pipeline do `pyspark.ml` com a coluna de saída `Cluster`.
+    """
+
+    stages = pre_processing_stages(one_hot_encoder_columns, standard_scaler_columns, power_transformer_columns, min_max_scaler_columns) 
+
+    stages += [ 
+
+        PCA(k = pca_components, inputCol = 'features', outputCol = 'pca_features'), 
+
+        KMeans(k = k, featuresCol = 'pca_features', predictionCol = 'Cluster', seed = consts.RANDOM_STATE), 
+
+    ]
+
+    return Pipeline(stages = stages) 
+
+
+
+def select_k(df: DataFrame, k_values: Sequence[int] = range(2, 11), features_col: str = 'features', parallelism: int = 4) -> Tuple[Dict[int, float], List[float], Sequence[int]]:
+    """
+    Função que executa a varredura de k do método do cotovelo e do método da silhueta no cluster,
+    submetendo os jobs de treino do K-Means de cada k ao mesmo tempo (como o `CrossValidator`).
+
+    A inércia vem do `trainingCost` do modelo e a silhueta do `ClusteringEvaluator`, que no
+    Spark é calculada em O(n) com a distância euclidiana ao quadrado.
+
+    Args:
+        df (DataFrame): DataFrame com a coluna vetorial de features (ex.: saída de `pre_processing_stages`).
+        k_values (Sequence[int], opcional): Valores de k testados. Padrão = range(2, 11).
+        features_col (str, opcional): Coluna vetorial de features. Padrão = 'features'.
+        parallelism (int, opcional): Quantidade de jobs submetidos ao mesmo tempo. Padrão = 4.
+
+    Returns:
+        tuple: Uma tupla contendo o dicionário de inércias (`elbow`), a lista de silhuetas (`silhouette`)
+            e os valores de k (`k_values`), no formato de `fn_charts_pandas.lineplot_elbow_silhouette`.
+    """
+
+    df = df.select(features_col).cache() 
+
+    evaluator = ClusteringEvaluator(featuresCol = features_col, predictionCol = 'Cluster') 
+
+    def fit(k: int) -> Tuple[float, float]: 
+
+        model = KMeans(k = k, featuresCol = features_col, predictionCol = 'Cluster', seed = consts.RANDOM_STATE).fit(df) 
+
+        return model.summary.trainingCost, evaluator.evaluate(model.transform(df)) 
+
+    with ThreadPool(parallelism) as pool: 
+
+        results = pool.map(fit, k_values) 
+
+    df.unpersist() 
+
+    return {k: r[0] for k, r in zip(k_values, results)}, [r[1] for r in results], k_values 
+
+
+
+def with_class_weights(df: DataFrame, label: str = 'Response', weight_col: str = 'weight') -> DataFrame:
+    """
+    Função que adiciona pesos balanceados por classe (`n / (n_classes * n_classe)`), substituindo
+    o `RandomUnderSampler` sem descartar linhas.
+
+    Args:
+        df (DataFrame): DataFrame de treino.
+        label (str, opcional): Coluna alvo. Padrão = 'Response'.
+        weight_col (str, opcional): Nome da coluna de peso. Padrão = 'weight'.
+
+    Returns:
+        DataFrame: DataFrame com a coluna de peso.
+    """
+
+    counts = {r[label]: r['count'] for r in df.groupBy(label).count().collect()} 
+
+    total = sum(counts.values()) 
+
+    weights = create_map(*[lit(x) for c, n in counts.items() for x in (c, total / (len(counts) * n))]) 
+
+    return df.select('*', weights[col(label)].alias(weight_col)) 
+
+
+
+def classification_cross_validator(one_hot_encoder_columns: List[str], standard_scaler_columns: List[str], power_transformer_columns: List[str], min_max_scaler_columns: List[str], label: str = 'Response', num_top_features: Sequence[int] = (10, 15, 20, 25), reg_params: Sequence[float] = (0.001, 0.01, 0.1, 1.0, 10.0), elastic_net_params: Sequence[float] = (0.0, 0.5, 1.0), num_folds: int = 5, parallelism: int = 4) -> CrossValidator:
+    """
+    Função que monta o equivalente no `pyspark.ml` do `GridSearchCV` do notebook 08
+    (pré processamento → seleção de features por ANOVA → regressão logística), com os
+    modelos do grid treinados em paralelo pelo `CrossValidator`.
+
+    O `UnivariateFeatureSelector` com features contínuas e alvo categórico usa o teste F da ANOVA,
+    o mesmo do `SelectKBest(f_classif)`. O `elasticNetParam` cobre as penalidades l2 (0), l1 (1)
+    e elasticnet, e o balanceamento é feito com a coluna `weight` de `with_class_weights`.
+
+    Args:
+        one_hot_encoder_columns (List[str]): Colunas categóricas.
+        standard_scaler_columns (List[str]): Colunas padronizadas.
+        power_transformer_columns (List[str]): Colunas com transformação de potência.
+        min_max_scaler_columns (List[str]): Colunas normalizadas entre 0 e 1.
+        label (str, opcional): Coluna alvo. Padrão = 'Response'.
+        num_top_features (Sequence[int], opcional): Quantidades de features avaliadas. Padrão = (10, 15, 20, 25).
+        reg_params (Sequence[float], opcional): Valores de regularização avaliados. Padrão = (0.001, 0.01, 0.1, 1.0, 10.0).
+        elastic_net_params (Sequence[float], opcional): Valores de mistura l1/l2 avaliados. Padrão = (0.0, 0.5, 1.0).
+        num_folds (int, opcional): Quantidade de folds da validação cruzada. Padrão = 5.
+        parallelism (int, opcional): Quantidade de modelos treinados ao mesmo tempo. Padrão = 4.
+
+    Returns:
+        CrossValidator: Validação cruzada pronta para o `fit`, otimizando a área sob a curva precisão-recall.
+    """
+
+    stages = pre_processing_stages(one_hot_encoder_columns, standard_scaler_columns, power_transformer_columns, min_max_scaler_columns) 
+
+    selector = UnivariateFeatureSelector(featuresCol = 'features', outputCol = 'selected_features', labelCol = label, selectionMode = 'numTopFeatures') 
+
+    selector.setFeatureType('continuous').setLabelType('categorical') 
+
+    model = LogisticRegression(featuresCol = 'selected_features', labelCol = label, weightCol = 'weight', predictionCol = 'prediction') 
+
+    grid = ( 
+
+        ParamGridBuilder() 
+
+            .addGrid(selector.selectionThreshold, [float(n) for n in num_top_features]) 
+
+            .addGrid(model.regParam, list(reg_params)) 
+
+            .addGrid(model.elasticNetParam, list(elastic_net_params)) 
+
+            .build() 
+
+    )
+
+    cross_validator = CrossValidator( 
+
+        estimator = Pipeline(stages = stages + [selector, model]), 
+
+        estimatorParamMaps = grid, 
+
+        evaluator = BinaryClassificationEvaluator(labelCol = label, metricName = 'areaUnderPR'), 
+
+        numFolds = num_folds, 
+
+        parallelism = parallelism, 
+
+        seed = consts.RANDOM_STATE, 
+
+    )
+
+    return cross_validator 
+
+
+
+def save_model(model: Union[PipelineModel, CrossValidatorModel], path: str) -> None:
+    """
+    Função que salva um modelo do `pyspark.ml`, sobrescrevendo a versão anterior.
+
+    Args:
+        model (PipelineModel | CrossValidatorModel): Modelo treinado.
+        path (str): Caminho de saída (ex.: `consts.MODEL_CLASSIFICATION_SPARK_ML`).
+    """
+
+    model.write().overwrite().save(path) 
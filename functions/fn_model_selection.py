@@ -0,0 +1,349 @@
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import joblib as jb
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV, HalvingRandomSearchCV, StratifiedKFold
+
+import params.consts as consts
+
+
+
+SCORING = ['accuracy', 'precision', 'recall', 'roc_auc', 'average_precision']
+
+
+
+def data_hash(X: pd.DataFrame, y: pd.Series) -> str:
+    """
+    Função que calcula uma assinatura do conteúdo dos dados (valores, colunas e tipos),
+    usada como parte da chave do cache dos folds.
+
+    Args:
+        X (pd.DataFrame): Valores de X.
+        y (pd.Series): Variável alvo.
+
+    Returns:
+        str: Hash SHA-256 dos dados.
+    """
+
+    digest = hashlib.sha256() 
+
+    digest.update(repr([(c, str(t)) for c, t in X.dtypes.items()]).encode()) 
+
+    digest.update(pd.util.hash_pandas_object(X, index = False).values.tobytes()) 
+
+    digest.update(pd.util.hash_pandas_object(y, index = False).values.tobytes()) 
+
+    return digest.hexdigest() 
+
+
+
+def task_key(data_signature: str, estimator: Any, fold: int, n_splits: int, scoring: Sequence[str]) -> str:
+    """
+    Função que monta a chave do cache de um fold: hash dos dados, dos parâmetros do pipeline
+    (não treinado), do fold e da configuração da validação cruzada.
+
+    Args:
+        data_signature (str): Hash dos dados (`data_hash`).
+        estimator (Any): Pipeline não treinado.
+        fold (int): Índice do fold.
+        n_splits (int): Quantidade de folds.
+        scoring (Sequence[str]): Métricas avaliadas.
+
+    Returns:
+        str: Chave do cache.
+    """
+
+    return jb.hash((data_signature, clone(estimator), fold, n_splits, consts.RANDOM_STATE, sorted(scoring))) 
+
+
+
+def fit_fold(estimator: Any, X: pd.DataFrame, y: pd.Series, train: np.ndarray, test: np.ndarray, scoring: Sequence[str], memory: bool = False) -> Dict[str, float]:
+    """
+    Função que treina e avalia o pipeline em um fold, medindo os tempos de treino e de previsão
+    e o pico de memória alocada durante o treino e a avaliação.
+
+    O pico de memória é medido com o `tracemalloc`, que acompanha as alocações do Python e do NumPy
+    (não as de bibliotecas nativas com alocador próprio). Como o rastreamento deixa as alocações mais
+    lentas, ele é feito em um segundo treino e avaliação, fora dos tempos medidos.
+
+    Args:
+        estimator (Any): Pipeline não treinado.
+        X (pd.DataFrame): Valores de X.
+        y (pd.Series): Variável alvo.
+        train (np.ndarray): Índices de treino.
+        test (np.ndarray): Índices de teste.
+        scoring (Sequence[str]): Métricas avaliadas.
+        memory (bool, opcional): Se True, mede o pico de memória (com um treino adicional). Padrão = False.
+
+    Returns:
+        Dict[str, float]: Dicionário com `fit_time`, `score_time`, `peak_memory_mb` e `test_<métrica>`.
+    """
+
+    template, estimator = estimator, clone(estimator) 
+
+    start = time.perf_counter() 
+
+    estimator.fit(X.iloc[train], y.iloc[train]) 
+
+    fit_time = time.perf_counter() - start 
+
+    start = time.perf_counter() 
+
+    scores = check_scoring(estimator, scoring = list(scoring))(estimator, X.iloc[test], y.iloc[test]) 
+
+    score_time = time.perf_counter() - start 
+
+    peak = np.nan 
+
+    if memory: 
+
+        tracemalloc.start() 
+
+        estimator = clone(template).fit(X.iloc[train], y.iloc[train]) 
+
+        check_scoring(estimator, scoring = list(scoring))(estimator, X.iloc[test], y.iloc[test]) 
+
+        peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2 
+
+        tracemalloc.stop() 
+
+    return {'fit_time': fit_time, 'score_time': score_time, 'peak_memory_mb': peak, **{f'test_{k}': v for k, v in scores.items()}} 
+
+
+
+def _cached_fit_fold(path: str, estimator: Any, X: pd.DataFrame, y: pd.Series, train: np.ndarray, test: np.ndarray, scoring: Sequence[str], memory: bool) -> Dict[str, float]:
+    """
+    Função que executa `fit_fold` e grava o resultado no cache de forma atômica
+    (arquivo temporário + `os.replace`), para que uma execução interrompida não deixe resultados parciais.
+
+    Args:
+        path (str): Caminho do resultado no cache.
+        estimator (Any): Pipeline não treinado.
+        X (pd.DataFrame): Valores de X.
+        y (pd.Series): Variável alvo.
+        train (np.ndarray): Índices de treino.
+        test (np.ndarray): Índices de teste.
+        scoring (Sequence[str]): Métricas avaliadas.
+        memory (bool): Se True, mede o pico de memória.
+
+    Returns:
+        Dict[str, float]: Resultado do fold.
+    """
+
+    result = fit_fold(estimator, X, y, train, test, scoring, memory) 
+
+    temp = f'{path}.{os.getpid()}.tmp' 
+
+    jb.dump(result, temp) 
+
+    os.replace(temp, path) 
+
+    return result 
+
+
+
+def run_benchmark(models: Dict[str, Any], X: pd.DataFrame, y: pd.Series, build_pipeline: Callable[[Any], Any], n_splits: int = 5, scoring: Sequence[str] = SCORING, n_jobs: int = -2, backend: Optional[str] = None, cache_dir: Optional[str] = consts.MODEL_SELECTION_CACHE, memory: bool = False) -> pd.DataFrame:
+    """
+    Função que compara os modelos com validação cruzada estratificada, distribuindo as tarefas
+    (modelo × fold) em um pool de processos do joblib.
+
+    O resultado de cada tarefa é salvo em disco com uma chave formada pelo hash dos dados e dos
+    parâmetros do pipeline, de forma que uma nova execução só treina os folds cujos dados ou
+    parâmetros mudaram, e uma execução interrompida é retomada do ponto em que parou.
+
+    Args:
+        models (Dict[str, Any]): Dicionário nome → modelo (não treinado).
+        X (pd.DataFrame): Valores de X.
+        y (pd.Series): Variável alvo.
+        build_pipeline (Callable[[Any], Any]): Função que recebe o modelo e retorna o pipeline completo.
+        n_splits (int, opcional): Quantidade de folds. Padrão = 5.
+        scoring (Sequence[str], opcional): Métricas avaliadas. Padrão = SCORING.
+        n_jobs (int, opcional): Quantidade de processos. Padrão = -2 (todos os núcleos menos um).
+        backend (str, opcional): Backend do joblib (ex.: 'spark', após `joblibspark.register_spark()`,
+            para distribuir as tarefas no cluster). Se None, usa o pool de processos local. Padrão = None.
+        cache_dir (str, opcional): Diretório do cache. Se None, não usa cache. Padrão = consts.MODEL_SELECTION_CACHE.
+        memory (bool, opcional): Se True, mede o pico de memória de cada tarefa, em um treino
+            adicional fora dos tempos medidos. Padrão = False.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha por modelo e fold, com os tempos de treino e previsão,
+            o tempo total (`time`), o pico de memória, as métricas e a coluna `cached`.
+    """
+
+    folds = list(StratifiedKFold(n_splits = n_splits, shuffle = True, random_state = consts.RANDOM_STATE).split(X, y)) 
+
+    signature = data_hash(X, y) 
+
+    if cache_dir is not None: 
+
+        os.makedirs(cache_dir, exist_ok = True) 
+
+    rows: List[Tuple[str, int, bool]] = [] 
+
+    results: List[Optional[Dict[str, float]]] = [] 
+
+    tasks, pending = [], [] 
+
+    for name, model in models.items(): 
+
+        estimator = build_pipeline(model) 
+
+        for fold, (train, test) in enumerate(folds): 
+
+            path = None if cache_dir is None else os.path.join(cache_dir, f'{task_key(signature, estimator, fold, n_splits, scoring)}.joblib') 
+
+            cached = path is not None and os.path.exists(path) 
+
+            rows.append((name, fold, cached)) 
+
+            results.append(jb.load(path) if cached else None) 
+
+            if not cached: 
+
+                pending.append(len(results) - 1) 
+
+                task = _cached_fit_fold if path is not None else fit_fold 
+
+                args = (path,) if path is not None else () 
+
+                tasks.append(delayed(task)(*args, estimator, X, y, train, test, scoring, memory)) 
+
+    if tasks: 
+
+        with Parallel(n_jobs = n_jobs, backend = backend) as parallel: 
+
+            for i, result in zip(pending, parallel(tasks)): 
+
+                results[i] = result 
+
+    df_metrics = pd.DataFrame([{'model': n, 'fold': f, **r, 'cached': c} for (n, f, c), r in zip(rows, results)]) 
+
+    df_metrics['time'] = df_metrics['fit_time'] + df_metrics['score_time'] 
+
+    return df_metrics 
+
+
+
+def search_report(search: Any, wall_time: float) -> Dict[str, Any]:
+    """
+    Função que resume uma busca de hiperparâmetros: melhores parâmetros, melhor score e o custo
+    de cada etapa (iteração do successive halving, ou a etapa única do grid search).
+
+    Args:
+        search (Any): Busca já treinada (`GridSearchCV`, `HalvingGridSearchCV` ou `HalvingRandomSearchCV`).
+        wall_time (float): Tempo total da busca, em segundos.
+
+    Returns:
+        Dict[str, Any]: Dicionário serializável em JSON com o resumo da busca.
+    """
+
+    df_results = pd.DataFrame(search.cv_results_) 
+
+    if 'iter' not in df_results: 
+
+        df_results['iter'] = 0 
+
+        df_results['n_resources'] = np.nan 
+
+    stages = [] 
+
+    for iteration, df_stage in df_results.groupby('iter'): 
+
+        stages.append({ 
+            'iter': int(iteration), 
+            'n_candidates': int(len(df_stage)), 
+            'n_resources': None if pd.isna(df_stage['n_resources'].iloc[0]) else int(df_stage['n_resources'].iloc[0]), 
+            'fit_time': float(df_stage['mean_fit_time'].sum() * search.n_splits_), 
+            'score_time': float(df_stage['mean_score_time'].sum() * search.n_splits_), 
+            'best_score': float(df_stage['mean_test_score'].max()), 
+        })
+
+    report = { 
+        'search': type(search).__name__, 
+        'best_params': {k: v.item() if hasattr(v, 'item') else v for k, v in search.best_params_.items()}, 
+        'best_score': float(search.best_score_), 
+        'n_candidates': int(len(df_results)), 
+        'wall_time': wall_time, 
+        'stages': stages, 
+    }
+
+    return report 
+
+
+
+def search(pipeline: Any, param_grid: Dict[str, Any], X: pd.DataFrame, y: pd.Series, mode: str = 'halving_grid', scoring: str = 'average_precision', cv: int = 5, factor: int = 3, n_candidates: Any = 'exhaust', n_jobs: int = -2, cache_dir: Optional[str] = consts.PIPELINE_CACHE, report_path: Optional[str] = consts.SEARCH_CLASSIFICATION_REPORT) -> Any:
+    """
+    Função que executa a busca de hiperparâmetros do pipeline de classificação.
+
+    No modo 'halving_grid' (ou 'halving_random'), todos os candidatos começam avaliados em uma
+    pequena amostra, e a cada etapa só o melhor 1 / `factor` dos candidatos segue, com `factor`
+    vezes mais dados, até a base completa. O modo 'grid' mantém a busca exaustiva.
+
+    Os transformadores do pipeline são cacheados em disco (`memory` do Pipeline), de forma que o
+    `ColumnTransformer` é treinado uma única vez por fold e amostra, e não uma vez por candidato.
+    O cache é removido do melhor estimador antes da exportação.
+
+    Args:
+        pipeline (Any): Pipeline (Scikit-Learn ou imblearn) não treinado.
+        param_grid (Dict[str, Any]): Espaço de busca (listas de valores ou distribuições, no modo 'halving_random').
+        X (pd.DataFrame): Valores de X.
+        y (pd.Series): Variável alvo.
+        mode (str, opcional): 'halving_grid', 'halving_random' ou 'grid'. Padrão = 'halving_grid'.
+        scoring (str, opcional): Métrica otimizada. Padrão = 'average_precision'.
+        cv (int, opcional): Quantidade de folds. Padrão = 5.
+        factor (int, opcional): Proporção de eliminação entre as etapas do halving. Padrão = 3.
+        n_candidates (Any, opcional): Quantidade de candidatos sorteados no modo 'halving_random'. Padrão = 'exhaust'.
+        n_jobs (int, opcional): Quantidade de processos. Padrão = -2 (todos os núcleos menos um).
+        cache_dir (str, opcional): Diretório do cache dos transformadores. Se None, não usa cache. Padrão = consts.PIPELINE_CACHE.
+        report_path (str, opcional): Caminho do resumo em JSON (melhores parâmetros e tempos por etapa).
+            Se None, não grava o resumo. Padrão = consts.SEARCH_CLASSIFICATION_REPORT.
+
+    Returns:
+        Any: Busca treinada, com o relatório no atributo `report_`.
+    """
+
+    pipeline = clone(pipeline).set_params(memory = None if cache_dir is None else Memory(cache_dir, verbose = 0)) 
+
+    if mode == 'halving_grid': 
+
+        searcher = HalvingGridSearchCV(pipeline, param_grid, factor = factor, cv = cv, scoring = scoring, n_jobs = n_jobs, random_state = consts.RANDOM_STATE) 
+
+    elif mode == 'halving_random': 
+
+        searcher = HalvingRandomSearchCV(pipeline, param_grid, n_candidates = n_candidates, factor = factor, cv = cv, scoring = scoring, n_jobs = n_jobs, random_state = consts.RANDOM_STATE) 
+
+    elif mode == 'grid': 
+
+        searcher = GridSearchCV(pipeline, param_grid, cv = cv, scoring = scoring, n_jobs = n_jobs) 
+
+    else: 
+
+        raise ValueError(f'Modo de busca desconhecido: "{mode}". Modos disponíveis: halving_grid, halving_random, grid.') 
+
+    start = time.perf_counter() 
+
+    searcher.fit(X, y) 
+
+    wall_time = time.perf_counter() - start 
+
+    searcher.best_estimator_.set_params(memory = None) 
+
+    searcher.report_ = search_report(searcher, wall_time) 
+
+    if report_path is not None: 
+
+        with open(report_path, 'w') as file: 
+
+            json.dump(searcher.report_, file, indent = 4, default = str) 
+
+    return searcher 
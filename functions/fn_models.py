@@ -0,0 +1,73 @@
+import os
+from typing import Any, Dict, Tuple
+
+import joblib as jb
+
+import params.consts as consts
+
+
+
+_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {} 
+
+
+
+def artifact_path(name: str) -> str: 
+    """
+    Função que retorna o caminho de um artefato de modelo registrado em `consts.MODELS`.
+
+    Args:
+        name (str): Nome do artefato (ex.: 'classification').
+
+    Returns:
+        str: Caminho do artefato.
+    """
+
+    if name not in consts.MODELS: 
+
+        raise KeyError(f'Modelo desconhecido: "{name}". Modelos disponíveis: {list(consts.MODELS)}.') 
+
+    return consts.MODELS[name] 
+
+
+
+def artifact_version(path: str) -> Tuple[int, int]: 
+    """
+    Função que identifica a versão de um artefato pelo seu mtime (em nanossegundos) e tamanho,
+    sem precisar ler o arquivo.
+
+    Args:
+        path (str): Caminho do artefato.
+
+    Returns:
+        Tuple[int, int]: Tupla (mtime_ns, tamanho em bytes).
+    """
+
+    stat = os.stat(path) 
+
+    return stat.st_mtime_ns, stat.st_size 
+
+
+
+def load_model(name: str) -> Any: 
+    """
+    Função que carrega um artefato de modelo registrado em `consts.MODELS`, mantendo-o em cache
+    no processo. O arquivo só é desserializado novamente quando o seu mtime ou tamanho mudam.
+
+    Args:
+        name (str): Nome do artefato (ex.: 'classification').
+
+    Returns:
+        Any: Modelo carregado.
+    """
+
+    path = artifact_path(name) 
+
+    version = artifact_version(path) 
+
+    cached = _cache.get(path) 
+
+    if cached is None or cached[0] != version: 
+
+        cached = _cache[path] = (version, jb.load(path)) 
+
+    return cached[1] 
@@ -0,0 +1,318 @@
+import json
+import math
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+import params.consts as consts
+
+
+
+def build_baseline(df: pd.DataFrame, features: Dict[str, str] = consts.MONITORING_FEATURES, bins: int = 10, grid_size: int = 101) -> Dict[str, Any]:
+    """
+    Função que gera o baseline compacto das features a partir dos dados de treino: faixas por
+    quantis e frequências para as features numéricas, frequências por categoria para as
+    categóricas, taxa de nulos e um resumo de quantis usado no teste KS.
+
+    Args:
+        df (pd.DataFrame): DataFrame de treino.
+        features (Dict[str, str], opcional): Dicionário feature → tipo ('numeric' ou 'categorical').
+            Padrão = consts.MONITORING_FEATURES.
+        bins (int, opcional): Quantidade de faixas das features numéricas. Padrão = 10.
+        grid_size (int, opcional): Quantidade de percentis do resumo de quantis. Padrão = 101.
+
+    Returns:
+        Dict[str, Any]: Baseline das features.
+    """
+
+    baseline = {'rows': len(df), 'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'features': {}} 
+
+    for feature, kind in features.items(): 
+
+        values = df[feature] 
+
+        entry = {'type': kind, 'null_rate': float(values.isna().mean())} 
+
+        values = values.dropna() 
+
+        if kind == 'numeric': 
+
+            values = values.to_numpy(dtype = float) 
+
+            entry['edges'] = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1])).tolist() 
+
+            entry['quantiles'] = np.quantile(values, np.linspace(0, 1, grid_size)).tolist() 
+
+            counts = np.bincount(np.searchsorted(entry['edges'], values, side = 'right'), minlength = len(entry['edges']) + 1) 
+
+        else: 
+
+            frequencies = values.value_counts() 
+
+            entry['categories'] = frequencies.index.tolist() 
+
+            counts = np.append(frequencies.to_numpy(), 0) 
+
+        entry['frequencies'] = (counts / max(counts.sum(), 1)).tolist() 
+
+        baseline['features'][feature] = entry 
+
+    return baseline 
+
+
+
+def save_baseline(baseline: Dict[str, Any], path: str = consts.MONITORING_BASELINE) -> None:
+    """
+    Função que grava o baseline das features em JSON.
+
+    Args:
+        baseline (Dict[str, Any]): Baseline das features.
+        path (str, opcional): Caminho do baseline. Padrão = consts.MONITORING_BASELINE.
+    """
+
+    with open(path, 'w') as file: 
+
+        json.dump(baseline, file, indent = 4, default = lambda x: x.item()) 
+
+
+
+def load_baseline(path: str = consts.MONITORING_BASELINE) -> Dict[str, Any]:
+    """
+    Função que lê o baseline das features.
+
+    Args:
+        path (str, opcional): Caminho do baseline. Padrão = consts.MONITORING_BASELINE.
+
+    Returns:
+        Dict[str, Any]: Baseline das features.
+    """
+
+    with open(path) as file: 
+
+        return json.load(file) 
+
+
+
+def profile(df: pd.DataFrame, baseline: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Função que resume um lote de dados nas mesmas faixas e categorias do baseline, de forma vetorizada
+    (`np.searchsorted` e `np.bincount` nas features numéricas e `isin` nas categóricas).
+
+    Args:
+        df (pd.DataFrame): Lote de dados a ser pontuado.
+        baseline (Dict[str, Any]): Baseline das features.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Dicionário feature → quantidade de linhas, nulos, contagens por faixa
+            ou categoria (a última posição das categóricas conta as categorias novas) e resumo de quantis.
+    """
+
+    profiles = {} 
+
+    for feature, entry in baseline['features'].items(): 
+
+        values = df[feature] 
+
+        nulls = int(values.isna().sum()) 
+
+        values = values.dropna() 
+
+        result = {'rows': len(df), 'nulls': nulls} 
+
+        if entry['type'] == 'numeric': 
+
+            values = values.to_numpy(dtype = float) 
+
+            result['counts'] = np.bincount(np.searchsorted(entry['edges'], values, side = 'right'), minlength = len(entry['edges']) + 1).tolist() 
+
+            result['quantiles'] = np.quantile(values, np.linspace(0, 1, len(entry['quantiles']))).tolist() if len(values) else None 
+
+        else: 
+
+            known = values.isin(entry['categories']) 
+
+            counts = values[known].value_counts().reindex(entry['categories'], fill_value = 0) 
+
+            result['counts'] = counts.tolist() + [int((~known).sum())] 
+
+        profiles[feature] = result 
+
+    return profiles 
+
+
+
+def psi(expected: np.ndarray, actual: np.ndarray, epsilon: float = 1e-4) -> float:
+    """
+    Função que calcula o Population Stability Index entre as frequências do baseline e do lote.
+
+    Args:
+        expected (np.ndarray): Frequências do baseline.
+        actual (np.ndarray): Frequências do lote.
+        epsilon (float, opcional): Frequência mínima, para evitar divisão por zero. Padrão = 1e-4.
+
+    Returns:
+        float: PSI.
+    """
+
+    expected = np.maximum(np.asarray(expected, dtype = float), epsilon) 
+
+    actual = np.maximum(np.asarray(actual, dtype = float), epsilon) 
+
+    return float(np.sum((actual - expected) * np.log(actual / expected))) 
+
+
+
+def ks_statistic(expected_quantiles: np.ndarray, actual_quantiles: np.ndarray) -> float:
+    """
+    Função que calcula a estatística KS (maior distância entre as funções de distribuição acumulada)
+    a partir dos resumos de quantis do baseline e do lote, interpolados linearmente.
+
+    Args:
+        expected_quantiles (np.ndarray): Quantis do baseline em percentis igualmente espaçados.
+        actual_quantiles (np.ndarray): Quantis do lote em percentis igualmente espaçados.
+
+    Returns:
+        float: Estatística KS.
+    """
+
+    values = np.union1d(expected_quantiles, actual_quantiles) 
+
+    cdfs = [np.interp(values, q, np.linspace(0, 1, len(q)), left = 0.0, right = 1.0) for q in (expected_quantiles, actual_quantiles)] 
+
+    return float(np.max(np.abs(cdfs[0] - cdfs[1]))) 
+
+
+
+def drift_report(baseline: Dict[str, Any], profiles: Dict[str, Dict[str, Any]], thresholds: Dict[str, float] = consts.MONITORING_THRESHOLDS) -> pd.DataFrame:
+    """
+    Função que compara o resumo de um lote com o baseline e classifica cada feature.
+
+    Uma feature é marcada como 'drift' quando o PSI passa de `psi_drift`, quando a estatística KS
+    passa do valor crítico do teste com nível `ks_alpha` (e de `ks_min`, para que lotes grandes não
+    sejam bloqueados por diferenças irrelevantes) ou quando a taxa de nulos aumenta mais que
+    `null_rate_drift`. Com PSI acima de `psi_warning`, a feature é marcada como 'warning'.
+
+    O PSI só é usado na classificação a partir de `psi_min_rows` linhas observadas: em lotes
+    pequenos, as faixas vazias inflam o PSI mesmo sem drift (com 10 linhas sorteadas do próprio
+    baseline, o PSI passa de 0.25 em praticamente todos os lotes). Abaixo desse mínimo, o PSI é
+    apenas informado e a classificação depende do teste KS, cujo valor crítico já considera o
+    tamanho do lote, e da taxa de nulos.
+
+    Args:
+        baseline (Dict[str, Any]): Baseline das features.
+        profiles (Dict[str, Dict[str, Any]]): Resumo do lote (`profile`).
+        thresholds (Dict[str, float], opcional): Limites das verificações. Padrão = consts.MONITORING_THRESHOLDS.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha por feature e as colunas `rows`, `psi`, `ks`, `ks_critical`,
+            `null_rate`, `baseline_null_rate` e `status`.
+    """
+
+    c_alpha = math.sqrt(-math.log(thresholds['ks_alpha'] / 2) / 2) 
+
+    rows = [] 
+
+    for feature, entry in baseline['features'].items(): 
+
+        result = profiles[feature] 
+
+        counts = np.asarray(result['counts'], dtype = float) 
+
+        n, m = counts.sum(), baseline['rows'] 
+
+        row = {'feature': feature, 'rows': int(n), 'psi': psi(entry['frequencies'], counts / max(n, 1)), 'ks': np.nan, 'ks_critical': np.nan} 
+
+        row['null_rate'] = result['nulls'] / max(result['rows'], 1) 
+
+        row['baseline_null_rate'] = entry['null_rate'] 
+
+        if entry['type'] == 'numeric' and result.get('quantiles') is not None: 
+
+            row['ks'] = ks_statistic(entry['quantiles'], result['quantiles']) 
+
+            row['ks_critical'] = max(c_alpha * math.sqrt((n + m) / (n * m)), thresholds['ks_min']) 
+
+        psi_checked = n >= thresholds['psi_min_rows'] 
+
+        drift = (psi_checked and row['psi'] >= thresholds['psi_drift']) or row['ks'] > row['ks_critical'] or row['null_rate'] - row['baseline_null_rate'] > thresholds['null_rate_drift'] 
+
+        row['status'] = 'drift' if drift else 'warning' if psi_checked and row['psi'] >= thresholds['psi_warning'] else 'ok' 
+
+        rows.append(row) 
+
+    return pd.DataFrame(rows) 
+
+
+
+def check(report: pd.DataFrame, on_drift: str = 'flag') -> str: 
+    """
+    Função que aplica a política de drift a um relatório: informa as features com drift e,
+    no modo 'block', interrompe a publicação das previsões.
+
+    Args:
+        report (pd.DataFrame): Relatório de drift (`drift_report`).
+        on_drift (str, opcional): 'flag' para apenas informar ou 'block' para levantar um erro. Padrão = 'flag'.
+
+    Returns:
+        str: Situação do lote ('ok', 'warning' ou 'drift').
+    """
+
+    drifted = report.loc[report['status'] == 'drift', 'feature'].unique().tolist() 
+
+    if drifted and on_drift == 'block': 
+
+        raise ValueError(f'Lote bloqueado por drift nas features: {drifted}.') 
+
+    if drifted: 
+
+        print(f'- Drift nas features: {drifted}.') 
+
+    return 'drift' if drifted else 'warning' if (report['status'] == 'warning').any() else 'ok' 
+
+
+
+def write_report(report: pd.DataFrame, path: str = consts.MONITORING_REPORT) -> None: 
+    """
+    Função que grava o relatório de drift em JSON, com a situação geral do lote.
+
+    Args:
+        report (pd.DataFrame): Relatório de drift (`drift_report`).
+        path (str, opcional): Caminho do relatório. Padrão = consts.MONITORING_REPORT.
+    """
+
+    status = 'drift' if (report['status'] == 'drift').any() else 'warning' if (report['status'] == 'warning').any() else 'ok' 
+
+    with open(path, 'w') as file: 
+
+        json.dump({'status': status, 'checked_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'features': report.to_dict('records')}, file, indent = 4) 
+
+
+
+def monitor(df: pd.DataFrame, baseline: Optional[Dict[str, Any]] = None, on_drift: str = 'flag', path: Optional[str] = consts.MONITORING_REPORT) -> pd.DataFrame: 
+    """
+    Função que verifica um lote de dados do Pandas contra o baseline, grava o relatório e aplica
+    a política de drift.
+
+    Args:
+        df (pd.DataFrame): Lote de dados a ser pontuado.
+        baseline (Dict[str, Any], opcional): Baseline das features. Se None, lê `consts.MONITORING_BASELINE`. Padrão = None.
+        on_drift (str, opcional): 'flag' para apenas informar ou 'block' para levantar um erro. Padrão = 'flag'.
+        path (str, opcional): Caminho do relatório em JSON. Se None, não grava. Padrão = consts.MONITORING_REPORT.
+
+    Returns:
+        pd.DataFrame: Relatório de drift.
+    """
+
+    baseline = load_baseline() if baseline is None else baseline 
+
+    report = drift_report(baseline, profile(df, baseline)) 
+
+    if path is not None: 
+
+        write_report(report, path) 
+
+    check(report, on_drift) 
+
+    return report 
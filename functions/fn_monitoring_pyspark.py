@@ -0,0 +1,96 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pyspark.sql import DataFrame
+from pyspark.sql import functions as F
+
+import functions.fn_monitoring as fn_monitoring
+import params.consts as consts
+
+
+
+def profile(df: DataFrame, baseline: Dict[str, Any], accuracy: int = 10000) -> Dict[str, Dict[str, Any]]:
+    """
+    Função que resume um lote de dados do PySpark nas mesmas faixas e categorias do baseline,
+    em uma única agregação: contagens por faixa e categoria, nulos e resumo de quantis (`percentile_approx`).
+
+    Args:
+        df (DataFrame): Lote de dados a ser pontuado.
+        baseline (Dict[str, Any]): Baseline das features.
+        accuracy (int, opcional): Precisão do `percentile_approx`. Padrão = 10000.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Resumo do lote, no mesmo formato de `fn_monitoring.profile`.
+    """
+
+    aggregations = [F.count(F.lit(1)).alias('_rows')] 
+
+    for i, (feature, entry) in enumerate(baseline['features'].items()): 
+
+        value = F.col(feature) 
+
+        aggregations.append(F.count(value).alias(f'_{i}_count')) 
+
+        if entry['type'] == 'numeric': 
+
+            index = sum((F.when(value >= edge, 1).otherwise(0) for edge in entry['edges']), F.lit(0)) 
+
+            aggregations += [F.count(F.when(value.isNotNull() & (index == j), 1)).alias(f'_{i}_bin_{j}') for j in range(len(entry['edges']) + 1)] 
+
+            aggregations.append(F.percentile_approx(value.cast('double'), np.linspace(0, 1, len(entry['quantiles'])).tolist(), accuracy).alias(f'_{i}_quantiles')) 
+
+        else: 
+
+            aggregations += [F.count(F.when(value == F.lit(category), 1)).alias(f'_{i}_bin_{j}') for j, category in enumerate(entry['categories'])] 
+
+    row = df.agg(*aggregations).first() 
+
+    profiles = {} 
+
+    for i, (feature, entry) in enumerate(baseline['features'].items()): 
+
+        observed = row[f'_{i}_count'] 
+
+        if entry['type'] == 'numeric': 
+
+            counts = [row[f'_{i}_bin_{j}'] for j in range(len(entry['edges']) + 1)] 
+
+            profiles[feature] = {'rows': row['_rows'], 'nulls': row['_rows'] - observed, 'counts': counts, 'quantiles': row[f'_{i}_quantiles']} 
+
+        else: 
+
+            counts = [row[f'_{i}_bin_{j}'] for j in range(len(entry['categories']))] 
+
+            profiles[feature] = {'rows': row['_rows'], 'nulls': row['_rows'] - observed, 'counts': counts + [observed - sum(counts)]} 
+
+    return profiles 
+
+
+
+def monitor(df: DataFrame, baseline: Optional[Dict[str, Any]] = None, on_drift: str = 'flag', path: Optional[str] = consts.MONITORING_REPORT) -> pd.DataFrame:
+    """
+    Função que verifica um lote de dados do PySpark contra o baseline, grava o relatório e aplica
+    a política de drift.
+
+    Args:
+        df (DataFrame): Lote de dados a ser pontuado.
+        baseline (Dict[str, Any], opcional): Baseline das features. Se None, lê `consts.MONITORING_BASELINE`. Padrão = None.
+        on_drift (str, opcional): 'flag' para apenas informar ou 'block' para levantar um erro. Padrão = 'flag'.
+        path (str, opcional): Caminho do relatório em JSON. Se None, não grava. Padrão = consts.MONITORING_REPORT.
+
+    Returns:
+        pd.DataFrame: Relatório de drift.
+    """
+
+    baseline = fn_monitoring.load_baseline() if baseline is None else baseline 
+
+    report = fn_monitoring.drift_report(baseline, profile(df, baseline)) 
+
+    if path is not None: 
+
+        fn_monitoring.write_report(report, path) 
+
+    fn_monitoring.check(report, on_drift) 
+
+    return report 
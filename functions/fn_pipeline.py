@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import params.consts as consts
+from functions.fn_state import code_fingerprint, load_state, path_fingerprint, save_state
+from params.stages import STAGES
+
+
+
+def stage_fingerprint(name: str) -> str:
+    """
+    Função que calcula a assinatura de uma etapa: código executado, valores das constantes usadas
+    e assinaturas das entradas.
+
+    Args:
+        name (str): Nome da etapa em `STAGES`.
+
+    Returns:
+        str: Hash SHA-256 da etapa.
+    """
+
+    stage = STAGES[name] 
+
+    executable = stage.get('notebook') or stage['script'] 
+
+    parts = { 
+        'code': {p: code_fingerprint(p) for p in [executable] + stage['code']}, 
+        'args': stage.get('args', []), 
+        'params': {p: repr(getattr(consts, p)) for p in stage['params']}, 
+        'inputs': {p: path_fingerprint(p) for p in stage['inputs']}, 
+    }
+
+    return hashlib.sha256(json.dumps(parts, sort_keys = True).encode()).hexdigest() 
+
+
+
+def dependencies(names: Sequence[str]) -> Dict[str, Set[str]]:
+    """
+    Função que deduz as dependências entre as etapas: uma etapa depende das etapas que gravam as suas entradas.
+
+    Args:
+        names (Sequence[str]): Nomes das etapas.
+
+    Returns:
+        Dict[str, Set[str]]: Dicionário etapa → etapas das quais ela depende.
+    """
+
+    producers = {output: name for name in names for output in STAGES[name]['outputs']} 
+
+    return {name: {producers[i] for i in STAGES[name]['inputs'] if i in producers and producers[i] != name} for name in names} 
+
+
+
+def upstream(targets: Sequence[str]) -> List[str]:
+    """
+    Função que retorna as etapas alvo e todas as etapas das quais elas dependem, na ordem de `STAGES`.
+
+    Args:
+        targets (Sequence[str]): Etapas alvo.
+
+    Returns:
+        List[str]: Etapas necessárias.
+    """
+
+    unknown = [t for t in targets if t not in STAGES] 
+
+    if unknown: 
+
+        raise KeyError(f'Etapas desconhecidas: {unknown}. Etapas disponíveis: {list(STAGES)}.') 
+
+    graph = dependencies(list(STAGES)) 
+
+    selected, pending = set(), list(targets) 
+
+    while pending: 
+
+        name = pending.pop() 
+
+        if name not in selected: 
+
+            selected.add(name) 
+
+            pending.extend(graph[name]) 
+
+    return [name for name in STAGES if name in selected] 
+
+
+
+def is_up_to_date(name: str, fingerprint: str, state: Dict[str, Any]) -> bool:
+    """
+    Função que verifica se uma etapa está atualizada: a assinatura é a mesma da última execução
+    bem sucedida e todas as saídas existem.
+
+    Args:
+        name (str): Nome da etapa.
+        fingerprint (str): Assinatura atual da etapa.
+        state (Dict[str, Any]): Estado das etapas.
+
+    Returns:
+        bool: True se a etapa pode ser pulada.
+    """
+
+    return state.get(name, {}).get('fingerprint') == fingerprint and all(os.path.exists(p) for p in STAGES[name]['outputs']) 
+
+
+
+def execute(name: str) -> float:
+    """
+    Função que executa uma etapa em um subprocesso: notebooks com o `nbconvert` (as saídas são
+    gravadas no próprio notebook) e scripts com o interpretador atual, a partir do diretório do arquivo.
+
+    Args:
+        name (str): Nome da etapa.
+
+    Returns:
+        float: Tempo de execução, em segundos.
+    """
+
+    stage = STAGES[name] 
+
+    if 'notebook' in stage: 
+
+        path = os.path.abspath(stage['notebook']) 
+
+        command = [sys.executable, '-m', 'jupyter', 'nbconvert', '--to', 'notebook', '--execute', '--inplace', path] 
+
+    else: 
+
+        path = os.path.abspath(stage['script']) 
+
+        command = [sys.executable, path, *stage.get('args', [])] 
+
+    start = time.perf_counter() 
+
+    subprocess.run(command, cwd = os.path.dirname(path), check = True) 
+
+    return time.perf_counter() - start 
+
+
+
+def run(targets: Optional[Sequence[str]] = None, force: bool = False, workers: int = 2, dry_run: bool = False) -> Dict[str, str]:
+    """
+    Função que executa as etapas do pipeline em ordem de dependência, pulando as etapas atualizadas
+    e executando ao mesmo tempo as etapas independentes (ex.: analytics, selection e training após o clustering).
+
+    A assinatura de uma etapa é calculada somente quando as etapas das quais ela depende terminam,
+    de forma que uma etapa reexecutada invalida apenas as etapas que leem as suas saídas.
+
+    Args:
+        targets (Sequence[str], opcional): Etapas alvo (as dependências são incluídas). Se None, todas. Padrão = None.
+        force (bool, opcional): Se True, executa as etapas mesmo se atualizadas. Padrão = False.
+        workers (int, opcional): Quantidade de etapas executadas ao mesmo tempo. Padrão = 2.
+        dry_run (bool, opcional): Se True, apenas lista as etapas que seriam executadas. Padrão = False.
+
+    Returns:
+        Dict[str, str]: Dicionário etapa → situação ('skipped', 'executed' ou 'pending', no dry run).
+    """
+
+    names = upstream(targets or list(STAGES)) 
+
+    graph = dependencies(names) 
+
+    state = load_state(consts.PIPELINE_STATE) 
+
+    status: Dict[str, str] = {} 
+
+    running: Dict[Any, tuple] = {} 
+
+    with ThreadPoolExecutor(max_workers = workers) as executor: 
+
+        while len(status) < len(names): 
+
+            scheduled = False 
+
+            for name in names: 
+
+                if name in status or any(r[0] == name for r in running.values()) or not graph[name] <= set(status): 
+
+                    continue 
+
+                fingerprint = stage_fingerprint(name) 
+
+                stale = force or any(status[d] != 'skipped' for d in graph[name]) or not is_up_to_date(name, fingerprint, state) 
+
+                if not stale: 
+
+                    status[name] = 'skipped' 
+
+                    print(f'- {name}: atualizada') 
+
+                elif dry_run: 
+
+                    status[name] = 'pending' 
+
+                    print(f'- {name}: seria executada') 
+
+                else: 
+
+                    print(f'- {name}: executando') 
+
+                    running[executor.submit(execute, name)] = (name, fingerprint) 
+
+                scheduled = True 
+
+            if scheduled: 
+
+                continue 
+
+            finished, _ = wait(list(running), return_when = FIRST_COMPLETED) 
+
+            for future in finished: 
+
+                name, fingerprint = running.pop(future) 
+
+                seconds = future.result() 
+
+                state[name] = {'fingerprint': fingerprint, 'seconds': seconds, 'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S')} 
+
+                save_state(state, consts.PIPELINE_STATE) 
+
+                status[name] = 'executed' 
+
+                print(f'- {name}: concluída em {seconds:.1f}s') 
+
+    return status 
@@ -0,0 +1,178 @@
+import joblib as jb
+import pandas as pd
+from pyspark.sql import DataFrame
+from pyspark.sql.types import DoubleType, IntegerType, StructField, StructType
+from typing import Any, Iterator, List, Optional
+
+import functions.fn_clustering as fn_clustering
+import functions.fn_models as fn_models
+import functions.fn_storage_pyspark as fn_storage_pyspark
+import params.consts as consts
+
+
+
+def predict(df: DataFrame, model: Any, proba: bool = False, batch_size: Optional[int] = None) -> DataFrame:
+    """
+    Função que aplica um modelo do Scikit-Learn (pipeline carregado com joblib) a um DataFrame
+    do PySpark de forma distribuída, com `mapInPandas`.
+
+    O modelo é enviado por broadcast, sendo desserializado uma vez por worker Python dos executores,
+    e cada partição é pontuada em lotes do Arrow, de forma que o throughput escala com os cores
+    e nós do cluster e não com o processo do driver.
+
+    Args:
+        df (DataFrame): DataFrame com as features esperadas pelo modelo.
+        model (Any): Modelo (ou pipeline) com os métodos `predict` e `predict_proba`.
+        proba (bool, opcional): Se True, adiciona a coluna `Probability` com a probabilidade
+            da classe positiva. Nesse caso, a `Response` é obtida da mesma chamada ao
+            `predict_proba`, sem executar o pipeline duas vezes. Padrão = False.
+        batch_size (int, opcional): Quantidade máxima de linhas por lote do Arrow
+            (`spark.sql.execution.arrow.maxRecordsPerBatch`). Se None, usa a configuração
+            da sessão. Padrão = None.
+
+    Returns:
+        DataFrame: DataFrame de entrada com a coluna `Response` (e `Probability`, se solicitada).
+    """
+
+    spark = df.sparkSession 
+
+    if batch_size is not None: 
+
+        spark.conf.set('spark.sql.execution.arrow.maxRecordsPerBatch', str(batch_size)) 
+
+    model_broadcast = spark.sparkContext.broadcast(model) 
+
+    columns = df.columns 
+
+    fields = [StructField('Response', IntegerType())] 
+
+    if proba: 
+
+        fields.append(StructField('Probability', DoubleType())) 
+
+    def predict_batches(batches: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]: 
+
+        model = model_broadcast.value 
+
+        for batch in batches: 
+
+            if proba: 
+
+                probabilities = model.predict_proba(batch[columns]) 
+
+                batch['Response'] = model.classes_[probabilities.argmax(axis = 1)].astype('int32') 
+
+                batch['Probability'] = probabilities[:, 1] 
+
+            else: 
+
+                batch['Response'] = model.predict(batch[columns]).astype('int32') 
+
+            yield batch 
+
+    return df.mapInPandas(predict_batches, StructType(df.schema.fields + fields)) 
+
+
+
+def write_predictions(df: DataFrame, path: str = consts.DATASET_DEPLOYED_CLASSIFICATION_PYSPARK, partition_by: Optional[List[str]] = None) -> None:
+    """
+    Função que grava as previsões em Parquet particionado.
+
+    Args:
+        df (DataFrame): DataFrame com as previsões.
+        path (str, opcional): Caminho de saída. Padrão = `consts.DATASET_DEPLOYED_CLASSIFICATION_PYSPARK`.
+        partition_by (List[str], opcional): Colunas de particionamento. Se None, usa
+            `consts.DEPLOYED_PARTITION_BY`. Padrão = None.
+    """
+
+    ( 
+
+        df.write 
+
+          .format(consts.STORAGE_FORMAT) 
+
+          .mode('overwrite') 
+
+          .option('compression', consts.STORAGE_COMPRESSION) 
+
+          .partitionBy(*(consts.DEPLOYED_PARTITION_BY if partition_by is None else partition_by)) 
+
+          .save(path) 
+
+    )
+
+
+
+def assign_clusters(df: DataFrame, pipeline: Any, batch_size: Optional[int] = None) -> DataFrame:
+    """
+    Função que atribui os clusters a um DataFrame do PySpark com o pipeline de clusterização
+    já treinado, de forma distribuída com `mapInPandas` (busca vetorizada do centróide mais próximo).
+
+    Args:
+        df (DataFrame): DataFrame com as colunas de entrada do pipeline.
+        pipeline (Any): Pipeline de clusterização treinado, com o K-Means como último passo.
+        batch_size (int, opcional): Quantidade máxima de linhas por lote do Arrow. Se None, usa
+            a configuração da sessão. Padrão = None.
+
+    Returns:
+        DataFrame: DataFrame de entrada com a coluna `Cluster`.
+    """
+
+    spark = df.sparkSession 
+
+    if batch_size is not None: 
+
+        spark.conf.set('spark.sql.execution.arrow.maxRecordsPerBatch', str(batch_size)) 
+
+    pipeline_broadcast = spark.sparkContext.broadcast(pipeline) 
+
+    def assign_batches(batches: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]: 
+
+        pipeline = pipeline_broadcast.value 
+
+        for batch in batches: 
+
+            batch['Cluster'] = fn_clustering.assign_clusters(pipeline, batch) 
+
+            yield batch 
+
+    return df.mapInPandas(assign_batches, StructType(df.schema.fields + [StructField('Cluster', IntegerType())])) 
+
+
+
+def refresh_clusters(df_new: DataFrame, partial_fit: bool = False) -> None:
+    """
+    Função que atualiza a camada `silver_clustered` de forma incremental e apenas por acréscimo
+    (append): somente as linhas novas recebem um cluster, com o pipeline salvo em
+    `consts.MODELS['clustering']`, sem treinar o K-Means novamente sobre a base inteira.
+
+    As linhas novas devem ser informadas pelo chamador (ex.: o lote da última ingestão), de forma
+    que o custo depende apenas do lote e não do histórico das camadas. As camadas silver não têm
+    chave de cliente (o `ID` é removido no notebook 03), então não é possível identificar clientes
+    alterados: para substituí-los, a camada deve ser regravada pelo notebook 06.
+
+    Args:
+        df_new (DataFrame): Linhas novas, com o schema da camada `silver_clean`.
+        partial_fit (bool, opcional): Se True, atualiza antes os centróides com as linhas novas
+            (`fn_clustering.partial_fit_centroids`) e salva o pipeline atualizado. Padrão = False.
+    """
+
+    df_new = df_new.cache() 
+
+    if df_new.isEmpty(): 
+
+        df_new.unpersist() 
+
+        return 
+
+    pipeline = fn_models.load_model('clustering') 
+
+    if partial_fit: 
+
+        fn_clustering.partial_fit_centroids(pipeline, df_new.toPandas()) 
+
+        jb.dump(pipeline, fn_models.artifact_path('clustering')) 
+
+    fn_storage_pyspark.write_layer(assign_clusters(df_new, pipeline), 'silver_clustered', mode = 'append') 
+
+    df_new.unpersist() 
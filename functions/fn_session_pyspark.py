@@ -0,0 +1,141 @@
+import math
+import os
+from typing import Dict, Optional, Sequence
+
+from pyspark.sql import SparkSession
+
+import params.consts as consts
+
+
+
+def data_size_mb(paths: Sequence[str]) -> float:
+    """
+    Função que calcula o tamanho em disco (em MB) dos caminhos de dados informados,
+    somando os arquivos dos diretórios. Caminhos inexistentes são ignorados.
+
+    Args:
+        paths (Sequence[str]): Caminhos de arquivos ou diretórios.
+
+    Returns:
+        float: Tamanho total em MB.
+    """
+
+    total = 0 
+
+    for path in paths: 
+
+        if os.path.isfile(path): 
+
+            total += os.path.getsize(path) 
+
+        elif os.path.isdir(path): 
+
+            total += sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files) 
+
+    return total / 1024 ** 2 
+
+
+
+def shuffle_partitions(size_mb: float, partition_size_mb: int, min_partitions: int, max_partitions: int) -> int:
+    """
+    Função que calcula a quantidade de partições do shuffle a partir do tamanho dos dados,
+    com partições de aproximadamente `partition_size_mb`.
+
+    Args:
+        size_mb (float): Tamanho dos dados em MB.
+        partition_size_mb (int): Tamanho alvo de cada partição em MB.
+        min_partitions (int): Quantidade mínima de partições.
+        max_partitions (int): Quantidade máxima de partições.
+
+    Returns:
+        int: Quantidade de partições.
+    """
+
+    return max(min_partitions, min(max_partitions, math.ceil(size_mb / partition_size_mb))) 
+
+
+
+def profile_configs(profile: str = 'local-dev', inputs: Optional[Sequence[str]] = None) -> Dict[str, str]:
+    """
+    Função que monta as configurações do Spark de um perfil de `consts.SPARK_PROFILES`.
+
+    Todos os perfis habilitam o AQE (coalescência de partições e tratamento de skew nos joins),
+    o Arrow no `toPandas` e no `createDataFrame` (com fallback) e o serializador Kryo. As partições
+    do shuffle são dimensionadas pelo tamanho das entradas, e nos perfis locais a memória do driver
+    é uma fração da memória física da máquina.
+
+    Args:
+        profile (str, opcional): Nome do perfil ('local-dev', 'single-node-batch' ou 'cluster'). Padrão = 'local-dev'.
+        inputs (Sequence[str], opcional): Caminhos lidos pelo job, usados para dimensionar o shuffle.
+            Se None, usa as camadas de `consts.LAYERS`. Padrão = None.
+
+    Returns:
+        Dict[str, str]: Dicionário de configurações do Spark.
+    """
+
+    if profile not in consts.SPARK_PROFILES: 
+
+        raise KeyError(f'Perfil desconhecido: "{profile}". Perfis disponíveis: {list(consts.SPARK_PROFILES)}.') 
+
+    settings = consts.SPARK_PROFILES[profile] 
+
+    cores = os.cpu_count() or 1 
+
+    min_partitions = settings['min_partitions'] or cores 
+
+    size_mb = data_size_mb(list(consts.LAYERS.values()) if inputs is None else inputs) 
+
+    partitions = shuffle_partitions(size_mb, settings['partition_size_mb'], min_partitions, settings['max_partitions']) 
+
+    configs = { 
+        'spark.sql.shuffle.partitions': str(partitions), 
+        'spark.sql.adaptive.enabled': 'true', 
+        'spark.sql.adaptive.coalescePartitions.enabled': 'true', 
+        'spark.sql.adaptive.advisoryPartitionSizeInBytes': f'{settings["partition_size_mb"]}m', 
+        'spark.sql.adaptive.skewJoin.enabled': 'true', 
+        'spark.sql.autoBroadcastJoinThreshold': f'{settings["broadcast_threshold_mb"]}m', 
+        'spark.sql.execution.arrow.pyspark.enabled': 'true', 
+        'spark.sql.execution.arrow.pyspark.fallback.enabled': 'true', 
+        'spark.serializer': 'org.apache.spark.serializer.KryoSerializer', 
+    }
+
+    if settings['master'] is not None: 
+
+        configs['spark.master'] = settings['master'] 
+
+        configs['spark.default.parallelism'] = str(cores) 
+
+    if settings['driver_memory_fraction'] is not None: 
+
+        memory_gb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024 ** 3 
+
+        configs['spark.driver.memory'] = f'{max(1, int(memory_gb * settings["driver_memory_fraction"]))}g' 
+
+    return configs 
+
+
+
+def get_spark(profile: str = 'local-dev', inputs: Optional[Sequence[str]] = None, app_name: str = consts.SPARK_APP_NAME) -> SparkSession:
+    """
+    Função que cria (ou reaproveita) a sessão do Spark com as configurações do perfil.
+
+    As configurações estáticas (ex.: memória do driver e serializador) só têm efeito quando a
+    sessão ainda não existe; as configurações de SQL são aplicadas também à sessão existente.
+
+    Args:
+        profile (str, opcional): Nome do perfil ('local-dev', 'single-node-batch' ou 'cluster'). Padrão = 'local-dev'.
+        inputs (Sequence[str], opcional): Caminhos lidos pelo job, usados para dimensionar o shuffle.
+            Se None, usa as camadas de `consts.LAYERS`. Padrão = None.
+        app_name (str, opcional): Nome da aplicação. Padrão = consts.SPARK_APP_NAME.
+
+    Returns:
+        SparkSession: Sessão do Spark.
+    """
+
+    builder = SparkSession.builder.appName(app_name) 
+
+    for key, value in profile_configs(profile, inputs).items(): 
+
+        builder = builder.config(key, value) 
+
+    return builder.getOrCreate() 
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict
+
+
+
+def path_fingerprint(path: str) -> str:
+    """
+    Função que calcula a assinatura de um caminho de dados (arquivo ou diretório Parquet) a partir
+    do caminho relativo, do tamanho e do mtime de cada arquivo, sem ler o conteúdo.
+
+    Args:
+        path (str): Caminho do arquivo ou diretório.
+
+    Returns:
+        str: Hash SHA-256 dos metadados dos arquivos, ou 'missing' se o caminho não existir.
+    """
+
+    if not os.path.exists(path): 
+
+        return 'missing' 
+
+    files = [path] if os.path.isfile(path) else sorted(os.path.join(root, f) for root, _, names in os.walk(path) for f in names) 
+
+    digest = hashlib.sha256() 
+
+    for file in files: 
+
+        stat = os.stat(file) 
+
+        digest.update(f'{os.path.relpath(file, path)}:{stat.st_size}:{stat.st_mtime_ns};'.encode()) 
+
+    return digest.hexdigest() 
+
+
+
+def code_fingerprint(path: str) -> str:
+    """
+    Função que calcula a assinatura do conteúdo de um arquivo de código. Nos notebooks, só o código
+    das células é considerado, de forma que as saídas gravadas pela execução não invalidam a etapa.
+
+    Args:
+        path (str): Caminho do arquivo `.py` ou `.ipynb`.
+
+    Returns:
+        str: Hash SHA-256 do código.
+    """
+
+    with open(path, 'rb') as file: 
+
+        content = file.read() 
+
+    if path.endswith('.ipynb'): 
+
+        cells = json.loads(content)['cells'] 
+
+        content = json.dumps([''.join(c['source']) for c in cells if c['cell_type'] == 'code']).encode() 
+
+    return hashlib.sha256(content).hexdigest() 
+
+
+
+def load_state(path: str) -> Dict[str, Any]:
+    """
+    Função que lê um estado gravado em JSON (ex.: assinaturas das etapas do pipeline ou dos gráficos).
+
+    Args:
+        path (str): Caminho do estado.
+
+    Returns:
+        Dict[str, Any]: Estado lido, ou um dicionário vazio se o arquivo não existir.
+    """
+
+    if not os.path.exists(path): 
+
+        return {} 
+
+    with open(path) as file: 
+
+        return json.load(file) 
+
+
+
+def save_state(state: Dict[str, Any], path: str) -> None:
+    """
+    Função que grava um estado em JSON de forma atômica (arquivo temporário e `os.replace`).
+
+    Args:
+        state (Dict[str, Any]): Estado a ser gravado.
+        path (str): Caminho do estado.
+    """
+
+    temp = f'{path}.tmp' 
+
+    with open(temp, 'w') as file: 
+
+        json.dump(state, file, indent = 4, sort_keys = True) 
+
+    os.replace(temp, path) 
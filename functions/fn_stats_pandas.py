@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from typing import Dict, List, Tuple
 
 
 
@@ -22,6 +24,61 @@ def describe(df: pd.DataFrame) -> pd.DataFrame:
 
 
 
+def outlier_bounds(df: pd.DataFrame, columns: List[str], whisker_width: float = 1.5) -> Dict[str, Tuple[float, float]]: 
+    """
+    Função que calcula os limites inferior e superior da regra do IQR (Interquartile Range)
+    para várias colunas de um DataFrame Pandas com uma única chamada ao `np.nanquantile`
+    sobre a matriz das colunas.
+
+    Args:
+        df (pd.DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas a serem inspecionadas.
+        whisker_width (float, opcional): Largura do "bigode" (multiplicador do IQR) 
+            usada para definir os limites inferior e superior. Padrão = 1.5.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Dicionário com os limites (inferior, superior) de cada coluna.
+    """
+
+    q1, q3 = np.nanquantile(df[list(columns)].to_numpy(dtype = float), [0.25, 0.75], axis = 0) 
+
+    iqr = q3 - q1 
+
+    return {c: (lower, upper) for c, lower, upper in zip(columns, q1 - whisker_width * iqr, q3 + whisker_width * iqr)} 
+
+
+
+def outlier_mask(df: pd.DataFrame, columns: List[str], whisker_width: float = 1.5) -> Tuple[pd.DataFrame, Dict[str, Tuple[float, float]]]: 
+    """
+    Função que calcula a matriz booleana de outliers de várias colunas de um DataFrame Pandas,
+    com base na regra do IQR (Interquartile Range), comparando a matriz das colunas com os
+    limites de todas as colunas de uma só vez.
+
+    Args:
+        df (pd.DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas a serem inspecionadas.
+        whisker_width (float, opcional): Largura do "bigode" (multiplicador do IQR) 
+            usada para definir os limites inferior e superior. Padrão = 1.5.
+
+    Returns:
+        tuple: Uma tupla contendo a matriz booleana (uma coluna por feature, com o mesmo índice de `df`)
+            e o dicionário com os limites (inferior, superior) usados.
+    """
+
+    columns = list(columns) 
+
+    bounds = outlier_bounds(df, columns, whisker_width) 
+
+    values = df[columns].to_numpy(dtype = float) 
+
+    lower, upper = np.array([bounds[c] for c in columns]).T 
+
+    mask = (values < lower) | (values > upper) 
+
+    return pd.DataFrame(mask, index = df.index, columns = columns), bounds 
+
+
+
 def inspect_outliers(df: pd.DataFrame, column: str, whisker_width: float = 1.5) -> pd.DataFrame: 
     """
     Função que identifica e retorna as linhas de um DataFrame Pandas que contêm
@@ -37,19 +94,39 @@ def inspect_outliers(df: pd.DataFrame, column: str, whisker_width: float = 1.5)
         DataFrame: DataFrame apenas com os outliers inferiores e superiores.
     """
 
-    q1 = df[column].quantile(0.25) 
+    lower_bound, upper_bound = outlier_bounds(df, [column], whisker_width)[column] 
 
-    q3 = df[column].quantile(0.75) 
+    outliers_df = df[(df[column] < lower_bound) | (df[column] > upper_bound)] 
 
-    iqr = q3 - q1 
+    return outliers_df 
 
-    lower_bound = q1 - whisker_width * iqr 
 
-    upper_bound = q3 + whisker_width * iqr 
 
-    outliers_df = df[(df[column] < lower_bound) | (df[column] > upper_bound)] 
+def inspect_outliers_many(df: pd.DataFrame, columns: List[str], whisker_width: float = 1.5, flag: bool = True) -> Tuple[pd.DataFrame, Dict[str, Tuple[float, float]]]: 
+    """
+    Função que identifica os outliers de várias colunas de um DataFrame Pandas, com base
+    na regra do IQR (Interquartile Range), calculando todos os quartis de uma só vez.
 
-    return outliers_df 
+    Args:
+        df (pd.DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas a serem inspecionadas.
+        whisker_width (float, opcional): Largura do "bigode" (multiplicador do IQR) 
+            usada para definir os limites inferior e superior. Padrão = 1.5.
+        flag (bool, opcional): Se True, retorna o DataFrame completo com uma coluna booleana
+            `<coluna>_outlier` por feature. Se False, retorna apenas as linhas com outlier
+            em pelo menos uma das colunas. Padrão = True.
+
+    Returns:
+        tuple: Uma tupla contendo o DataFrame resultante e o dicionário com os limites (inferior, superior) usados.
+    """
+
+    mask, bounds = outlier_mask(df, columns, whisker_width) 
+
+    if flag: 
+
+        return df.assign(**{f'{c}_outlier': mask[c] for c in mask.columns}), bounds 
+
+    return df[mask.to_numpy().any(axis = 1)], bounds 
 
 
 
@@ -67,20 +144,57 @@ def groupby_count(df: pd.DataFrame, column: str, ascending: bool = True) -> pd.D
         DataFrame: DataFrame com o agrupamento da coluna segmentado por percentual e contagem.
     """
 
-    result = ( 
-        
-        df.groupby(column, observed = True)
+    return groupby_count_many(df, [column], ascending)[column] 
+
+
+
+def groupby_count_many(df: pd.DataFrame, columns: List[str], ascending: bool = True) -> Dict[str, pd.DataFrame]: 
+    """
+    Função para agrupar um DataFrame Pandas por várias colunas de forma independente e retornar
+      as contagens percentuais e absolutas de cada uma. As contagens são calculadas com
+      `np.bincount` sobre os códigos das categorias (`cat.codes` nas colunas do tipo category
+      e `pd.factorize` nas demais), sem o custo de um `groupby` por coluna.
+
+    Args:
+        df (pd.DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas para agrupamento.
+        ascending (bool, opcional): Define se o resultado deve ser ordenado em ordem crescente. Padrão = True.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Dicionário com o agrupamento de cada coluna segmentado por percentual e contagem,
+            no mesmo formato de `groupby_count`.
+    """
+
+    results = {} 
+
+    for column in dict.fromkeys(columns): 
+
+        series = df[column] 
+
+        if isinstance(series.dtype, pd.CategoricalDtype): 
+
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories 
+
+        else: 
+
+            codes, uniques = pd.factorize(series, sort = True) 
+
+        counts = np.bincount(codes[codes >= 0], minlength = len(uniques)) 
+
+        observed = np.flatnonzero(counts) 
+
+        if isinstance(series.dtype, pd.CategoricalDtype): 
 
-            .size() 
+            keys = pd.Categorical.from_codes(observed, dtype = series.dtype) 
 
-            .reset_index(name = 'Count') 
+        else: 
 
-            .assign(Percentage  = lambda d: ((d['Count'] / d['Count'].sum()) * 100).round(1))
+            keys = uniques.take(observed) 
 
-            .sort_values(column, ascending = ascending) 
+        result = pd.DataFrame({column: keys, 'Count': counts[observed]}) 
 
-            [[column, 'Percentage', 'Count']] 
+        result['Percentage'] = ((result['Count'] / result['Count'].sum()) * 100).round(1) 
 
-    )
+        results[column] = result.sort_values(column, ascending = ascending)[[column, 'Percentage', 'Count']] 
 
-    return result
\ No newline at end of file
+    return results 
\ No newline at end of file
@@ -1,5 +1,81 @@
-from pyspark.sql import DataFrame
+from pyspark.sql import DataFrame, Window
 from pyspark.sql.functions import *
+from pyspark.sql.types import DoubleType, LongType, StructField, StructType
+from typing import Dict, List, Tuple
+
+
+
+NUMERIC_TYPES = ('tinyint', 'smallint', 'int', 'bigint', 'float', 'double') 
+
+
+
+def _numeric_columns(df: DataFrame) -> List[str]: 
+    """
+    Função que retorna as colunas numéricas de um DataFrame do PySpark.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+
+    Returns:
+        List[str]: Lista com os nomes das colunas numéricas.
+    """
+
+    return [c for c, t in df.dtypes if t in NUMERIC_TYPES or t.startswith('decimal')] 
+
+
+
+def _aggregate_statistics(df: DataFrame, percentiles: Tuple[float, ...] = (), accuracy: int = 10000) -> DataFrame: 
+    """
+    Função que calcula, em uma única agregação, as estatísticas descritivas de todas
+    as colunas numéricas de um DataFrame do PySpark, arredondadas para duas casas decimais.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        percentiles (Tuple[float, ...], opcional): Percentis a serem calculados com
+            `percentile_approx`. Padrão = ().
+        accuracy (int, opcional): Precisão do `percentile_approx`. Padrão = 10000.
+
+    Returns:
+        DataFrame: DataFrame com uma linha por estatística (coluna `summary`) e uma coluna por variável numérica.
+    """
+
+    numeric_cols = _numeric_columns(df) 
+
+    if not numeric_cols: 
+
+        raise ValueError('O DataFrame não possui colunas numéricas.') 
+
+    aggregations = [] 
+
+    for i, c in enumerate(numeric_cols): 
+
+        aggregations += [ 
+            count(col(c)).alias(f'_{i}_count'), 
+            mean(col(c)).alias(f'_{i}_mean'), 
+            stddev(col(c)).alias(f'_{i}_stddev'), 
+            min(col(c)).alias(f'_{i}_min'), 
+            max(col(c)).alias(f'_{i}_max'), 
+        ]
+
+        if percentiles: 
+
+            aggregations.append(percentile_approx(col(c), list(percentiles), accuracy).alias(f'_{i}_percentiles')) 
+
+    statistics = [('count', 'count', None), ('mean', 'mean', None), ('stddev', 'stddev', None), ('min', 'min', None)] 
+
+    statistics += [(f'{p * 100:g}%', 'percentiles', j) for j, p in enumerate(percentiles)] 
+
+    statistics += [('max', 'max', None)] 
+
+    rows = [] 
+
+    for name, suffix, index in statistics: 
+
+        values = [col(f'_{i}_{suffix}') if index is None else col(f'_{i}_{suffix}').getItem(index) for i in range(len(numeric_cols))] 
+
+        rows.append(struct(lit(name).alias('summary'), *[round(v.cast('double'), 2).alias(c) for v, c in zip(values, numeric_cols)])) 
+
+    return df.agg(*aggregations).select(inline(array(*rows))) 
 
 
 
@@ -8,46 +84,77 @@ def describe(df: DataFrame) -> DataFrame:
     Função que gera um describe otimizado de um DataFrame do PySpark,
     arredondando as colunas numéricas para duas casas decimais.
 
+    Todas as estatísticas (count, mean, stddev, min e max) das colunas numéricas são
+    calculadas em uma única agregação, ou seja, em um único job do Spark.
+
     Args:
         df (DataFrame): DataFrame de entrada.
 
     Returns:
         DataFrame: DataFrame com o describe com as colunas numéricas arredondadas.
     """
-    
-    desc_df = df.describe() 
-
-    numeric_cols = [c for c, t in df.dtypes if t in ('int', 'double', 'float', 'bigint')] 
 
-    for i in numeric_cols: 
+    return _aggregate_statistics(df) 
 
-        desc_df = desc_df.withColumn(i, round(col(i).cast('double'), 2)) 
 
-    return desc_df 
 
-
-
-def summary(df: DataFrame) -> DataFrame:
+def summary(df: DataFrame, percentiles: Tuple[float, ...] = (0.25, 0.5, 0.75), accuracy: int = 10000) -> DataFrame:
     """
     Função que gera um summary otimizado de um DataFrame do PySpark,
     arredondando as colunas numéricas para duas casas decimais.
 
+    Todas as estatísticas (count, mean, stddev, min, percentis e max) das colunas numéricas
+    são calculadas em uma única agregação com `percentile_approx`, ou seja, em um único job do Spark.
+
     Args:
         df (DataFrame): DataFrame de entrada.
+        percentiles (Tuple[float, ...], opcional): Percentis a serem calculados. Padrão = (0.25, 0.5, 0.75).
+        accuracy (int, opcional): Precisão do `percentile_approx`. Padrão = 10000.
 
     Returns:
         DataFrame: DataFrame com o summary com as colunas numéricas arredondadas.
     """
 
-    sum_df = df.summary() 
+    return _aggregate_statistics(df, percentiles, accuracy) 
+
+
+
+def outlier_bounds(df: DataFrame, columns: List[str], whisker_width: float = 1.5, relative_error: float = 0.01) -> Dict[str, Tuple[float, float]]: 
+    """
+    Função que calcula os limites inferior e superior da regra do IQR (Interquartile Range)
+    para várias colunas de um DataFrame PySpark com uma única chamada ao `approxQuantile`.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas a serem inspecionadas.
+        whisker_width (float, opcional): Largura do "bigode" (multiplicador do IQR) 
+            usada para definir os limites inferior e superior. Padrão = 1.5.
+        relative_error (float, opcional): Erro relativo do `approxQuantile`. Padrão = 0.01.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Dicionário com os limites (inferior, superior) de cada coluna
+            (`(None, None)` nas colunas sem valores não nulos, que não têm outliers).
+    """
+
+    quantiles = df.approxQuantile(list(columns), [0.25, 0.75], relative_error) 
+
+    bounds = {} 
+
+    for column, values in zip(columns, quantiles): 
 
-    numeric_cols = [c for c, t in df.dtypes if t in ('int', 'double', 'float', 'bigint')] 
+        if len(values) < 2: 
 
-    for i in numeric_cols: 
+            bounds[column] = (None, None) 
 
-        sum_df = sum_df.withColumn(i, round(col(i).cast('double'), 2)) 
+            continue 
 
-    return sum_df 
+        q1, q3 = values 
+
+        iqr = q3 - q1 
+
+        bounds[column] = (q1 - whisker_width * iqr, q3 + whisker_width * iqr) 
+
+    return bounds 
 
 
 
@@ -66,19 +173,44 @@ def inspect_outliers(df: DataFrame, column: str, whisker_width: float = 1.5) ->
         DataFrame: DataFrame apenas com os outliers inferiores e superiores.
     """
 
-    q1 = df.approxQuantile(column, [0.25], 0.01)[0] 
+    lower_bound, upper_bound = outlier_bounds(df, [column], whisker_width)[column] 
 
-    q3 = df.approxQuantile(column, [0.75], 0.01)[0] 
+    outliers_df = df.filter((col(column) < lower_bound) | (col(column) > upper_bound)) 
+ 
+    return outliers_df 
 
-    iqr = q3 - q1 
 
-    lower_bound = q1 - whisker_width * iqr 
 
-    upper_bound = q3 + whisker_width * iqr 
+def inspect_outliers_many(df: DataFrame, columns: List[str], whisker_width: float = 1.5, relative_error: float = 0.01, flag: bool = True) -> Tuple[DataFrame, Dict[str, Tuple[float, float]]]: 
+    """
+    Função que identifica os outliers de várias colunas de um DataFrame PySpark, com base
+    na regra do IQR (Interquartile Range), calculando todos os quartis em uma única passada.
 
-    outliers_df = df.filter((col(column) < lower_bound) | (col(column) > upper_bound)) 
- 
-    return outliers_df 
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas a serem inspecionadas.
+        whisker_width (float, opcional): Largura do "bigode" (multiplicador do IQR) 
+            usada para definir os limites inferior e superior. Padrão = 1.5.
+        relative_error (float, opcional): Erro relativo do `approxQuantile`. Padrão = 0.01.
+        flag (bool, opcional): Se True, retorna o DataFrame completo com uma coluna booleana
+            `<coluna>_outlier` por feature. Se False, retorna apenas as linhas com outlier
+            em pelo menos uma das colunas. Padrão = True.
+
+    Returns:
+        tuple: Uma tupla contendo o DataFrame resultante e o dicionário com os limites (inferior, superior) usados.
+    """
+
+    bounds = outlier_bounds(df, columns, whisker_width, relative_error) 
+
+    flags = {c: coalesce((col(c) < lit(lower)) | (col(c) > lit(upper)), lit(False)) for c, (lower, upper) in bounds.items()} 
+
+    if flag: 
+
+        return df.select('*', *[v.alias(f'{c}_outlier') for c, v in flags.items()]), bounds 
+
+    is_outlier = list(flags.values())[0] if len(flags) == 1 else greatest(*flags.values()) 
+
+    return df.filter(is_outlier), bounds 
 
 
 
@@ -102,7 +234,7 @@ def groupby_count(df: DataFrame, column: str, ascending: bool = True) -> DataFra
 
           .agg(count('*').alias('Count')) 
 
-          .withColumn('Percentage', round((col('Count') / lit(df.count())) * 100, 1)) 
+          .withColumn('Percentage', round((col('Count') / sum('Count').over(Window.partitionBy())) * 100, 1)) 
                     
           .orderBy(col(column).asc() if ascending else col(column).desc()) 
           
@@ -110,4 +242,56 @@ def groupby_count(df: DataFrame, column: str, ascending: bool = True) -> DataFra
     
     )
 
-    return result 
\ No newline at end of file
+    return result
+
+
+
+def groupby_count_many(df: DataFrame, columns: List[str], ascending: bool = True) -> Dict[str, DataFrame]: 
+    """
+    Função para agrupar um DataFrame PySpark por várias colunas de forma independente e retornar
+      as contagens percentuais e absolutas de cada uma, calculadas em uma única passada
+      com `GROUPING SETS`.
+
+    Args:
+        df (DataFrame): DataFrame de entrada.
+        columns (List[str]): Lista de colunas para agrupamento.
+        ascending (bool, opcional): Define se o resultado deve ser ordenado em ordem crescente. Padrão = True.
+
+    Returns:
+        Dict[str, DataFrame]: Dicionário com o agrupamento de cada coluna segmentado por percentual e contagem,
+            no mesmo formato de `groupby_count`.
+    """
+
+    columns = list(dict.fromkeys(columns)) 
+
+    n = len(columns) 
+
+    grouping_ids = {c: (1 << n) - 1 - (1 << (n - 1 - i)) for i, c in enumerate(columns)} 
+
+    result = ( 
+
+        df.groupingSets([[c] for c in columns], *columns) 
+
+          .agg(count('*').alias('Count'), grouping_id().alias('_grouping_id')) 
+
+          .withColumn('Percentage', round((col('Count') / sum('Count').over(Window.partitionBy('_grouping_id'))) * 100, 1)) 
+
+          .orderBy('_grouping_id', *[col(c).asc() if ascending else col(c).desc() for c in columns]) 
+
+          .collect() 
+
+    )
+
+    spark = df.sparkSession 
+
+    tables = {} 
+
+    for c in columns: 
+
+        rows = [(r[c], r['Percentage'], r['Count']) for r in result if r['_grouping_id'] == grouping_ids[c]] 
+
+        schema = StructType([df.schema[c], StructField('Percentage', DoubleType()), StructField('Count', LongType(), False)]) 
+
+        tables[c] = spark.createDataFrame(rows, schema) 
+
+    return tables 
\ No newline at end of file
@@ -0,0 +1,462 @@
+import base64
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+
+import params.consts as consts
+from functions.fn_state import load_state, save_state
+from functions.fn_stats_pyspark import _numeric_columns
+
+
+
+def _partition_key(row: Dict[str, Any], partition_by: Sequence[str]) -> str:
+    """
+    Função que monta a chave de uma partição no formato `coluna=valor/coluna=valor`.
+
+    Args:
+        row (Dict[str, Any]): Valores das colunas de partição.
+        partition_by (Sequence[str]): Colunas de partição.
+
+    Returns:
+        str: Chave da partição, ou '__all__' se não houver colunas de partição.
+    """
+
+    return '/'.join(f'{c}={row[c]}' for c in partition_by) or '__all__' 
+
+
+
+def sketch(df: DataFrame, partition_by: Sequence[str] = (), numeric_columns: Optional[List[str]] = None, categorical_columns: Optional[List[str]] = None, grid_size: int = 101, accuracy: int = 10000) -> Dict[str, Dict[str, Any]]:
+    """
+    Função que calcula os sketches mescláveis de cada partição de um DataFrame do PySpark em dois jobs.
+
+    Para as colunas numéricas: momentos (quantidade, nulos, média, M2, mínimo e máximo), um resumo
+    de quantis com `grid_size` percentis igualmente espaçados (`percentile_approx`) e um sketch
+    HyperLogLog da quantidade de valores distintos (`hll_sketch_agg`). Para as colunas categóricas:
+    as contagens por valor.
+
+    Args:
+        df (DataFrame): DataFrame de entrada (ex.: apenas os dados novos).
+        partition_by (Sequence[str], opcional): Colunas de partição. Padrão = ().
+        numeric_columns (List[str], opcional): Colunas numéricas. Se None, todas. Padrão = None.
+        categorical_columns (List[str], opcional): Colunas categóricas. Se None, as colunas do tipo string e as
+            colunas codificadas como inteiros de `consts.STATS_CATEGORICAL_COLUMNS`. Padrão = None.
+        grid_size (int, opcional): Quantidade de percentis do resumo de quantis. Padrão = 101.
+        accuracy (int, opcional): Precisão do `percentile_approx`. Padrão = 10000.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Dicionário partição → coluna → sketch.
+    """
+
+    partition_by = list(partition_by) 
+
+    numeric_columns = [c for c in _numeric_columns(df) if c not in partition_by] if numeric_columns is None else list(numeric_columns) 
+
+    categorical_columns = [c for c, t in df.dtypes if (t == 'string' or c in consts.STATS_CATEGORICAL_COLUMNS) and c not in partition_by] if categorical_columns is None else list(categorical_columns) 
+
+    grid = np.linspace(0, 1, grid_size).tolist() 
+
+    sketches: Dict[str, Dict[str, Any]] = {} 
+
+    if numeric_columns: 
+
+        aggregations = [F.count(F.lit(1)).alias('_rows')] 
+
+        for i, c in enumerate(numeric_columns): 
+
+            value = F.col(c).cast('double') 
+
+            aggregations += [ 
+                F.count(value).alias(f'_{i}_count'), 
+                F.mean(value).alias(f'_{i}_mean'), 
+                (F.var_pop(value) * F.count(value)).alias(f'_{i}_m2'), 
+                F.min(value).alias(f'_{i}_min'), 
+                F.max(value).alias(f'_{i}_max'), 
+                F.percentile_approx(value, grid, accuracy).alias(f'_{i}_quantiles'), 
+                F.hll_sketch_agg(F.col(c).cast('string')).alias(f'_{i}_hll'), 
+            ]
+
+        for row in df.groupBy(*partition_by).agg(*aggregations).collect(): 
+
+            partition = sketches.setdefault(_partition_key(row, partition_by), {}) 
+
+            for i, c in enumerate(numeric_columns): 
+
+                n = row[f'_{i}_count'] 
+
+                partition[c] = { 
+                    'count': n, 
+                    'nulls': row['_rows'] - n, 
+                    'mean': row[f'_{i}_mean'] or 0.0, 
+                    'm2': row[f'_{i}_m2'] or 0.0, 
+                    'min': row[f'_{i}_min'], 
+                    'max': row[f'_{i}_max'], 
+                    'quantiles': row[f'_{i}_quantiles'], 
+                    'hll': base64.b64encode(row[f'_{i}_hll']).decode() if row[f'_{i}_hll'] is not None else None, 
+                }
+
+    if categorical_columns: 
+
+        entries = [F.struct(F.lit(c).alias('column'), F.to_json(F.struct(F.col(c).alias('v'))).alias('value')) for c in categorical_columns] 
+
+        df_counts = df.select(*partition_by, F.explode(F.array(*entries)).alias('entry')).groupBy(*partition_by, 'entry.column', 'entry.value').count() 
+
+        for row in df_counts.collect(): 
+
+            partition = sketches.setdefault(_partition_key(row, partition_by), {}) 
+
+            partition.setdefault(row['column'], {}).setdefault('counts', []).append([json.loads(row['value']).get('v'), row['count']]) 
+
+    return sketches 
+
+
+
+def update(df: DataFrame, layer: Union[str, Sequence[str]], batch: str, partition_by: Optional[Sequence[str]] = None, path: str = consts.STATS_STORE, **kwargs) -> Dict[str, Any]:
+    """
+    Função que calcula os sketches de um lote de dados novos e os grava no repositório de estatísticas,
+    por camada, partição e lote.
+
+    Gravar novamente o mesmo lote substitui os sketches anteriores dele, de forma que a reexecução
+    de uma carga não duplica as contagens. Os demais lotes são mantidos e mesclados na leitura.
+
+    Quando os mesmos dados são gravados em várias camadas, os sketches são calculados uma única vez
+    por particionamento e guardados em cada camada.
+
+    Args:
+        df (DataFrame): DataFrame com os dados do lote.
+        layer (Union[str, Sequence[str]]): Nome da camada (chave de `consts.LAYERS`) ou lista de camadas.
+        batch (str): Identificador do lote (ex.: data da carga).
+        partition_by (Sequence[str], opcional): Colunas de partição. Se None, usa `consts.LAYERS_PARTITION_BY`. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+        **kwargs: Argumentos adicionais de `sketch`.
+
+    Returns:
+        Dict[str, Any]: Repositório de estatísticas atualizado.
+    """
+
+    layers = [layer] if isinstance(layer, str) else list(layer) 
+
+    store = load_state(path) 
+
+    sketches = {} 
+
+    for name in layers: 
+
+        columns_by = tuple(consts.LAYERS_PARTITION_BY.get(name, []) if partition_by is None else partition_by) 
+
+        if columns_by not in sketches: 
+
+            sketches[columns_by] = sketch(df, columns_by, **kwargs) 
+
+        for partition, columns in sketches[columns_by].items(): 
+
+            store.setdefault(name, {}).setdefault(partition, {})[batch] = columns 
+
+    save_state(store, path) 
+
+    return store 
+
+
+
+def drop(layer: str, partitions: Optional[List[str]] = None, path: str = consts.STATS_STORE) -> Dict[str, Any]:
+    """
+    Função que remove do repositório de estatísticas uma camada inteira ou algumas das suas partições
+    (ex.: quando as partições são regravadas e os sketches precisam ser recalculados).
+
+    Args:
+        layer (str): Nome da camada.
+        partitions (List[str], opcional): Chaves das partições. Se None, remove a camada. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+
+    Returns:
+        Dict[str, Any]: Repositório de estatísticas atualizado.
+    """
+
+    store = load_state(path) 
+
+    if partitions is None: 
+
+        store.pop(layer, None) 
+
+    else: 
+
+        for partition in partitions: 
+
+            store.get(layer, {}).pop(partition, None) 
+
+    save_state(store, path) 
+
+    return store 
+
+
+
+def rebuild(df: DataFrame, layer: Union[str, Sequence[str]], batch: Optional[str] = None, path: str = consts.STATS_STORE, **kwargs) -> Dict[str, Any]:
+    """
+    Função que substitui os sketches de uma ou mais camadas regravadas por completo (modo de
+    sobrescrita): remove os sketches anteriores e grava os dos dados atuais como um único lote.
+
+    Args:
+        df (DataFrame): DataFrame gravado nas camadas.
+        layer (Union[str, Sequence[str]]): Nome da camada ou lista de camadas.
+        batch (str, opcional): Identificador do lote. Se None, usa o horário atual. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+        **kwargs: Argumentos adicionais de `update`.
+
+    Returns:
+        Dict[str, Any]: Repositório de estatísticas atualizado.
+    """
+
+    for name in [layer] if isinstance(layer, str) else layer: 
+
+        drop(name, path = path) 
+
+    return update(df, layer, batch or time.strftime('%Y-%m-%dT%H:%M:%S'), path = path, **kwargs) 
+
+
+
+def _sketches(layer: str, partitions: Optional[List[str]], path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Função que lê os sketches de uma camada, agrupados por coluna, de todas as partições e lotes selecionados.
+
+    Args:
+        layer (str): Nome da camada.
+        partitions (List[str], opcional): Chaves das partições. Se None, todas.
+        path (str): Caminho do repositório de estatísticas.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Dicionário coluna → lista de sketches.
+    """
+
+    store = load_state(path) 
+
+    if layer not in store: 
+
+        raise KeyError(f'Camada sem estatísticas: "{layer}". Camadas disponíveis: {list(store)}.') 
+
+    columns: Dict[str, List[Dict[str, Any]]] = {} 
+
+    for partition, batches in store[layer].items(): 
+
+        if partitions is None or partition in partitions: 
+
+            for sketches in batches.values(): 
+
+                for column, s in sketches.items(): 
+
+                    columns.setdefault(column, []).append(s) 
+
+    return columns 
+
+
+
+def merge_moments(sketches: List[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Função que mescla os momentos de vários sketches com a fórmula de Chan para a média e o M2.
+
+    Args:
+        sketches (List[Dict[str, Any]]): Sketches de uma coluna numérica.
+
+    Returns:
+        Dict[str, float]: Quantidade, nulos, média, desvio padrão amostral, mínimo e máximo.
+    """
+
+    count, nulls, mean, m2 = 0, 0, 0.0, 0.0 
+
+    for s in sketches: 
+
+        nulls += s['nulls'] 
+
+        if s['count']: 
+
+            total = count + s['count'] 
+
+            delta = s['mean'] - mean 
+
+            mean += delta * s['count'] / total 
+
+            m2 += s['m2'] + delta ** 2 * count * s['count'] / total 
+
+            count = total 
+
+    observed = [s for s in sketches if s['count']] 
+
+    return { 
+        'count': count, 
+        'nulls': nulls, 
+        'mean': mean if count else np.nan, 
+        'stddev': np.sqrt(m2 / (count - 1)) if count > 1 else np.nan, 
+        'min': min(s['min'] for s in observed) if observed else np.nan, 
+        'max': max(s['max'] for s in observed) if observed else np.nan, 
+    }
+
+
+
+def merge_quantiles(sketches: List[Dict[str, Any]], percentiles: Sequence[float]) -> List[float]:
+    """
+    Função que estima os percentis de uma coluna a partir dos resumos de quantis de vários sketches.
+
+    Cada resumo define uma função de distribuição acumulada nos valores do resumo; a distribuição
+    mesclada é a média dessas funções ponderada pela quantidade de valores, e cada percentil é o
+    menor valor observado cuja distribuição acumulada alcança o percentil, como no `approxQuantile`.
+    Assim, os resultados são sempre valores observados: nas colunas discretas (ex.: `Kidhome`,
+    `Complain`) os percentis e os limites do IQR coincidem com os de `fn_stats_pyspark`, em vez de
+    valores interpolados entre as categorias. O erro de ordem é de aproximadamente 1 / (grid_size - 1).
+
+    Args:
+        sketches (List[Dict[str, Any]]): Sketches de uma coluna numérica.
+        percentiles (Sequence[float]): Percentis desejados, entre 0 e 1.
+
+    Returns:
+        List[float]: Valores estimados dos percentis.
+    """
+
+    observed = [s for s in sketches if s['count']] 
+
+    if not observed: 
+
+        return [np.nan] * len(percentiles) 
+
+    values = np.unique(np.concatenate([s['quantiles'] for s in observed])) 
+
+    cdfs = [np.clip((np.searchsorted(s['quantiles'], values, side = 'right') - 1) / (len(s['quantiles']) - 1), 0.0, 1.0) for s in observed] 
+
+    cdf = sum(s['count'] * c for s, c in zip(observed, cdfs)) / sum(s['count'] for s in observed) 
+
+    positions = np.searchsorted(cdf, np.asarray(percentiles) - 1e-9, side = 'left') 
+
+    return values[np.minimum(positions, len(values) - 1)].tolist() 
+
+
+
+def summary(layer: str, percentiles: Tuple[float, ...] = (0.25, 0.5, 0.75), partitions: Optional[List[str]] = None, path: str = consts.STATS_STORE) -> pd.DataFrame:
+    """
+    Função que gera o summary das colunas numéricas de uma camada a partir dos sketches armazenados,
+    sem ler os dados, no mesmo formato de `fn_stats_pyspark.summary`.
+
+    Args:
+        layer (str): Nome da camada.
+        percentiles (Tuple[float, ...], opcional): Percentis a serem calculados. Padrão = (0.25, 0.5, 0.75).
+        partitions (List[str], opcional): Chaves das partições. Se None, todas. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha por estatística (coluna `summary`) e uma coluna por variável numérica.
+    """
+
+    columns = {c: s for c, s in _sketches(layer, partitions, path).items() if 'quantiles' in s[0]} 
+
+    statistics = {} 
+
+    for column, sketches in columns.items(): 
+
+        moments = merge_moments(sketches) 
+
+        values = [moments['count'], moments['mean'], moments['stddev'], moments['min']] 
+
+        values += merge_quantiles(sketches, percentiles) + [moments['max']] 
+
+        statistics[column] = values 
+
+    index = ['count', 'mean', 'stddev', 'min'] + [f'{p * 100:g}%' for p in percentiles] + ['max'] 
+
+    return pd.DataFrame(statistics, index = index).round(2).rename_axis('summary').reset_index() 
+
+
+
+def outlier_bounds(layer: str, columns: List[str], whisker_width: float = 1.5, partitions: Optional[List[str]] = None, path: str = consts.STATS_STORE) -> Dict[str, Tuple[float, float]]:
+    """
+    Função que calcula os limites inferior e superior da regra do IQR (Interquartile Range)
+    a partir dos sketches armazenados, no mesmo formato de `fn_stats_pyspark.outlier_bounds`.
+
+    Args:
+        layer (str): Nome da camada.
+        columns (List[str]): Lista de colunas numéricas.
+        whisker_width (float, opcional): Largura do "bigode" (multiplicador do IQR). Padrão = 1.5.
+        partitions (List[str], opcional): Chaves das partições. Se None, todas. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Dicionário com os limites (inferior, superior) de cada coluna.
+    """
+
+    sketches = _sketches(layer, partitions, path) 
+
+    bounds = {} 
+
+    for column in columns: 
+
+        q1, q3 = merge_quantiles(sketches[column], [0.25, 0.75]) 
+
+        iqr = q3 - q1 
+
+        bounds[column] = (q1 - whisker_width * iqr, q3 + whisker_width * iqr) 
+
+    return bounds 
+
+
+
+def groupby_count(layer: str, column: str, ascending: bool = True, partitions: Optional[List[str]] = None, path: str = consts.STATS_STORE) -> pd.DataFrame:
+    """
+    Função que monta a tabela de frequências de uma coluna categórica a partir dos contadores
+    armazenados, no mesmo formato de `fn_stats_pyspark.groupby_count`.
+
+    Args:
+        layer (str): Nome da camada.
+        column (str): Nome da coluna.
+        ascending (bool, opcional): Define se o resultado deve ser ordenado em ordem crescente. Padrão = True.
+        partitions (List[str], opcional): Chaves das partições. Se None, todas. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+
+    Returns:
+        pd.DataFrame: DataFrame com o agrupamento da coluna segmentado por percentual e contagem.
+    """
+
+    counts: Dict[Any, int] = {} 
+
+    for s in _sketches(layer, partitions, path)[column]: 
+
+        for value, n in s['counts']: 
+
+            counts[value] = counts.get(value, 0) + n 
+
+    result = pd.DataFrame(list(counts.items()), columns = [column, 'Count']) 
+
+    result['Percentage'] = ((result['Count'] / result['Count'].sum()) * 100).round(1) 
+
+    return result.sort_values(column, ascending = ascending, na_position = 'first' if ascending else 'last')[[column, 'Percentage', 'Count']].reset_index(drop = True) 
+
+
+
+def distinct_counts(layer: str, columns: Optional[List[str]] = None, partitions: Optional[List[str]] = None, path: str = consts.STATS_STORE, spark: Optional[SparkSession] = None) -> Dict[str, int]:
+    """
+    Função que estima a quantidade de valores distintos das colunas numéricas de uma camada, unindo
+    os sketches HyperLogLog armazenados (`hll_union_agg`). Apenas os sketches são enviados ao Spark.
+
+    Args:
+        layer (str): Nome da camada.
+        columns (List[str], opcional): Lista de colunas numéricas. Se None, todas. Padrão = None.
+        partitions (List[str], opcional): Chaves das partições. Se None, todas. Padrão = None.
+        path (str, opcional): Caminho do repositório de estatísticas. Padrão = consts.STATS_STORE.
+        spark (SparkSession, opcional): Sessão do Spark. Se None, usa a sessão ativa. Padrão = None.
+
+    Returns:
+        Dict[str, int]: Dicionário com a quantidade estimada de valores distintos de cada coluna.
+    """
+
+    spark = spark or SparkSession.getActiveSession() 
+
+    sketches = {c: s for c, s in _sketches(layer, partitions, path).items() if 'hll' in s[0]} 
+
+    columns = list(sketches) if columns is None else columns 
+
+    rows = [(c, bytearray(base64.b64decode(s['hll']))) for c in columns for s in sketches[c] if s['hll'] is not None] 
+
+    df_sketches = spark.createDataFrame(rows, 'column string, sketch binary') 
+
+    result = df_sketches.groupBy('column').agg(F.hll_sketch_estimate(F.hll_union_agg('sketch')).alias('distinct')).collect() 
+
+    return {c: 0 for c in columns} | {r['column']: r['distinct'] for r in result} 
@@ -0,0 +1,211 @@
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql.types import StructType
+from typing import List, Optional, Union
+
+import params.consts as consts
+import params.schemas as schemas
+
+
+
+def _layer_path(name: str) -> str:
+    """
+    Função que retorna o caminho de uma camada do medalhão registrada em `consts.LAYERS`.
+
+    Args:
+        name (str): Nome da camada (ex.: 'raw', 'bronze', 'silver_clean').
+
+    Returns:
+        str: Caminho da camada.
+    """
+
+    if name not in consts.LAYERS: 
+
+        raise KeyError(f'Camada desconhecida: "{name}". Camadas disponíveis: {list(consts.LAYERS)}.') 
+
+    return consts.LAYERS[name] 
+
+
+
+def _registered_schema(path: str) -> StructType: 
+    """
+    Função que retorna o schema registrado em `schemas.SCHEMAS` para o caminho de um dataset.
+
+    Args:
+        path (str): Caminho do dataset (uma das constantes de `consts`).
+
+    Returns:
+        StructType: Schema registrado do dataset.
+    """
+
+    if path not in schemas.SCHEMAS: 
+
+        raise KeyError(f'Nenhum schema registrado (versão {schemas.SCHEMA_VERSION}) para o dataset "{path}".') 
+
+    return schemas.SCHEMAS[path] 
+
+
+
+def validate_schema(actual: StructType, expected: StructType, source: str = 'DataFrame') -> None: 
+    """
+    Função que compara um schema com o schema registrado, levantando um erro
+    caso alguma coluna esteja faltando, sobrando ou com tipo diferente.
+
+    Args:
+        actual (StructType): Schema encontrado.
+        expected (StructType): Schema registrado.
+        source (str, opcional): Descrição da origem usada na mensagem de erro. Padrão = 'DataFrame'.
+    """
+
+    actual_types = {f.name: f.dataType for f in actual.fields} 
+
+    expected_types = {f.name: f.dataType for f in expected.fields} 
+
+    missing = [c for c in expected_types if c not in actual_types] 
+
+    unexpected = [c for c in actual_types if c not in expected_types] 
+
+    mismatched = [f'{c} ({actual_types[c].simpleString()} != {t.simpleString()})' for c, t in expected_types.items() if c in actual_types and actual_types[c] != t] 
+
+    if missing or unexpected or mismatched: 
+
+        raise ValueError( 
+            f'Schema de {source} diverge do registro (versão {schemas.SCHEMA_VERSION}). '
+            f'Faltando: {missing}. Inesperadas: {unexpected}. Tipos divergentes: {mismatched}.'
+        )
+
+
+
+def read_csv(path: str, sep: str = ',', spark: Optional[SparkSession] = None, schema_of: Optional[str] = None) -> DataFrame: 
+    """
+    Função que lê um CSV aplicando o schema registrado em `schemas.SCHEMAS`, sem `inferSchema`.
+
+    Antes da leitura, o cabeçalho do arquivo é comparado com o schema registrado, e a leitura
+    usa o modo `FAILFAST`, de forma que qualquer drift de colunas ou de tipos falha imediatamente
+    em vez de gerar nulos silenciosamente.
+
+    Args:
+        path (str): Caminho do CSV (uma das constantes de `consts`).
+        sep (str, opcional): Separador do CSV. Padrão = ','.
+        spark (SparkSession, opcional): Sessão do Spark. Se None, usa a sessão ativa. Padrão = None.
+        schema_of (str, opcional): Dataset registrado cujo schema é aplicado, para arquivos com o mesmo
+            layout em outro caminho (ex.: dados sintéticos). Se None, usa o schema de `path`. Padrão = None.
+
+    Returns:
+        DataFrame: DataFrame com o schema registrado.
+    """
+
+    spark = spark or SparkSession.getActiveSession() or SparkSession.builder.getOrCreate() 
+
+    schema = _registered_schema(schema_of or path) 
+
+    header = spark.read.text(path).first()[0].lstrip('\ufeff').split(sep) 
+
+    if header != schema.fieldNames(): 
+
+        raise ValueError( 
+            f'Cabeçalho de "{path}" diverge do registro (versão {schemas.SCHEMA_VERSION}). '
+            f'Encontrado: {header}. Esperado: {schema.fieldNames()}.'
+        )
+
+    df = ( 
+
+        spark.read 
+
+             .format('csv') 
+
+             .schema(schema) 
+
+             .option('header', 'true') 
+
+             .option('sep', sep) 
+
+             .option('dateFormat', 'yyyy-MM-dd') 
+
+             .option('mode', 'FAILFAST') 
+
+             .load(path) 
+
+    )
+
+    return df 
+
+
+
+def write_layer(df: DataFrame, name: str, mode: str = 'overwrite', partition_by: Optional[List[str]] = None, compression: Optional[str] = None) -> None:
+    """
+    Função que grava um DataFrame do PySpark em uma camada do medalhão em formato colunar (Parquet),
+    validando antes o seu schema contra o registro de `schemas.SCHEMAS`.
+
+    Diferente do CSV com gzip, o Parquet é divisível entre tasks, guarda o schema no próprio
+    arquivo (dispensando o `inferSchema` na leitura) e permite pushdown de colunas e filtros.
+
+    Args:
+        df (DataFrame): DataFrame a ser gravado.
+        name (str): Nome da camada registrada em `consts.LAYERS`.
+        mode (str, opcional): Modo de gravação do Spark. Padrão = 'overwrite'.
+        partition_by (List[str], opcional): Colunas de particionamento. Se None, usa
+            `consts.LAYERS_PARTITION_BY` da camada. Padrão = None.
+        compression (str, opcional): Codec de compressão (ex.: 'zstd', 'snappy'). Se None,
+            usa `consts.STORAGE_COMPRESSION`. Padrão = None.
+    """
+
+    path = _layer_path(name) 
+
+    validate_schema(df.schema, _registered_schema(path), f'"{name}"') 
+
+    partition_by = consts.LAYERS_PARTITION_BY.get(name, []) if partition_by is None else partition_by 
+
+    writer = ( 
+
+        df.write 
+
+          .format(consts.STORAGE_FORMAT) 
+
+          .mode(mode) 
+
+          .option('compression', compression or consts.STORAGE_COMPRESSION) 
+
+    )
+
+    if partition_by: 
+
+        writer = writer.partitionBy(*partition_by) 
+
+    writer.save(path) 
+
+
+
+def read_layer(name: str, columns: Optional[List[str]] = None, condition: Optional[Union[Column, str]] = None, schema: Optional[StructType] = None, spark: Optional[SparkSession] = None) -> DataFrame:
+    """
+    Função que lê uma camada do medalhão gravada com `write_layer`.
+
+    As colunas e o filtro são aplicados logo após a leitura, para que o Spark os empurre
+    para o leitor do Parquet (column pruning, predicate pushdown e partition pruning).
+
+    Args:
+        name (str): Nome da camada registrada em `consts.LAYERS`.
+        columns (List[str], opcional): Colunas a serem lidas. Se None, lê todas. Padrão = None.
+        condition (Column | str, opcional): Filtro aplicado na leitura. Padrão = None.
+        schema (StructType, opcional): Schema explícito da camada. Se None, usa o schema
+            registrado em `schemas.SCHEMAS`, evitando a inferência a partir dos arquivos. Padrão = None.
+        spark (SparkSession, opcional): Sessão do Spark. Se None, usa a sessão ativa. Padrão = None.
+
+    Returns:
+        DataFrame: DataFrame com a camada lida.
+    """
+
+    spark = spark or SparkSession.getActiveSession() or SparkSession.builder.getOrCreate() 
+
+    path = _layer_path(name) 
+
+    df = spark.read.format(consts.STORAGE_FORMAT).schema(schema or _registered_schema(path)).load(path) 
+
+    if condition is not None: 
+
+        df = df.filter(condition) 
+
+    if columns is not None: 
+
+        df = df.select(*columns) 
+
+    return df 
@@ -11,19 +11,133 @@ DATASET_CLEAN_PYSPARK = '../data/03_silver/dataset_clean_pyspark'
 DATASET_CLUSTERED_PYSPARK = '../data/03_silver/dataset_clustered_pyspark'
 
 # Models
+MODEL_CLUSTERING_PYSPARK_JOBLIB = '../models/model_clustering_pyspark.joblib'
+
 GRID_SEARCH_CLASSIFICATION_PYSPARK_JOBLIB = '../models/grid_search_classification_pyspark.joblib'
 
 MODEL_CLASSIFICATION_PYSPARK_JOBLIB = '../models/model_classification_pyspark.joblib'
 
 MODEL_CLASSIFICATION_PYSPARK_PKL = '../models/model_classification_pyspark.pkl'
 
+MODEL_CLUSTERING_SPARK_ML = '../models/model_clustering_spark_ml'
+
+MODEL_CLASSIFICATION_SPARK_ML = '../models/model_classification_spark_ml'
+
+MODEL_SELECTION_CACHE = '../models/model_selection_cache'
+
+PIPELINE_CACHE = '../models/pipeline_cache'
+
+SEARCH_CLASSIFICATION_REPORT = '../models/search_classification_pyspark.json'
+
+MODELS = {
+    'clustering': MODEL_CLUSTERING_PYSPARK_JOBLIB,
+    'grid_search_classification': GRID_SEARCH_CLASSIFICATION_PYSPARK_JOBLIB,
+    'classification': MODEL_CLASSIFICATION_PYSPARK_JOBLIB,
+}
+
 # Deploy
 DATASET_DEPLOY_CLASSIFICATION = '../deploys/dataset_deploy_classification.csv'
 DATASET_DEPLOYED_CLASSIFICATION = '../deploys/dataset_deployed_classification.csv'
+DATASET_DEPLOYED_CLASSIFICATION_PYSPARK = '../deploys/dataset_deployed_classification_pyspark'
+
+DEPLOYED_PARTITION_BY = ['Response']
+
+# Monitoring
+MONITORING_BASELINE = '../models/monitoring_baseline.json'
+MONITORING_REPORT = '../deploys/monitoring_report.json'
+
+MONITORING_FEATURES = {
+    'Income': 'numeric',
+    'Recency': 'numeric',
+    'MntTotal': 'numeric',
+    'Cluster': 'categorical',
+}
+
+MONITORING_THRESHOLDS = {
+    'psi_warning': 0.1,
+    'psi_drift': 0.25,
+    'ks_alpha': 0.01,
+    'ks_min': 0.05,
+    'null_rate_drift': 0.05,
+    'psi_min_rows': 200,
+}
+
+# Pipeline
+PIPELINE_STATE = '../data/pipeline_state.json'
+
+# Stats
+STATS_STORE = '../data/stats_store.json'
+
+STATS_CATEGORICAL_COLUMNS = ['Kidhome', 'Teenhome', 'Children', 'HasChildren', 'AcceptedCmpTotal', 'HasAcceptedCmp', 'Complain', 'Response', 'Cluster', 'Z_CostContact', 'Z_Revenue']
+
+# Charts
+CHARTS_STATE = '../images/outputs/charts/charts_state.json'
+
+# Benchmarks
+BENCHMARK_DATA = '../data/benchmarks'
+BENCHMARK_BASELINE = '../data/benchmarks/benchmark_baseline.json'
+BENCHMARK_REPORT = '../data/benchmarks/benchmark_report.json'
+
+BENCHMARK_SCALES = {
+    '10k': 10000,
+    '1m': 1000000,
+    '50m': 50000000,
+}
+
+BENCHMARK_MAX_PANDAS_ROWS = 1000000
+BENCHMARK_MAX_TRAINING_ROWS = 100000
+BENCHMARK_TOLERANCE = 0.2
+BENCHMARK_MIN_SECONDS = 0.5
+BENCHMARK_MIN_RSS_MB = 50
 
 # Reports
 EDA_0 = '../reports/eda_0.html'
 EDA_1 = '../reports/eda_1.html'
 
 # Values
-RANDOM_STATE = 42
\ No newline at end of file
+RANDOM_STATE = 42
+
+# Storage
+STORAGE_FORMAT = 'parquet'
+STORAGE_COMPRESSION = 'zstd'
+
+LAYERS = {
+    'raw': DATASET_RAW_PYSPARK,
+    'bronze': DATASET_RAW_COMPRESSED_PYSPARK,
+    'silver_clean': DATASET_CLEAN_PYSPARK,
+    'silver_clustered': DATASET_CLUSTERED_PYSPARK,
+}
+
+LAYERS_PARTITION_BY = {
+    'bronze': ['Dt_Customer_Quarter'],
+}
+
+# Spark
+SPARK_APP_NAME = 'spark'
+
+SPARK_PROFILES = {
+    'local-dev': {
+        'master': 'local[*]',
+        'driver_memory_fraction': 0.5,
+        'partition_size_mb': 64,
+        'min_partitions': None,
+        'max_partitions': 200,
+        'broadcast_threshold_mb': 32,
+    },
+    'single-node-batch': {
+        'master': 'local[*]',
+        'driver_memory_fraction': 0.75,
+        'partition_size_mb': 128,
+        'min_partitions': None,
+        'max_partitions': 2000,
+        'broadcast_threshold_mb': 64,
+    },
+    'cluster': {
+        'master': None,
+        'driver_memory_fraction': None,
+        'partition_size_mb': 128,
+        'min_partitions': 64,
+        'max_partitions': 10000,
+        'broadcast_threshold_mb': 64,
+    },
+}
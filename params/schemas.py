@@ -0,0 +1,131 @@
+from pyspark.sql.types import DateType, DoubleType, IntegerType, LongType, StringType, StructField, StructType
+
+import params.consts as consts
+
+
+
+# Version
+SCHEMA_VERSION = 1
+
+# Data
+DIM_CUSTOMERS_RAW_SCHEMA = StructType([
+    StructField('ID', IntegerType()),
+    StructField('Year_Birth', IntegerType()),
+    StructField('Education', StringType()),
+    StructField('Marital_Status', StringType()),
+    StructField('Income', DoubleType()),
+    StructField('Kidhome', IntegerType()),
+    StructField('Teenhome', IntegerType()),
+    StructField('Dt_Customer', DateType()),
+    StructField('Recency', IntegerType()),
+    StructField('MntWines', IntegerType()),
+    StructField('MntFruits', IntegerType()),
+    StructField('MntMeatProducts', IntegerType()),
+    StructField('MntFishProducts', IntegerType()),
+    StructField('MntSweetProducts', IntegerType()),
+    StructField('MntGoldProds', IntegerType()),
+    StructField('NumDealsPurchases', IntegerType()),
+    StructField('NumWebPurchases', IntegerType()),
+    StructField('NumCatalogPurchases', IntegerType()),
+    StructField('NumStorePurchases', IntegerType()),
+    StructField('NumWebVisitsMonth', IntegerType()),
+    StructField('AcceptedCmp3', IntegerType()),
+    StructField('AcceptedCmp4', IntegerType()),
+    StructField('AcceptedCmp5', IntegerType()),
+    StructField('AcceptedCmp1', IntegerType()),
+    StructField('AcceptedCmp2', IntegerType()),
+    StructField('Complain', IntegerType()),
+    StructField('Z_CostContact', IntegerType()),
+    StructField('Z_Revenue', IntegerType()),
+    StructField('Response', IntegerType()),
+])
+
+DIM_CALENDER_RAW_SCHEMA = StructType([
+    StructField('Data', DateType()),
+    StructField('Ano', IntegerType()),
+    StructField('Mês', IntegerType()),
+    StructField('Nome do Mês', StringType()),
+    StructField('Dia', IntegerType()),
+    StructField('Dia da Semana', StringType()),
+    StructField('Dia Útil', StringType()),
+    StructField('Semana', IntegerType()),
+    StructField('CW', StringType()),
+    StructField('Trimestre', IntegerType()),
+    StructField('Nome do Trimestre', StringType()),
+    StructField('Semestre', IntegerType()),
+    StructField('Nome do Semestre', StringType()),
+    StructField('Início do Mês', DateType()),
+    StructField('Mês/Ano', StringType()),
+    StructField('Mês/Ano Curto', StringType()),
+])
+
+DATASET_RAW_PYSPARK_SCHEMA = StructType(DIM_CUSTOMERS_RAW_SCHEMA.fields + [
+    StructField('Dt_Customer_Month', IntegerType()),
+    StructField('Dt_Customer_Quarter', IntegerType()),
+])
+
+DATASET_RAW_COMPRESSED_PYSPARK_SCHEMA = DATASET_RAW_PYSPARK_SCHEMA
+
+DATASET_CLEAN_PYSPARK_SCHEMA = StructType([
+    StructField('Education', StringType()),
+    StructField('Marital_Status', StringType()),
+    StructField('Children', IntegerType()),
+    StructField('HasChildren', IntegerType()),
+    StructField('Age', IntegerType()),
+    StructField('AgeGroup', StringType()),
+    StructField('Income', DoubleType()),
+    StructField('Recency', IntegerType()),
+    StructField('Complain', IntegerType()),
+    StructField('Dt_Customer_Month', IntegerType()),
+    StructField('Dt_Customer_Quarter', IntegerType()),
+    StructField('Days_Since_Enrolled', IntegerType()),
+    StructField('Years_Since_Enrolled', LongType()),
+    StructField('NumDealsPurchases', IntegerType()),
+    StructField('NumWebVisitsMonth', IntegerType()),
+    StructField('NumTotalPurchases', IntegerType()),
+    StructField('MntRegularProds', IntegerType()),
+    StructField('MntGoldProds', IntegerType()),
+    StructField('MntTotal', IntegerType()),
+    StructField('AcceptedCmpTotal', IntegerType()),
+    StructField('HasAcceptedCmp', IntegerType()),
+    StructField('Response', IntegerType()),
+])
+
+DATASET_CLUSTERED_PYSPARK_SCHEMA = StructType(DATASET_CLEAN_PYSPARK_SCHEMA.fields + [
+    StructField('Cluster', IntegerType()),
+])
+
+# Deploy
+DATASET_DEPLOY_CLASSIFICATION_SCHEMA = StructType([
+    StructField('Education', StringType()),
+    StructField('Marital_Status', StringType()),
+    StructField('Children', IntegerType()),
+    StructField('HasChildren', IntegerType()),
+    StructField('Age', IntegerType()),
+    StructField('AgeGroup', StringType()),
+    StructField('Income', DoubleType()),
+    StructField('Recency', IntegerType()),
+    StructField('Complain', IntegerType()),
+    StructField('Days_Since_Enrolled', IntegerType()),
+    StructField('Years_Since_Enrolled', IntegerType()),
+    StructField('NumDealsPurchases', IntegerType()),
+    StructField('NumWebVisitsMonth', IntegerType()),
+    StructField('NumTotalPurchases', IntegerType()),
+    StructField('MntRegularProds', IntegerType()),
+    StructField('MntGoldProds', IntegerType()),
+    StructField('MntTotal', IntegerType()),
+    StructField('AcceptedCmpTotal', IntegerType()),
+    StructField('HasAcceptedCmp', IntegerType()),
+    StructField('Cluster', IntegerType()),
+])
+
+# Registry
+SCHEMAS = {
+    consts.DIM_CUSTOMERS_RAW: DIM_CUSTOMERS_RAW_SCHEMA,
+    consts.DIM_CALENDER_RAW: DIM_CALENDER_RAW_SCHEMA,
+    consts.DATASET_RAW_PYSPARK: DATASET_RAW_PYSPARK_SCHEMA,
+    consts.DATASET_RAW_COMPRESSED_PYSPARK: DATASET_RAW_COMPRESSED_PYSPARK_SCHEMA,
+    consts.DATASET_CLEAN_PYSPARK: DATASET_CLEAN_PYSPARK_SCHEMA,
+    consts.DATASET_CLUSTERED_PYSPARK: DATASET_CLUSTERED_PYSPARK_SCHEMA,
+    consts.DATASET_DEPLOY_CLASSIFICATION: DATASET_DEPLOY_CLASSIFICATION_SCHEMA,
+}
@@ -0,0 +1,72 @@
+import params.consts as consts
+
+# Stages
+# Cada etapa declara o que executa (notebook ou script), os arquivos de código dos quais depende,
+# as constantes de `params/consts.py` que usa e os caminhos de entrada e saída. As dependências
+# entre as etapas são deduzidas dos caminhos: uma etapa depende das etapas que gravam as suas entradas.
+STAGES = {
+    'sourcing': {
+        'notebook': '../notebooks/01_ps_data_sourcing.ipynb',
+        'code': ['../functions/fn_ingestion_pyspark.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'LAYERS_PARTITION_BY', 'STORAGE_FORMAT', 'STORAGE_COMPRESSION', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DIM_CUSTOMERS_RAW, consts.DIM_CALENDER_RAW],
+        'outputs': [consts.DATASET_RAW_PYSPARK, consts.DATASET_RAW_COMPRESSED_PYSPARK],
+    },
+    'understanding': {
+        'notebook': '../notebooks/02_ps_data_understanding.ipynb',
+        'code': ['../functions/fn_charts_pandas.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DATASET_RAW_COMPRESSED_PYSPARK],
+        'outputs': [],
+    },
+    'processing': {
+        'notebook': '../notebooks/03_ps_data_processing.ipynb',
+        'code': ['../functions/fn_charts_batch.py', '../functions/fn_charts_pandas.py', '../functions/fn_charts_pyspark.py', '../functions/fn_features.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_pyspark.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'LAYERS_PARTITION_BY', 'STORAGE_FORMAT', 'STORAGE_COMPRESSION', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DATASET_RAW_COMPRESSED_PYSPARK],
+        'outputs': [consts.DATASET_CLEAN_PYSPARK],
+    },
+    'clustering': {
+        'notebook': '../notebooks/06_ps_model_clustering_training.ipynb',
+        'code': ['../functions/fn_charts_pandas.py', '../functions/fn_charts_pyspark.py', '../functions/fn_clustering.py', '../functions/fn_ml_pyspark.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_pyspark.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'STORAGE_FORMAT', 'STORAGE_COMPRESSION', 'RANDOM_STATE', 'MODEL_CLUSTERING_PYSPARK_JOBLIB', 'MODEL_CLUSTERING_SPARK_ML', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DATASET_CLEAN_PYSPARK],
+        'outputs': [consts.DATASET_CLUSTERED_PYSPARK, consts.MODEL_CLUSTERING_PYSPARK_JOBLIB, consts.MODEL_CLUSTERING_SPARK_ML],
+    },
+    'analytics': {
+        'notebook': '../notebooks/05_ps_analytics.ipynb',
+        'code': ['../functions/fn_charts_pandas.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DATASET_CLUSTERED_PYSPARK],
+        'outputs': [],
+    },
+    'selection': {
+        'notebook': '../notebooks/07_ps_model_classification_selection.ipynb',
+        'code': ['../functions/fn_charts_pandas.py', '../functions/fn_model_selection.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'RANDOM_STATE', 'MODEL_SELECTION_CACHE', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DATASET_CLUSTERED_PYSPARK],
+        'outputs': [],
+    },
+    'training': {
+        'notebook': '../notebooks/08_ps_model_classification_training.ipynb',
+        'code': ['../functions/fn_charts_pandas.py', '../functions/fn_ml_pyspark.py', '../functions/fn_model_selection.py', '../functions/fn_monitoring.py', '../functions/fn_session_pyspark.py', '../functions/fn_state.py', '../functions/fn_stats_store_pyspark.py', '../functions/fn_storage_pyspark.py', '../params/schemas.py'],
+        'params': ['LAYERS', 'RANDOM_STATE', 'PIPELINE_CACHE', 'GRID_SEARCH_CLASSIFICATION_PYSPARK_JOBLIB', 'MODEL_CLASSIFICATION_PYSPARK_JOBLIB', 'MODEL_CLASSIFICATION_PYSPARK_PKL', 'MODEL_CLASSIFICATION_SPARK_ML', 'SEARCH_CLASSIFICATION_REPORT', 'MONITORING_BASELINE', 'MONITORING_FEATURES', 'SPARK_APP_NAME', 'SPARK_PROFILES', 'STATS_STORE', 'STATS_CATEGORICAL_COLUMNS'],
+        'inputs': [consts.DATASET_CLUSTERED_PYSPARK],
+        'outputs': [consts.GRID_SEARCH_CLASSIFICATION_PYSPARK_JOBLIB, consts.MODEL_CLASSIFICATION_PYSPARK_JOBLIB, consts.MODEL_CLASSIFICATION_PYSPARK_PKL, consts.MODEL_CLASSIFICATION_SPARK_ML, consts.SEARCH_CLASSIFICATION_REPORT, consts.MONITORING_BASELINE],
+    },
+    'inspection': {
+        'notebook': '../notebooks/09_ps_deployment.ipynb',
+        'code': [],
+        'params': ['GRID_SEARCH_CLASSIFICATION_PYSPARK_JOBLIB', 'MODEL_CLASSIFICATION_PYSPARK_JOBLIB'],
+        'inputs': [consts.GRID_SEARCH_CLASSIFICATION_PYSPARK_JOBLIB, consts.MODEL_CLASSIFICATION_PYSPARK_JOBLIB],
+        'outputs': [],
+    },
+    'deployment': {
+        'script': '../deploys/classification_python.py',
+        'args': ['--mode', 'pandas'],
+        'code': ['../functions/fn_features.py', '../functions/fn_models.py', '../functions/fn_monitoring.py'],
+        'params': ['MODELS', 'DATASET_DEPLOY_CLASSIFICATION', 'DATASET_DEPLOYED_CLASSIFICATION', 'MONITORING_THRESHOLDS'],
+        'inputs': [consts.MODEL_CLASSIFICATION_PYSPARK_JOBLIB, consts.DATASET_DEPLOY_CLASSIFICATION, consts.MONITORING_BASELINE],
+        'outputs': [consts.DATASET_DEPLOYED_CLASSIFICATION, consts.MONITORING_REPORT],
+    },
+}